@@ -117,18 +117,18 @@ zgebal: _function_gebal[np.complex128, np.float64] = ...
 
 # (a) -> (r, c, rowcnd, colcnd, amax, info)
 @type_check_only
-class _function_geequ[ST: np.generic, RT: np.generic](Protocol):
+class _function_geequ_geequb[ST: np.generic, RT: np.generic](Protocol):
     def __call__(self, /, a: onp.Array2D[ST]) -> tuple[onp.Array1D[RT], onp.Array1D[RT], float, float, float, _info]: ...
 
-sgeequ: _function_geequ[np.float32, np.float32] = ...
-dgeequ: _function_geequ[np.float64, np.float64] = ...
-cgeequ: _function_geequ[np.complex64, np.float32] = ...
-zgeequ: _function_geequ[np.complex128, np.float64] = ...
+sgeequ: _function_geequ_geequb[np.float32, np.float32] = ...
+dgeequ: _function_geequ_geequb[np.float64, np.float64] = ...
+cgeequ: _function_geequ_geequb[np.complex64, np.float32] = ...
+zgeequ: _function_geequ_geequb[np.complex128, np.float64] = ...
 
-sgeequb: _function_geequ[np.float32, np.float32] = ...
-dgeequb: _function_geequ[np.float64, np.float64] = ...
-cgeequb: _function_geequ[np.complex64, np.float32] = ...
-zgeequb: _function_geequ[np.complex128, np.float64] = ...
+sgeequb: _function_geequ_geequb[np.float32, np.float32] = ...
+dgeequb: _function_geequ_geequb[np.float64, np.float64] = ...
+cgeequb: _function_geequ_geequb[np.complex64, np.float32] = ...
+zgeequb: _function_geequ_geequb[np.complex128, np.float64] = ...
 
 # (sselect, a, [compute_v, sort_t, lwork, sselect_extra_args, overwrite_a]) -> (t, sdim, wr, wi, vs, work, info)
 @type_check_only
@@ -540,13 +540,13 @@ zgeqrf: _function_geqrf[np.complex128] = ...
 
 # (m, n) -> (work, info)
 @type_check_only
-class _function_geqrf_lwork[WorkT](Protocol):
+class _function_geqrf_geqrfp_tzrzf_lwork[WorkT](Protocol):
     def __call__(self, /, m: int, n: int) -> tuple[WorkT, _info]: ...
 
-sgeqrf_lwork: _function_geqrf_lwork[float] = ...
-dgeqrf_lwork: _function_geqrf_lwork[float] = ...
-cgeqrf_lwork: _function_geqrf_lwork[complex] = ...
-zgeqrf_lwork: _function_geqrf_lwork[complex] = ...
+sgeqrf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[float] = ...
+dgeqrf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[float] = ...
+cgeqrf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[complex] = ...
+zgeqrf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[complex] = ...
 
 # (a, [lwork, overwrite_a]) -> (qr, tau, info)
 @type_check_only
@@ -566,14 +566,10 @@ cgeqrfp: _function_geqrfp[np.complex64] = ...
 zgeqrfp: _function_geqrfp[np.complex128] = ...
 
 # (m, n) -> (work, info)
-@type_check_only
-class _function_geqrfp_lwork[WorkT](Protocol):
-    def __call__(self, /, m: int, n: int) -> tuple[WorkT, _info]: ...
-
-sgeqrfp_lwork: _function_geqrfp_lwork[float] = ...
-dgeqrfp_lwork: _function_geqrfp_lwork[float] = ...
-cgeqrfp_lwork: _function_geqrfp_lwork[complex] = ...
-zgeqrfp_lwork: _function_geqrfp_lwork[complex] = ...
+sgeqrfp_lwork: _function_geqrf_geqrfp_tzrzf_lwork[float] = ...
+dgeqrfp_lwork: _function_geqrf_geqrfp_tzrzf_lwork[float] = ...
+cgeqrfp_lwork: _function_geqrf_geqrfp_tzrzf_lwork[complex] = ...
+zgeqrfp_lwork: _function_geqrf_geqrfp_tzrzf_lwork[complex] = ...
 
 # (nb, a, [overwrite_a]) -> (a, t, info)
 @type_check_only
@@ -651,13 +647,13 @@ zgesdd: _function_gesdd_cz[np.complex128, np.float64] = ...
 
 # (m, n, [compute_uv, full_matrices]) -> (work, info)
 @type_check_only
-class _function_gesdd_lwork[WorkT](Protocol):
+class _function_gesdd_gesvd_lwork[WorkT](Protocol):
     def __call__(self, /, m: int, n: int, *, compute_uv: int = 1, full_matrices: int = 1) -> tuple[WorkT, _info]: ...
 
-sgesdd_lwork: _function_gesdd_lwork[float] = ...
-dgesdd_lwork: _function_gesdd_lwork[float] = ...
-cgesdd_lwork: _function_gesdd_lwork[complex] = ...
-zgesdd_lwork: _function_gesdd_lwork[complex] = ...
+sgesdd_lwork: _function_gesdd_gesvd_lwork[float] = ...
+dgesdd_lwork: _function_gesdd_gesvd_lwork[float] = ...
+cgesdd_lwork: _function_gesdd_gesvd_lwork[complex] = ...
+zgesdd_lwork: _function_gesdd_gesvd_lwork[complex] = ...
 
 # (a, b, [overwrite_a, overwrite_b]) -> (lu, piv, x, info)
 @type_check_only
@@ -705,14 +701,10 @@ cgesvd: _function_gesvd_cz[np.complex64, np.float32] = ...
 zgesvd: _function_gesvd_cz[np.complex128, np.float64] = ...
 
 # (m, n, [compute_uv, full_matrices]) -> (work, info)
-@type_check_only
-class _function_gesvd_lwork[WorkT](Protocol):
-    def __call__(self, /, m: int, n: int, *, compute_uv: int = 1, full_matrices: int = 1) -> tuple[WorkT, _info]: ...
-
-sgesvd_lwork: _function_gesvd_lwork[float] = ...
-dgesvd_lwork: _function_gesvd_lwork[float] = ...
-cgesvd_lwork: _function_gesvd_lwork[complex] = ...
-zgesvd_lwork: _function_gesvd_lwork[complex] = ...
+sgesvd_lwork: _function_gesdd_gesvd_lwork[float] = ...
+dgesvd_lwork: _function_gesdd_gesvd_lwork[float] = ...
+cgesvd_lwork: _function_gesdd_gesvd_lwork[complex] = ...
+zgesvd_lwork: _function_gesdd_gesvd_lwork[complex] = ...
 
 # (a, b, [fact, trans, af, ipiv, equed, r, c, ...]) -> (as, lu, ipiv, equed, rs, cs, bs, x, rcond, ferr, berr, info)
 @type_check_only
@@ -1185,21 +1177,21 @@ zhbevx: _function_hbevx[np.complex128, np.float64] = ...
 
 # (a, ipiv, anorm, [lower]) -> (rcond, info)
 @type_check_only
-class _function_hecon[ST: np.generic](Protocol):
+class _function_hecon_sycon[ST: np.generic](Protocol):
     def __call__(
         self, /, a: onp.Array2D[ST], ipiv: onp.Array1D[np.int32], anorm: float, *, lower: int = 0
     ) -> tuple[_rcond, _info]: ...
 
-checon: _function_hecon[np.complex64] = ...
-zhecon: _function_hecon[np.complex128] = ...
+checon: _function_hecon_sycon[np.complex64] = ...
+zhecon: _function_hecon_sycon[np.complex128] = ...
 
 # (a, [lower]) -> (s, scond, amax, info)
 @type_check_only
-class _function_heequb[CT: np.generic, RT: np.generic](Protocol):
+class _function_heequb_syequb[CT: np.generic, RT: np.generic](Protocol):
     def __call__(self, /, a: onp.Array2D[CT], *, lower: int = 0) -> tuple[onp.Array1D[RT], float, float, _info]: ...
 
-cheequb: _function_heequb[np.complex64, np.float32] = ...
-zheequb: _function_heequb[np.complex128, np.float64] = ...
+cheequb: _function_heequb_syequb[np.complex64, np.float32] = ...
+zheequb: _function_heequb_syequb[np.complex128, np.float64] = ...
 
 # (a, [compute_v, lower, lwork, overwrite_a]) -> (w, v, info)
 @type_check_only
@@ -1220,11 +1212,11 @@ zheev: _function_heev[np.complex128, np.float64] = ...
 
 # (n, [lower]) -> (work, info)
 @type_check_only
-class _function_heev_lwork(Protocol):
+class _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork(Protocol):
     def __call__(self, /, n: int, *, lower: int = 0) -> tuple[complex, _info]: ...
 
-cheev_lwork: _function_heev_lwork = ...
-zheev_lwork: _function_heev_lwork = ...
+cheev_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
+zheev_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
 
 # (a, [compute_v, lower, lwork, liwork, lrwork, overwrite_a]) -> (w, v, info)
 @type_check_only
@@ -1310,22 +1302,18 @@ cheevx: _function_heevx[np.complex64, np.float32] = ...
 zheevx: _function_heevx[np.complex128, np.float64] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_heevx_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[complex, _info]: ...
-
-cheevx_lwork: _function_heevx_lwork = ...
-zheevx_lwork: _function_heevx_lwork = ...
+cheevx_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
+zheevx_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
 
 # (a, b, [itype, lower, overwrite_a]) -> (c, info)
 @type_check_only
-class _function_hegst[ST: np.generic](Protocol):
+class _function_hegst_sygst[ST: np.generic](Protocol):
     def __call__(
         self, /, a: onp.Array2D[ST], b: onp.Array2D[ST], *, itype: int = 1, lower: int = 0, overwrite_a: int = 0
     ) -> tuple[onp.Array2D[ST], _info]: ...
 
-chegst: _function_hegst[np.complex64] = ...
-zhegst: _function_hegst[np.complex128] = ...
+chegst: _function_hegst_sygst[np.complex64] = ...
+zhegst: _function_hegst_sygst[np.complex128] = ...
 
 # (a, b, [itype, jobz, uplo, lwork, overwrite_a, overwrite_b]) -> (w, v, info)
 @type_check_only
@@ -1349,11 +1337,11 @@ zhegv: _function_hegv[np.complex128, np.float64] = ...
 
 # (n, [uplo]) -> (work, info)
 @type_check_only
-class _function_hegv_lwork(Protocol):
+class _function_hegv_hegvx_lwork(Protocol):
     def __call__(self, /, n: int, *, uplo: str | bytes = "L") -> tuple[complex, _info]: ...
 
-chegv_lwork: _function_hegv_lwork = ...
-zhegv_lwork: _function_hegv_lwork = ...
+chegv_lwork: _function_hegv_hegvx_lwork = ...
+zhegv_lwork: _function_hegv_hegvx_lwork = ...
 
 # (a, b, [itype, jobz, uplo, lwork, lrwork, liwork, overwrite_a, overwrite_b]) -> (w, v, info)
 @type_check_only
@@ -1404,16 +1392,12 @@ chegvx: _function_hegvx[np.complex64, np.float32] = ...
 zhegvx: _function_hegvx[np.complex128, np.float64] = ...
 
 # (n, [uplo]) -> (work, info)
-@type_check_only
-class _function_hegvx_lwork(Protocol):
-    def __call__(self, /, n: int, *, uplo: str | bytes = "L") -> tuple[complex, _info]: ...
-
-chegvx_lwork: _function_hegvx_lwork = ...
-zhegvx_lwork: _function_hegvx_lwork = ...
+chegvx_lwork: _function_hegv_hegvx_lwork = ...
+zhegvx_lwork: _function_hegv_hegvx_lwork = ...
 
 # (a, b, [lwork, lower, overwrite_a, overwrite_b]) -> (uduh, ipiv, x, info)
 @type_check_only
-class _function_hesv[ST: np.generic](Protocol):
+class _function_hesv_sysv[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1426,16 +1410,12 @@ class _function_hesv[ST: np.generic](Protocol):
         overwrite_b: int = 0,
     ) -> tuple[onp.Array2D[ST], onp.Array1D[np.int32], onp.Array2D[ST], _info]: ...
 
-chesv: _function_hesv[np.complex64] = ...
-zhesv: _function_hesv[np.complex128] = ...
+chesv: _function_hesv_sysv[np.complex64] = ...
+zhesv: _function_hesv_sysv[np.complex128] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_hesv_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[complex, _info]: ...
-
-chesv_lwork: _function_hesv_lwork = ...
-zhesv_lwork: _function_hesv_lwork = ...
+chesv_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
+zhesv_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
 
 # (a, b, [af, ipiv, lwork, factored, lower, overwrite_a, overwrite_b]) -> (uduh, ipiv, x, rcond, ferr, berr, info)
 @type_check_only
@@ -1459,12 +1439,8 @@ chesvx: _function_hesvx[np.complex64, np.float32] = ...
 zhesvx: _function_hesvx[np.complex128, np.float64] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_hesvx_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[complex, _info]: ...
-
-chesvx_lwork: _function_hesvx_lwork = ...
-zhesvx_lwork: _function_hesvx_lwork = ...
+chesvx_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
+zhesvx_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
 
 # (a, [lower, lwork, overwrite_a]) -> (c, d, e, tau, info)
 @type_check_only
@@ -1483,16 +1459,12 @@ chetrd: _function_hetrd[np.complex64, np.float32] = ...
 zhetrd: _function_hetrd[np.complex128, np.float64] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_hetrd_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[complex, _info]: ...
-
-chetrd_lwork: _function_hetrd_lwork = ...
-zhetrd_lwork: _function_hetrd_lwork = ...
+chetrd_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
+zhetrd_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
 
 # (a, [lower, lwork, overwrite_a]) -> (ldu, ipiv, info)
 @type_check_only
-class _function_hetrf[ST: np.generic](Protocol):
+class _function_hetrf_sytrf[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1503,40 +1475,36 @@ class _function_hetrf[ST: np.generic](Protocol):
         overwrite_a: int = 0,
     ) -> tuple[onp.Array2D[ST], onp.Array1D[np.int32], _info]: ...
 
-chetrf: _function_hetrf[np.complex64] = ...
-zhetrf: _function_hetrf[np.complex128] = ...
+chetrf: _function_hetrf_sytrf[np.complex64] = ...
+zhetrf: _function_hetrf_sytrf[np.complex128] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_hetrf_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[complex, _info]: ...
-
-chetrf_lwork: _function_hetrf_lwork = ...
-zhetrf_lwork: _function_hetrf_lwork = ...
+chetrf_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
+zhetrf_lwork: _function_heev_heevx_hesv_hesvx_hetrd_hetrf_lwork = ...
 
 # (a, ipiv, [lower, overwrite_a]) -> (inv_a, info)
 @type_check_only
-class _function_hetri[ST: np.generic](Protocol):
+class _function_hetri_sytri[ST: np.generic](Protocol):
     def __call__(
         self, /, a: onp.Array2D[ST], ipiv: onp.Array1D[np.int32], *, lower: int = 0, overwrite_a: int = 0
     ) -> tuple[onp.Array2D[ST], _info]: ...
 
-chetri: _function_hetri[np.complex64] = ...
-zhetri: _function_hetri[np.complex128] = ...
+chetri: _function_hetri_sytri[np.complex64] = ...
+zhetri: _function_hetri_sytri[np.complex128] = ...
 
 # (a, ipiv, b, [lower, overwrite_b]) -> (x, info)
 @type_check_only
-class _function_hetrs[ST: np.generic](Protocol):
+class _function_hetrs_sytrs[ST: np.generic](Protocol):
     def __call__(
         self, /, a: onp.Array2D[ST], ipiv: onp.Array1D[np.int32], b: onp.Array2D[ST], *, lower: int = 0, overwrite_b: int = 0
     ) -> tuple[onp.Array2D[ST], _info]: ...
 
-chetrs: _function_hetrs[np.complex64] = ...
-zhetrs: _function_hetrs[np.complex128] = ...
+chetrs: _function_hetrs_sytrs[np.complex64] = ...
+zhetrs: _function_hetrs_sytrs[np.complex128] = ...
 
 # (n, k, alpha, a, beta, c, [transr, uplo, trans, overwrite_c]) -> cout
 @type_check_only
-class _function_hfrk[ST: np.generic](Protocol):
+class _function_hfrk_sfrk[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1553,8 +1521,8 @@ class _function_hfrk[ST: np.generic](Protocol):
         overwrite_c: int = 0,
     ) -> onp.Array1D[ST]: ...
 
-chfrk: _function_hfrk[np.complex64] = ...
-zhfrk: _function_hfrk[np.complex128] = ...
+chfrk: _function_hfrk_sfrk[np.complex64] = ...
+zhfrk: _function_hfrk_sfrk[np.complex128] = ...
 
 # (cmach) -> x
 @type_check_only
@@ -1681,13 +1649,13 @@ zlaswp: _function_laswp[np.complex128] = ...
 
 # (c, [lower, overwrite_c]) -> (a, info)
 @type_check_only
-class _function_lauum[ST: np.generic](Protocol):
+class _function_lauum_potri[ST: np.generic](Protocol):
     def __call__(self, /, c: onp.Array2D[ST], *, lower: int = 0, overwrite_c: int = 0) -> tuple[onp.Array2D[ST], _info]: ...
 
-slauum: _function_lauum[np.float32] = ...
-dlauum: _function_lauum[np.float64] = ...
-clauum: _function_lauum[np.complex64] = ...
-zlauum: _function_lauum[np.complex128] = ...
+slauum: _function_lauum_potri[np.float32] = ...
+dlauum: _function_lauum_potri[np.float64] = ...
+clauum: _function_lauum_potri[np.complex64] = ...
+zlauum: _function_lauum_potri[np.complex128] = ...
 
 # (x11, x12, x21, x22, [...]) -> (cs11, cs12, cs21, cs22, theta, u1, u2, v1t, v2t, info)
 @type_check_only
@@ -1737,7 +1705,7 @@ dorcsd_lwork: _function_orcsd_lwork = ...
 
 # (a, tau, [lo, hi, lwork, overwrite_a]) -> (ht, info)
 @type_check_only
-class _function_orghr[ST: np.generic](Protocol):
+class _function_orghr_unghr[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1750,8 +1718,8 @@ class _function_orghr[ST: np.generic](Protocol):
         overwrite_a: int = 0,
     ) -> tuple[onp.Array2D[ST], _info]: ...
 
-sorghr: _function_orghr[np.float32] = ...
-dorghr: _function_orghr[np.float64] = ...
+sorghr: _function_orghr_unghr[np.float32] = ...
+dorghr: _function_orghr_unghr[np.float64] = ...
 
 # (n, [lo, hi]) -> (work, info)
 @type_check_only
@@ -1770,7 +1738,7 @@ dorghr_lwork: _function_orghr_lwork = ...
 
 # (a, tau, [lwork, overwrite_a]) -> (q, work, info)
 @type_check_only
-class _function_orgqr[ST: np.generic](Protocol):
+class _function_orgqr_ungqr[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1781,11 +1749,11 @@ class _function_orgqr[ST: np.generic](Protocol):
         overwrite_a: int = 0,
     ) -> tuple[onp.Array2D[ST], onp.Array1D[ST], _info]: ...
 
-sorgqr: _function_orgqr[np.float32] = ...
-dorgqr: _function_orgqr[np.float64] = ...
+sorgqr: _function_orgqr_ungqr[np.float32] = ...
+dorgqr: _function_orgqr_ungqr[np.float64] = ...
 
 @type_check_only
-class _function_orgrq[ST: np.generic](Protocol):
+class _function_orgrq_ungrq[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1796,12 +1764,12 @@ class _function_orgrq[ST: np.generic](Protocol):
         overwrite_a: int = 0,
     ) -> tuple[onp.Array2D[ST], onp.Array1D[ST], _info]: ...
 
-sorgrq: _function_orgrq[np.float32] = ...
-dorgrq: _function_orgrq[np.float64] = ...
+sorgrq: _function_orgrq_ungrq[np.float32] = ...
+dorgrq: _function_orgrq_ungrq[np.float64] = ...
 
 # (side, trans, a, tau, c, lwork, [overwrite_c]) -> (cq, work, info)
 @type_check_only
-class _function_ormqr[ST: np.generic](Protocol):
+class _function_ormqr_unmqr[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1815,12 +1783,12 @@ class _function_ormqr[ST: np.generic](Protocol):
         overwrite_c: int = 0,
     ) -> tuple[onp.Array2D[ST], onp.Array1D[ST], _info]: ...
 
-sormqr: _function_ormqr[np.float32] = ...
-dormqr: _function_ormqr[np.float64] = ...
+sormqr: _function_ormqr_unmqr[np.float32] = ...
+dormqr: _function_ormqr_unmqr[np.float64] = ...
 
 # (a, tau, c, [side, trans, lwork, overwrite_c]) -> (cq, info)
 @type_check_only
-class _function_ormrz[ST: np.generic](Protocol):
+class _function_ormrz_unmrz[ST: np.generic](Protocol):
     def __call__(
         self,
         /,
@@ -1834,8 +1802,8 @@ class _function_ormrz[ST: np.generic](Protocol):
         overwrite_c: int = 0,
     ) -> tuple[onp.Array2D[ST], _info]: ...
 
-sormrz: _function_ormrz[np.float32] = ...
-dormrz: _function_ormrz[np.float64] = ...
+sormrz: _function_ormrz_unmrz[np.float32] = ...
+dormrz: _function_ormrz_unmrz[np.float64] = ...
 
 # (m, n, [side, trans]) -> (work, info)
 @type_check_only
@@ -1904,27 +1872,21 @@ zpbtrs: _function_pbtrs[np.complex128] = ...
 
 # (n, a, [transr, uplo, overwrite_a]) -> (achol, info)
 @type_check_only
-class _function_pftrf[ST: np.generic](Protocol):
+class _function_pftrf_pftri[ST: np.generic](Protocol):
     def __call__(
         self, /, n: int, a: onp.Array1D[ST], *, transr: str | bytes = "N", uplo: str | bytes = "U", overwrite_a: int = 0
     ) -> tuple[onp.Array1D[ST], _info]: ...
 
-spftrf: _function_pftrf[np.float32] = ...
-dpftrf: _function_pftrf[np.float64] = ...
-cpftrf: _function_pftrf[np.complex64] = ...
-zpftrf: _function_pftrf[np.complex128] = ...
+spftrf: _function_pftrf_pftri[np.float32] = ...
+dpftrf: _function_pftrf_pftri[np.float64] = ...
+cpftrf: _function_pftrf_pftri[np.complex64] = ...
+zpftrf: _function_pftrf_pftri[np.complex128] = ...
 
 # (n, a, [transr, uplo, overwrite_a]) -> (ainv, info)
-@type_check_only
-class _function_pftri[ST: np.generic](Protocol):
-    def __call__(
-        self, /, n: int, a: onp.Array1D[ST], *, transr: str | bytes = "N", uplo: str | bytes = "U", overwrite_a: int = 0
-    ) -> tuple[onp.Array1D[ST], _info]: ...
-
-spftri: _function_pftri[np.float32] = ...
-dpftri: _function_pftri[np.float64] = ...
-cpftri: _function_pftri[np.complex64] = ...
-zpftri: _function_pftri[np.complex128] = ...
+spftri: _function_pftrf_pftri[np.float32] = ...
+dpftri: _function_pftrf_pftri[np.float64] = ...
+cpftri: _function_pftrf_pftri[np.complex64] = ...
+zpftri: _function_pftrf_pftri[np.complex128] = ...
 
 # (n, a, b, [transr, uplo, overwrite_b]) -> (x, info)
 @type_check_only
@@ -2015,14 +1977,10 @@ cpotrf: _function_potrf[np.complex64] = ...
 zpotrf: _function_potrf[np.complex128] = ...
 
 # (c, [lower, overwrite_c]) -> (inv_a, info)
-@type_check_only
-class _function_potri[ST: np.generic](Protocol):
-    def __call__(self, /, c: onp.Array2D[ST], *, lower: int = 0, overwrite_c: int = 0) -> tuple[onp.Array2D[ST], _info]: ...
-
-spotri: _function_potri[np.float32] = ...
-dpotri: _function_potri[np.float64] = ...
-cpotri: _function_potri[np.complex64] = ...
-zpotri: _function_potri[np.complex128] = ...
+spotri: _function_lauum_potri[np.float32] = ...
+dpotri: _function_lauum_potri[np.float64] = ...
+cpotri: _function_lauum_potri[np.complex64] = ...
+zpotri: _function_lauum_potri[np.complex128] = ...
 
 # (c, b, [lower, overwrite_b]) -> (x, info)
 @type_check_only
@@ -2048,74 +2006,56 @@ zppcon: _function_ppcon[np.complex128] = ...
 
 # (n, ap, b, [lower, overwrite_b]) -> (x, info)
 @type_check_only
-class _function_ppsv[ST: np.generic](Protocol):
+class _function_ppsv_pptrs[ST: np.generic](Protocol):
     def __call__(
         self, /, n: int, ap: onp.Array1D[ST], b: onp.Array2D[ST], *, lower: int = 0, overwrite_b: int = 0
     ) -> tuple[onp.Array2D[ST], _info]: ...
 
-sppsv: _function_ppsv[np.float32] = ...
-dppsv: _function_ppsv[np.float64] = ...
-cppsv: _function_ppsv[np.complex64] = ...
-zppsv: _function_ppsv[np.complex128] = ...
+sppsv: _function_ppsv_pptrs[np.float32] = ...
+dppsv: _function_ppsv_pptrs[np.float64] = ...
+cppsv: _function_ppsv_pptrs[np.complex64] = ...
+zppsv: _function_ppsv_pptrs[np.complex128] = ...
 
 # (n, ap, [lower, overwrite_ap]) -> (ul, info)
 @type_check_only
-class _function_pptrf[ST: np.generic](Protocol):
+class _function_pptrf_pptri[ST: np.generic](Protocol):
     def __call__(
         self, /, n: int, ap: onp.Array1D[ST], *, lower: int = 0, overwrite_ap: int = 0
     ) -> tuple[onp.Array1D[ST], _info]: ...
 
-spptrf: _function_pptrf[np.float32] = ...
-dpptrf: _function_pptrf[np.float64] = ...
-cpptrf: _function_pptrf[np.complex64] = ...
-zpptrf: _function_pptrf[np.complex128] = ...
+spptrf: _function_pptrf_pptri[np.float32] = ...
+dpptrf: _function_pptrf_pptri[np.float64] = ...
+cpptrf: _function_pptrf_pptri[np.complex64] = ...
+zpptrf: _function_pptrf_pptri[np.complex128] = ...
 
 # (n, ap, [lower, overwrite_ap]) -> (uli, info)
-@type_check_only
-class _function_pptri[ST: np.generic](Protocol):
-    def __call__(
-        self, /, n: int, ap: onp.Array1D[ST], *, lower: int = 0, overwrite_ap: int = 0
-    ) -> tuple[onp.Array1D[ST], _info]: ...
-
-spptri: _function_pptri[np.float32] = ...
-dpptri: _function_pptri[np.float64] = ...
-cpptri: _function_pptri[np.complex64] = ...
-zpptri: _function_pptri[np.complex128] = ...
+spptri: _function_pptrf_pptri[np.float32] = ...
+dpptri: _function_pptrf_pptri[np.float64] = ...
+cpptri: _function_pptrf_pptri[np.complex64] = ...
+zpptri: _function_pptrf_pptri[np.complex128] = ...
 
 # (n, ap, b, [lower, overwrite_b]) -> (x, info)
-@type_check_only
-class _function_pptrs[ST: np.generic](Protocol):
-    def __call__(
-        self, /, n: int, ap: onp.Array1D[ST], b: onp.Array2D[ST], *, lower: int = 0, overwrite_b: int = 0
-    ) -> tuple[onp.Array2D[ST], _info]: ...
-
-spptrs: _function_pptrs[np.float32] = ...
-dpptrs: _function_pptrs[np.float64] = ...
-cpptrs: _function_pptrs[np.complex64] = ...
-zpptrs: _function_pptrs[np.complex128] = ...
+spptrs: _function_ppsv_pptrs[np.float32] = ...
+dpptrs: _function_ppsv_pptrs[np.float64] = ...
+cpptrs: _function_ppsv_pptrs[np.complex64] = ...
+zpptrs: _function_ppsv_pptrs[np.complex128] = ...
 
 # (a, [tol, lower, overwrite_a]) -> (c, piv, rank_c, info)
 @type_check_only
-class _function_pstf2[ST: np.generic](Protocol):
+class _function_pstf2_pstrf[ST: np.generic](Protocol):
     def __call__(
         self, /, a: onp.Array2D[ST], *, tol: float = -1.0, lower: int = 0, overwrite_a: int = 0
     ) -> tuple[onp.Array2D[ST], onp.Array1D[np.int32], int, _info]: ...
 
-spstf2: _function_pstf2[np.float32] = ...
-dpstf2: _function_pstf2[np.float64] = ...
-cpstf2: _function_pstf2[np.complex64] = ...
-zpstf2: _function_pstf2[np.complex128] = ...
+spstf2: _function_pstf2_pstrf[np.float32] = ...
+dpstf2: _function_pstf2_pstrf[np.float64] = ...
+cpstf2: _function_pstf2_pstrf[np.complex64] = ...
+zpstf2: _function_pstf2_pstrf[np.complex128] = ...
 
-@type_check_only
-class _function_pstrf[ST: np.generic](Protocol):
-    def __call__(
-        self, /, a: onp.Array2D[ST], *, tol: float = -1.0, lower: int = 0, overwrite_a: int = 0
-    ) -> tuple[onp.Array2D[ST], onp.Array1D[np.int32], int, _info]: ...
-
-spstrf: _function_pstrf[np.float32] = ...
-dpstrf: _function_pstrf[np.float64] = ...
-cpstrf: _function_pstrf[np.complex64] = ...
-zpstrf: _function_pstrf[np.complex128] = ...
+spstrf: _function_pstf2_pstrf[np.float32] = ...
+dpstrf: _function_pstf2_pstrf[np.float64] = ...
+cpstrf: _function_pstf2_pstrf[np.complex64] = ...
+zpstrf: _function_pstf2_pstrf[np.complex128] = ...
 
 # (d, e, z, [compute_z, overwrite_d, overwrite_e, overwrite_z]) -> (d, e, z, info)
 @type_check_only
@@ -2293,26 +2233,8 @@ ssbevx: _function_sbevx[np.float32] = ...
 dsbevx: _function_sbevx[np.float64] = ...
 
 # (n, k, alpha, a, beta, c, [transr, uplo, trans, overwrite_c]) -> cout
-@type_check_only
-class _function_sfrk[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        n: int,
-        k: int,
-        alpha: float,
-        a: onp.Array2D[ST],
-        beta: float,
-        c: onp.Array1D[ST],
-        *,
-        transr: str | bytes = "N",
-        uplo: str | bytes = "U",
-        trans: str | bytes = "N",
-        overwrite_c: int = 0,
-    ) -> onp.Array1D[ST]: ...
-
-ssfrk: _function_sfrk[np.float32] = ...
-dsfrk: _function_sfrk[np.float64] = ...
+ssfrk: _function_hfrk_sfrk[np.float32] = ...
+dsfrk: _function_hfrk_sfrk[np.float64] = ...
 
 # (d, e, range, vl, vu, il, iu, tol, order) -> (m, w, iblock, isplit, info)
 @type_check_only
@@ -2435,16 +2357,10 @@ sstevd: _function_stevd[np.float32] = ...
 dstevd: _function_stevd[np.float64] = ...
 
 # (a, ipiv, anorm, [lower]) -> (rcond, info)
-@type_check_only
-class _function_sycon[ST: np.generic](Protocol):
-    def __call__(
-        self, /, a: onp.Array2D[ST], ipiv: onp.Array1D[np.int32], anorm: float, *, lower: int = 0
-    ) -> tuple[_rcond, _info]: ...
-
-ssycon: _function_sycon[np.float32] = ...
-dsycon: _function_sycon[np.float64] = ...
-csycon: _function_sycon[np.complex64] = ...
-zsycon: _function_sycon[np.complex128] = ...
+ssycon: _function_hecon_sycon[np.float32] = ...
+dsycon: _function_hecon_sycon[np.float64] = ...
+csycon: _function_hecon_sycon[np.complex64] = ...
+zsycon: _function_hecon_sycon[np.complex128] = ...
 
 # (a, ipiv, [lower, way, overwrite_a]) -> (a, e, info)
 @type_check_only
@@ -2459,14 +2375,10 @@ csyconv: _function_syconv[np.complex64] = ...
 zsyconv: _function_syconv[np.complex128] = ...
 
 # (a, [lower]) -> (s, scond, amax, info)
-@type_check_only
-class _function_syequb[ST: np.generic, RT: np.generic](Protocol):
-    def __call__(self, /, a: onp.Array2D[ST], *, lower: int = 0) -> tuple[onp.Array1D[RT], float, float, _info]: ...
-
-ssyequb: _function_syequb[np.float32, np.float32] = ...
-dsyequb: _function_syequb[np.float64, np.float64] = ...
-csyequb: _function_syequb[np.complex64, np.float32] = ...
-zsyequb: _function_syequb[np.complex128, np.float64] = ...
+ssyequb: _function_heequb_syequb[np.float32, np.float32] = ...
+dsyequb: _function_heequb_syequb[np.float64, np.float64] = ...
+csyequb: _function_heequb_syequb[np.complex64, np.float32] = ...
+zsyequb: _function_heequb_syequb[np.complex128, np.float64] = ...
 
 # (a, [compute_v, lower, lwork, overwrite_a]) -> (w, v, info)
 @type_check_only
@@ -2487,11 +2399,11 @@ dsyev: _function_syev[np.float64] = ...
 
 # (n, [lower]) -> (work, info)
 @type_check_only
-class _function_syev_lwork(Protocol):
+class _function_syev_syevx_sytrd_lwork(Protocol):
     def __call__(self, /, n: int, *, lower: int = 0) -> tuple[float, _info]: ...
 
-ssyev_lwork: _function_syev_lwork = ...
-dsyev_lwork: _function_syev_lwork = ...
+ssyev_lwork: _function_syev_syevx_sytrd_lwork = ...
+dsyev_lwork: _function_syev_syevx_sytrd_lwork = ...
 
 # (a, [compute_v, lower, lwork, liwork, overwrite_a]) -> (w, v, info)
 @type_check_only
@@ -2575,22 +2487,12 @@ ssyevx: _function_syevx[np.float32] = ...
 dsyevx: _function_syevx[np.float64] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_syevx_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[float, _info]: ...
-
-ssyevx_lwork: _function_syevx_lwork = ...
-dsyevx_lwork: _function_syevx_lwork = ...
+ssyevx_lwork: _function_syev_syevx_sytrd_lwork = ...
+dsyevx_lwork: _function_syev_syevx_sytrd_lwork = ...
 
 # (a, b, [itype, lower, overwrite_a]) -> (c, info)
-@type_check_only
-class _function_sygst[ST: np.generic](Protocol):
-    def __call__(
-        self, /, a: onp.Array2D[ST], b: onp.Array2D[ST], *, itype: int = 1, lower: int = 0, overwrite_a: int = 0
-    ) -> tuple[onp.Array2D[ST], _info]: ...
-
-ssygst: _function_sygst[np.float32] = ...
-dsygst: _function_sygst[np.float64] = ...
+ssygst: _function_hegst_sygst[np.float32] = ...
+dsygst: _function_hegst_sygst[np.float64] = ...
 
 # (a, b, [itype, jobz, uplo, lwork, overwrite_a, overwrite_b]) -> (w, v, info)
 @type_check_only
@@ -2614,11 +2516,11 @@ dsygv: _function_sygv[np.float64] = ...
 
 # (n, [uplo]) -> (work, info)
 @type_check_only
-class _function_sygv_lwork(Protocol):
+class _function_sygv_sygvx_lwork(Protocol):
     def __call__(self, /, n: int, *, uplo: str | bytes = "L") -> tuple[float, _info]: ...
 
-ssygv_lwork: _function_sygv_lwork = ...
-dsygv_lwork: _function_sygv_lwork = ...
+ssygv_lwork: _function_sygv_sygvx_lwork = ...
+dsygv_lwork: _function_sygv_sygvx_lwork = ...
 
 # (a, b, [itype, jobz, uplo, lwork, liwork, overwrite_a, overwrite_b]) -> (w, v, info)
 @type_check_only
@@ -2668,42 +2570,24 @@ ssygvx: _function_sygvx[np.float32] = ...
 dsygvx: _function_sygvx[np.float64] = ...
 
 # (n, [uplo]) -> (work, info)
-@type_check_only
-class _function_sygvx_lwork(Protocol):
-    def __call__(self, /, n: int, *, uplo: str | bytes = "L") -> tuple[float, _info]: ...
-
-ssygvx_lwork: _function_sygvx_lwork = ...
-dsygvx_lwork: _function_sygvx_lwork = ...
+ssygvx_lwork: _function_sygv_sygvx_lwork = ...
+dsygvx_lwork: _function_sygv_sygvx_lwork = ...
 
 # (a, b, [lwork, lower, overwrite_a, overwrite_b]) -> (udut, ipiv, x, info)
-@type_check_only
-class _function_sysv[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        a: onp.Array2D[ST],
-        b: onp.Array2D[ST],
-        *,
-        lwork: int = ...,  # = max(n, 1)
-        lower: int = 0,
-        overwrite_a: int = 0,
-        overwrite_b: int = 0,
-    ) -> tuple[onp.Array2D[ST], onp.Array1D[np.int32], onp.Array2D[ST], _info]: ...
-
-ssysv: _function_sysv[np.float32] = ...
-dsysv: _function_sysv[np.float64] = ...
-csysv: _function_sysv[np.complex64] = ...
-zsysv: _function_sysv[np.complex128] = ...
+ssysv: _function_hesv_sysv[np.float32] = ...
+dsysv: _function_hesv_sysv[np.float64] = ...
+csysv: _function_hesv_sysv[np.complex64] = ...
+zsysv: _function_hesv_sysv[np.complex128] = ...
 
 # (n, [lower]) -> (work, info)
 @type_check_only
-class _function_sysv_lwork[WorkT](Protocol):
+class _function_sysv_sysvx_sytrf_lwork[WorkT](Protocol):
     def __call__(self, /, n: int, *, lower: int = 0) -> tuple[WorkT, _info]: ...
 
-ssysv_lwork: _function_sysv_lwork[float] = ...
-dsysv_lwork: _function_sysv_lwork[float] = ...
-csysv_lwork: _function_sysv_lwork[complex] = ...
-zsysv_lwork: _function_sysv_lwork[complex] = ...
+ssysv_lwork: _function_sysv_sysvx_sytrf_lwork[float] = ...
+dsysv_lwork: _function_sysv_sysvx_sytrf_lwork[float] = ...
+csysv_lwork: _function_sysv_sysvx_sytrf_lwork[complex] = ...
+zsysv_lwork: _function_sysv_sysvx_sytrf_lwork[complex] = ...
 
 # (a, b, [af, ipiv, lwork, factored, lower, overwrite_a, overwrite_b]) -> (a_s, udut, ipiv, b_s, x, rcond, ferr, berr, info)
 @type_check_only
@@ -2739,14 +2623,10 @@ csysvx: _function_sysvx[np.complex64, np.float32] = ...
 zsysvx: _function_sysvx[np.complex128, np.float64] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_sysvx_lwork[WorkT](Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[WorkT, _info]: ...
-
-ssysvx_lwork: _function_sysvx_lwork[float] = ...
-dsysvx_lwork: _function_sysvx_lwork[float] = ...
-csysvx_lwork: _function_sysvx_lwork[complex] = ...
-zsysvx_lwork: _function_sysvx_lwork[complex] = ...
+ssysvx_lwork: _function_sysv_sysvx_sytrf_lwork[float] = ...
+dsysvx_lwork: _function_sysv_sysvx_sytrf_lwork[float] = ...
+csysvx_lwork: _function_sysv_sysvx_sytrf_lwork[complex] = ...
+zsysvx_lwork: _function_sysv_sysvx_sytrf_lwork[complex] = ...
 
 # (a, [lower, overwrite_a]) -> (ldu, ipiv, info)
 @type_check_only
@@ -2777,64 +2657,32 @@ ssytrd: _function_sytrd[np.float32] = ...
 dsytrd: _function_sytrd[np.float64] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_sytrd_lwork(Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[float, _info]: ...
-
-ssytrd_lwork: _function_sytrd_lwork = ...
-dsytrd_lwork: _function_sytrd_lwork = ...
+ssytrd_lwork: _function_syev_syevx_sytrd_lwork = ...
+dsytrd_lwork: _function_syev_syevx_sytrd_lwork = ...
 
 # (a, [lower, lwork, overwrite_a]) -> (ldu, ipiv, info)
-@type_check_only
-class _function_sytrf[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        a: onp.Array2D[ST],
-        *,
-        lower: int = 0,
-        lwork: int = ...,  # = max(n, 1)
-        overwrite_a: int = 0,
-    ) -> tuple[onp.Array2D[ST], onp.Array1D[np.int32], _info]: ...
-
-ssytrf: _function_sytrf[np.float32] = ...
-dsytrf: _function_sytrf[np.float64] = ...
-csytrf: _function_sytrf[np.complex64] = ...
-zsytrf: _function_sytrf[np.complex128] = ...
+ssytrf: _function_hetrf_sytrf[np.float32] = ...
+dsytrf: _function_hetrf_sytrf[np.float64] = ...
+csytrf: _function_hetrf_sytrf[np.complex64] = ...
+zsytrf: _function_hetrf_sytrf[np.complex128] = ...
 
 # (n, [lower]) -> (work, info)
-@type_check_only
-class _function_sytrf_lwork[WorkT](Protocol):
-    def __call__(self, /, n: int, *, lower: int = 0) -> tuple[WorkT, _info]: ...
-
-ssytrf_lwork: _function_sytrf_lwork[float] = ...
-dsytrf_lwork: _function_sytrf_lwork[float] = ...
-csytrf_lwork: _function_sytrf_lwork[complex] = ...
-zsytrf_lwork: _function_sytrf_lwork[complex] = ...
+ssytrf_lwork: _function_sysv_sysvx_sytrf_lwork[float] = ...
+dsytrf_lwork: _function_sysv_sysvx_sytrf_lwork[float] = ...
+csytrf_lwork: _function_sysv_sysvx_sytrf_lwork[complex] = ...
+zsytrf_lwork: _function_sysv_sysvx_sytrf_lwork[complex] = ...
 
 # (a, ipiv, [lower, overwrite_a]) -> (inv_a, info)
-@type_check_only
-class _function_sytri[ST: np.generic](Protocol):
-    def __call__(
-        self, /, a: onp.Array2D[ST], ipiv: onp.Array1D[np.int32], *, lower: int = 0, overwrite_a: int = 0
-    ) -> tuple[onp.Array2D[ST], _info]: ...
-
-ssytri: _function_sytri[np.float32] = ...
-dsytri: _function_sytri[np.float64] = ...
-csytri: _function_sytri[np.complex64] = ...
-zsytri: _function_sytri[np.complex128] = ...
+ssytri: _function_hetri_sytri[np.float32] = ...
+dsytri: _function_hetri_sytri[np.float64] = ...
+csytri: _function_hetri_sytri[np.complex64] = ...
+zsytri: _function_hetri_sytri[np.complex128] = ...
 
 # (a, ipiv, b, [lower, overwrite_b]) -> (x, info)
-@type_check_only
-class _function_sytrs[ST: np.generic](Protocol):
-    def __call__(
-        self, /, a: onp.Array2D[ST], ipiv: onp.Array1D[np.int32], b: onp.Array2D[ST], *, lower: int = 0, overwrite_b: int = 0
-    ) -> tuple[onp.Array2D[ST], _info]: ...
-
-ssytrs: _function_sytrs[np.float32] = ...
-dsytrs: _function_sytrs[np.float64] = ...
-csytrs: _function_sytrs[np.complex64] = ...
-zsytrs: _function_sytrs[np.complex128] = ...
+ssytrs: _function_hetrs_sytrs[np.float32] = ...
+dsytrs: _function_hetrs_sytrs[np.float64] = ...
+csytrs: _function_hetrs_sytrs[np.complex64] = ...
+zsytrs: _function_hetrs_sytrs[np.complex128] = ...
 
 # (ab, b, [uplo, trans, diag, overwrite_b]) -> (x, info)
 @type_check_only
@@ -3315,14 +3163,10 @@ ctzrzf: _function_tzrzf[np.complex64] = ...
 ztzrzf: _function_tzrzf[np.complex128] = ...
 
 # (m, n) -> (work, info)
-@type_check_only
-class _function_tzrzf_lwork[WorkT](Protocol):
-    def __call__(self, /, m: int, n: int) -> tuple[WorkT, _info]: ...
-
-stzrzf_lwork: _function_tzrzf_lwork[float] = ...
-dtzrzf_lwork: _function_tzrzf_lwork[float] = ...
-ctzrzf_lwork: _function_tzrzf_lwork[complex] = ...
-ztzrzf_lwork: _function_tzrzf_lwork[complex] = ...
+stzrzf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[float] = ...
+dtzrzf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[float] = ...
+ctzrzf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[complex] = ...
+ztzrzf_lwork: _function_geqrf_geqrfp_tzrzf_lwork[complex] = ...
 
 # (x11, x12, x21, x22, [...]) -> cs11, cs12, cs21, cs22, theta, u1, u2, v1t, v2t, info
 @type_check_only
@@ -3372,22 +3216,8 @@ cuncsd_lwork: _function_uncsd_lwork = ...
 zuncsd_lwork: _function_uncsd_lwork = ...
 
 # (a, tau, [lo, hi, lwork, overwrite_a]) -> (ht, info)
-@type_check_only
-class _function_unghr[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        a: onp.Array2D[ST],
-        tau: onp.Array1D[ST],
-        *,
-        lo: int = 0,
-        hi: int = ...,  # = n - 1
-        lwork: int = ...,  # = max(hi - lo, 1)
-        overwrite_a: int = 0,
-    ) -> tuple[onp.Array2D[ST], _info]: ...
-
-cunghr: _function_unghr[np.complex64] = ...
-zunghr: _function_unghr[np.complex128] = ...
+cunghr: _function_orghr_unghr[np.complex64] = ...
+zunghr: _function_orghr_unghr[np.complex128] = ...
 
 # (n, [lo, hi]) -> (work, info)
 @type_check_only
@@ -3405,73 +3235,19 @@ cunghr_lwork: _function_unghr_lwork = ...
 zunghr_lwork: _function_unghr_lwork = ...
 
 # (a, tau, [lwork, overwrite_a]) -> (q, work, info)
-@type_check_only
-class _function_ungqr[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        a: onp.Array2D[ST],
-        tau: onp.Array1D[ST],
-        *,
-        lwork: int = ...,  # = max(3 * n, 1)
-        overwrite_a: int = 0,
-    ) -> tuple[onp.Array2D[ST], onp.Array1D[ST], _info]: ...
-
-cungqr: _function_ungqr[np.complex64] = ...
-zungqr: _function_ungqr[np.complex128] = ...
-
-@type_check_only
-class _function_ungrq[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        a: onp.Array2D[ST],
-        tau: onp.Array1D[ST],
-        *,
-        lwork: int = ...,  # = max(3 * m, 1)
-        overwrite_a: int = 0,
-    ) -> tuple[onp.Array2D[ST], onp.Array1D[ST], _info]: ...
+cungqr: _function_orgqr_ungqr[np.complex64] = ...
+zungqr: _function_orgqr_ungqr[np.complex128] = ...
 
-cungrq: _function_ungrq[np.complex64] = ...
-zungrq: _function_ungrq[np.complex128] = ...
+cungrq: _function_orgrq_ungrq[np.complex64] = ...
+zungrq: _function_orgrq_ungrq[np.complex128] = ...
 
 # (side, trans, a, tau, c, lwork, [overwrite_c]) -> (cq, work, info)
-@type_check_only
-class _function_unmqr[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        side: str | bytes,
-        trans: str | bytes,
-        a: onp.Array2D[ST],
-        tau: onp.Array1D[ST],
-        c: onp.Array2D[ST],
-        lwork: int,
-        *,
-        overwrite_c: int = 0,
-    ) -> tuple[onp.Array2D[ST], onp.Array1D[ST], _info]: ...
-
-cunmqr: _function_unmqr[np.complex64] = ...
-zunmqr: _function_unmqr[np.complex128] = ...
+cunmqr: _function_ormqr_unmqr[np.complex64] = ...
+zunmqr: _function_ormqr_unmqr[np.complex128] = ...
 
 # (a, tau, c, [side, trans, lwork, overwrite_c]) -> (cq, info)
-@type_check_only
-class _function_unmrz[ST: np.generic](Protocol):
-    def __call__(
-        self,
-        /,
-        a: onp.Array2D[ST],
-        tau: onp.Array1D[ST],
-        c: onp.Array2D[ST],
-        *,
-        side: str | bytes = "L",
-        trans: str | bytes = "N",
-        lwork: int = ...,  # = max((n if side == "L" else m), 1)
-        overwrite_c: int = 0,
-    ) -> tuple[onp.Array2D[ST], _info]: ...
-
-cunmrz: _function_unmrz[np.complex64] = ...
-zunmrz: _function_unmrz[np.complex128] = ...
+cunmrz: _function_ormrz_unmrz[np.complex64] = ...
+zunmrz: _function_ormrz_unmrz[np.complex128] = ...
 
 # (m, n, [side, trans]) -> (work, info)
 @type_check_only
@@ -19,7 +19,7 @@ from ._dia import dia_array, dia_matrix
 from ._dok import dok_array, dok_matrix
 from ._lil import lil_array, lil_matrix
 from ._matrix import spmatrix as spmatrix
-from ._typing import _CanAsAny, _Format
+from ._typing import _CanAsAny, _CanCompare, _Format
 from scipy._lib._sparse import SparseABC, issparse
 
 __all__ = ["SparseEfficiencyWarning", "SparseWarning", "issparse", "isspmatrix", "sparray"]
@@ -112,6 +112,8 @@ class _spbase(SparseABC, Generic[_ScalarT_co, _ShapeT_co]):
     def __assoc_stacked_as__[ST: _Scalar](self, sctype: ST, /) -> _spbase[ST, _2D]: ...
     @type_check_only  # same kind, `Any` scalar-type, same shape-type  (mypy (2.2.0) can't deal with generic sctype)
     def __assoc_as_any__(self, /) -> _spbase[Any, _ShapeT_co]: ...
+    @type_check_only  # `csr` or `csc` kind, `np.bool` scalar-type, same shape-type
+    def __assoc_compared__(self, /) -> _spbase[np.bool, _ShapeT_co]: ...
 
     #
     @property
@@ -172,41 +174,10 @@ class _spbase(SparseABC, Generic[_ScalarT_co, _ShapeT_co]):
     def __iter__[ST: _Scalar](self: lil_matrix[ST], /) -> Iterator[lil_matrix[ST]]: ...
 
     #
-    @overload
-    def __lt__[SpBoolT: _spbase[np.bool]](self: SpBoolT, other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> SpBoolT: ...
-    @overload
-    def __lt__(self: _SpArray2D[Any], other: _spbase[_ToFloat, _2D] | onp.ToFloat, /) -> csr_array[np.bool, _2D]: ...
-    @overload
-    def __lt__(self: _SpArray1D[Any], other: _spbase[_ToFloat, _1D] | onp.ToFloat, /) -> csr_array[np.bool, _1D]: ...
-    @overload
-    def __lt__(self: spmatrix, other: _spbase[_ToFloat], /) -> csr_matrix[np.bool]: ...
-    #
-    @overload
-    def __gt__[SpBoolT: _spbase[np.bool]](self: SpBoolT, other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> SpBoolT: ...
-    @overload
-    def __gt__(self: _SpArray2D[Any], other: _spbase[_ToFloat, _2D] | onp.ToFloat, /) -> csr_array[np.bool, _2D]: ...
-    @overload
-    def __gt__(self: _SpArray1D[Any], other: _spbase[_ToFloat, _1D] | onp.ToFloat, /) -> csr_array[np.bool, _1D]: ...
-    @overload
-    def __gt__(self: spmatrix, other: _spbase[_ToFloat], /) -> csr_matrix[np.bool]: ...
-    #
-    @overload
-    def __le__[SpBoolT: _spbase[np.bool]](self: SpBoolT, other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> SpBoolT: ...
-    @overload
-    def __le__(self: _SpArray2D[Any], other: _spbase[_ToFloat, _2D] | onp.ToFloat, /) -> csr_array[np.bool, _2D]: ...
-    @overload
-    def __le__(self: _SpArray1D[Any], other: _spbase[_ToFloat, _1D] | onp.ToFloat, /) -> csr_array[np.bool, _1D]: ...
-    @overload
-    def __le__(self: spmatrix, other: _spbase[_ToFloat], /) -> csr_matrix[np.bool]: ...
-    #
-    @overload
-    def __ge__[SpBoolT: _spbase[np.bool]](self: SpBoolT, other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> SpBoolT: ...
-    @overload
-    def __ge__(self: _SpArray2D[Any], other: _spbase[_ToFloat, _2D] | onp.ToFloat, /) -> csr_array[np.bool, _2D]: ...
-    @overload
-    def __ge__(self: _SpArray1D[Any], other: _spbase[_ToFloat, _1D] | onp.ToFloat, /) -> csr_array[np.bool, _1D]: ...
-    @overload
-    def __ge__(self: spmatrix, other: _spbase[_ToFloat], /) -> _SpMatrixOut[np.bool]: ...
+    def __lt__[OutT](self: _CanCompare[OutT], other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> OutT: ...
+    def __gt__[OutT](self: _CanCompare[OutT], other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> OutT: ...
+    def __le__[OutT](self: _CanCompare[OutT], other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> OutT: ...
+    def __ge__[OutT](self: _CanCompare[OutT], other: _spbase[_ToFloat, _ShapeT_co] | onp.ToFloat, /) -> OutT: ...
 
     #
     def __neg__(self, /) -> Self: ...
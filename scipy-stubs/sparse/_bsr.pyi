@@ -11,6 +11,7 @@ import optype.numpy.compat as npc
 from ._base import _spbase, sparray
 from ._compressed import _cs_matrix
 from ._coo import coo_array, coo_matrix
+from ._csr import csr_array, csr_matrix
 from ._data import _minmax_mixin
 from ._matrix import spmatrix
 from ._typing import _ToShape2D
@@ -95,6 +96,9 @@ class bsr_array(_bsr_base[_ScalarT_co], sparray[_ScalarT_co, tuple[int, int]], G
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> bsr_array[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_array[np.bool, tuple[int, int]]: ...
 
     # NOTE: keep in sync with `bsr_matrix.__init__`
     @overload  # matrix-like (known dtype), dtype: None
@@ -272,6 +276,9 @@ class bsr_matrix(_bsr_base[_ScalarT_co], spmatrix[_ScalarT_co], Generic[_ScalarT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> bsr_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_matrix[np.bool]: ...
 
     # NOTE: keep in sync with `bsr_array.__init__`
     @overload  # matrix-like (known dtype), dtype: None
@@ -654,6 +654,9 @@ def diags_array(
 ) -> lil_array: ...
 
 # NOTE: `diags_array` should be prefered over `diags`
+# NOTE: There is one overload per format and `dtype` kind, because the format literal selects the sparse matrix type, and
+# associated-type protocols can't be used for that: none of the type-checkers can solve a generic format key through an
+# overloaded method (see `hstack`).
 @overload  # diagonals: <known>, format: "dia" | None, dtype: None
 def diags[ScalarT: _Numeric](
     diagonals: _ToArray1D2D[ScalarT],
@@ -1121,6 +1124,8 @@ def eye_array(m: int, n: int | None = None, *, k: int = 0, dtype: _ToDType, form
 def eye_array(m: int, n: int | None = None, *, k: int = 0, dtype: _ToDType, format: _FmtLIL) -> lil_array[Incomplete]: ...
 
 # NOTE: `eye_array` should be prefered over `eye`
+# NOTE: Like `diags`, there is one overload per format and `dtype` kind. The builtin and string dtypes of the bool, int, and
+# complex128 kinds can't be matched by `onp.ToDType[ScalarT]`, so they need their own overloads.
 @overload  # dtype: float64-like (default), format: "dia" | None
 def eye(
     m: int, n: int | None = None, k: int = 0, dtype: onp.AnyFloat64DType = ..., format: _FmtDIA | None = None
@@ -1368,9 +1373,9 @@ def kronsum[ScalarT: _Numeric](A: _ToSparse2D[ScalarT], B: _SpArray2D[ScalarT],
 @overload  # A: unknown array-like, B: unknown array-like  (catch-all)
 def kronsum(A: onp.ToComplex2D, B: onp.ToComplex2D, format: _Format | None = None) -> Incomplete: ...
 
+# NOTE: The overloads with a `format` literal come first, because those are much cheaper to reject than the associated type
+# protocols of the `format: None` overloads, that type-checkers would otherwise try to match for every call with a `format`.
 # NOTE: keep in sync with `vstack`
-@overload  # sparray, format: <default>, dtype: <default>
-def hstack[T](blocks: Seq[_CanStack[T]], format: None = None, dtype: None = None) -> T: ...
 @overload  # sparray, format: "bsr", dtype: <default>
 def hstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtBSR, dtype: None = None) -> bsr_array[ScalarT]: ...
 @overload  # sparray, format: "coo", dtype: <default>
@@ -1385,8 +1390,6 @@ def hstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtDIA,
 def hstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtDOK, dtype: None = None) -> _DOKArray2D[ScalarT]: ...
 @overload  # sparray, format: "lil", dtype: <default>
 def hstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtLIL, dtype: None = None) -> lil_array[ScalarT]: ...
-@overload  # sparray, format: <default>, dtype: bool-like
-def hstack[T](blocks: Seq[_CanStackAs[np.bool, T]], format: None = None, *, dtype: onp.AnyBoolDType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: bool-like
 def hstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyBoolDType) -> bsr_array[np.bool]: ...
 @overload  # sparray, format: "coo", dtype: bool-like
@@ -1401,8 +1404,6 @@ def hstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyBoolDType) -> di
 def hstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyBoolDType) -> _DOKArray2D[np.bool]: ...
 @overload  # sparray, format: "lil", dtype: bool-like
 def hstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyBoolDType) -> lil_array[np.bool]: ...
-@overload  # sparray, format: <default>, dtype: int-like
-def hstack[T](blocks: Seq[_CanStackAs[np.int_, T]], format: None = None, *, dtype: onp.AnyIntDType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: int-like
 def hstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyIntDType) -> bsr_array[np.int_]: ...
 @overload  # sparray, format: "coo", dtype: int-like
@@ -1417,8 +1418,6 @@ def hstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyIntDType) -> dia
 def hstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyIntDType) -> _DOKArray2D[np.int_]: ...
 @overload  # sparray, format: "lil", dtype: int-like
 def hstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyIntDType) -> lil_array[np.int_]: ...
-@overload  # sparray, format: <default>, dtype: float64-like
-def hstack[T](blocks: Seq[_CanStackAs[np.float64, T]], format: None = None, *, dtype: onp.AnyFloat64DType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: float64-like
 def hstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyFloat64DType) -> bsr_array[np.float64]: ...
 @overload  # sparray, format: "coo", dtype: float64-like
@@ -1433,8 +1432,6 @@ def hstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyFloat64DType) ->
 def hstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyFloat64DType) -> _DOKArray2D[np.float64]: ...
 @overload  # sparray, format: "lil", dtype: float64-like
 def hstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyFloat64DType) -> lil_array[np.float64]: ...
-@overload  # sparray, format: <default>, dtype: complex128-like
-def hstack[T](blocks: Seq[_CanStackAs[np.complex128, T]], format: None = None, *, dtype: onp.AnyComplex128DType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: complex128-like
 def hstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyComplex128DType) -> bsr_array[np.complex128]: ...
 @overload  # sparray, format: "coo", dtype: complex128-like
@@ -1449,10 +1446,6 @@ def hstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyComplex128DType)
 def hstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyComplex128DType) -> _DOKArray2D[np.complex128]: ...
 @overload  # sparray, format: "lil", dtype: complex128-like
 def hstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyComplex128DType) -> lil_array[np.complex128]: ...
-@overload  # sparray, format: <default>, dtype: <known>
-def hstack[ScalarT: _Numeric, T](
-    blocks: Seq[_CanStackAs[ScalarT, T]], format: None = None, *, dtype: onp.ToDType[ScalarT]
-) -> T: ...
 @overload  # sparray, format: "bsr", dtype: <known>
 def hstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtBSR, dtype: onp.ToDType[ScalarT]) -> bsr_array[ScalarT]: ...
 @overload  # sparray, format: "coo", dtype: <known>
@@ -1467,8 +1460,6 @@ def hstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtDIA, dtype: onp.
 def hstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtDOK, dtype: onp.ToDType[ScalarT]) -> _DOKArray2D[ScalarT]: ...
 @overload  # sparray, format: "lil", dtype: <known>
 def hstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtLIL, dtype: onp.ToDType[ScalarT]) -> lil_array[ScalarT]: ...
-@overload  # sparray, format: <default>, dtype: <unknown>
-def hstack[T](blocks: Seq[_CanStackAs[Any, T]], format: None = None, *, dtype: _ToDType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: <unknown>
 def hstack(blocks: Seq[sparray], format: _FmtBSR, dtype: _ToDType) -> bsr_array: ...
 @overload  # sparray, format: "coo", dtype: <unknown>
@@ -1483,12 +1474,26 @@ def hstack(blocks: Seq[sparray], format: _FmtDIA, dtype: _ToDType) -> dia_array:
 def hstack(blocks: Seq[sparray], format: _FmtDOK, dtype: _ToDType) -> _DOKArray2D[Any]: ...
 @overload  # sparray, format: "lil", dtype: <unknown>
 def hstack(blocks: Seq[sparray], format: _FmtLIL, dtype: _ToDType) -> lil_array: ...
+@overload  # sparray, format: <default>, dtype: <default>
+def hstack[T](blocks: Seq[_CanStack[T]], format: None = None, dtype: None = None) -> T: ...
+@overload  # sparray, format: <default>, dtype: bool-like
+def hstack[T](blocks: Seq[_CanStackAs[np.bool, T]], format: None = None, *, dtype: onp.AnyBoolDType) -> T: ...
+@overload  # sparray, format: <default>, dtype: int-like
+def hstack[T](blocks: Seq[_CanStackAs[np.int_, T]], format: None = None, *, dtype: onp.AnyIntDType) -> T: ...
+@overload  # sparray, format: <default>, dtype: float64-like
+def hstack[T](blocks: Seq[_CanStackAs[np.float64, T]], format: None = None, *, dtype: onp.AnyFloat64DType) -> T: ...
+@overload  # sparray, format: <default>, dtype: complex128-like
+def hstack[T](blocks: Seq[_CanStackAs[np.complex128, T]], format: None = None, *, dtype: onp.AnyComplex128DType) -> T: ...
+@overload  # sparray, format: <default>, dtype: <known>
+def hstack[ScalarT: _Numeric, T](
+    blocks: Seq[_CanStackAs[ScalarT, T]], format: None = None, *, dtype: onp.ToDType[ScalarT]
+) -> T: ...
+@overload  # sparray, format: <default>, dtype: <unknown>
+def hstack[T](blocks: Seq[_CanStackAs[Any, T]], format: None = None, *, dtype: _ToDType) -> T: ...
 @overload
 def hstack(blocks: Seq[_spbase], format: _Format, dtype: _ToDType | None = None) -> Incomplete: ...
 
 # NOTE: keep in sync with `hstack`
-@overload  # sparray, format: <default>, dtype: <default>
-def vstack[T](blocks: Seq[_CanStack[T]], format: None = None, dtype: None = None) -> T: ...
 @overload  # sparray, format: "bsr", dtype: <default>
 def vstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtBSR, dtype: None = None) -> bsr_array[ScalarT]: ...
 @overload  # sparray, format: "coo", dtype: <default>
@@ -1503,8 +1508,6 @@ def vstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtDIA,
 def vstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtDOK, dtype: None = None) -> _DOKArray2D[ScalarT]: ...
 @overload  # sparray, format: "lil", dtype: <default>
 def vstack[ScalarT: _Numeric](blocks: Seq[_SpArray2D[ScalarT]], format: _FmtLIL, dtype: None = None) -> lil_array[ScalarT]: ...
-@overload  # sparray, format: <default>, dtype: bool-like
-def vstack[T](blocks: Seq[_CanStackAs[np.bool, T]], format: None = None, *, dtype: onp.AnyBoolDType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: bool-like
 def vstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyBoolDType) -> bsr_array[np.bool]: ...
 @overload  # sparray, format: "coo", dtype: bool-like
@@ -1519,8 +1522,6 @@ def vstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyBoolDType) -> di
 def vstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyBoolDType) -> _DOKArray2D[np.bool]: ...
 @overload  # sparray, format: "lil", dtype: bool-like
 def vstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyBoolDType) -> lil_array[np.bool]: ...
-@overload  # sparray, format: <default>, dtype: int-like
-def vstack[T](blocks: Seq[_CanStackAs[np.int_, T]], format: None = None, *, dtype: onp.AnyIntDType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: int-like
 def vstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyIntDType) -> bsr_array[np.int_]: ...
 @overload  # sparray, format: "coo", dtype: int-like
@@ -1535,8 +1536,6 @@ def vstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyIntDType) -> dia
 def vstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyIntDType) -> _DOKArray2D[np.int_]: ...
 @overload  # sparray, format: "lil", dtype: int-like
 def vstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyIntDType) -> lil_array[np.int_]: ...
-@overload  # sparray, format: <default>, dtype: float64-like
-def vstack[T](blocks: Seq[_CanStackAs[np.float64, T]], format: None = None, *, dtype: onp.AnyFloat64DType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: float64-like
 def vstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyFloat64DType) -> bsr_array[np.float64]: ...
 @overload  # sparray, format: "coo", dtype: float64-like
@@ -1551,8 +1550,6 @@ def vstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyFloat64DType) ->
 def vstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyFloat64DType) -> _DOKArray2D[np.float64]: ...
 @overload  # sparray, format: "lil", dtype: float64-like
 def vstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyFloat64DType) -> lil_array[np.float64]: ...
-@overload  # sparray, format: <default>, dtype: complex128-like
-def vstack[T](blocks: Seq[_CanStackAs[np.complex128, T]], format: None = None, *, dtype: onp.AnyComplex128DType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: complex128-like
 def vstack(blocks: Seq[sparray], format: _FmtBSR, dtype: onp.AnyComplex128DType) -> bsr_array[np.complex128]: ...
 @overload  # sparray, format: "coo", dtype: complex128-like
@@ -1567,10 +1564,6 @@ def vstack(blocks: Seq[sparray], format: _FmtDIA, dtype: onp.AnyComplex128DType)
 def vstack(blocks: Seq[sparray], format: _FmtDOK, dtype: onp.AnyComplex128DType) -> _DOKArray2D[np.complex128]: ...
 @overload  # sparray, format: "lil", dtype: complex128-like
 def vstack(blocks: Seq[sparray], format: _FmtLIL, dtype: onp.AnyComplex128DType) -> lil_array[np.complex128]: ...
-@overload  # sparray, format: <default>, dtype: <known>
-def vstack[ScalarT: _Numeric, T](
-    blocks: Seq[_CanStackAs[ScalarT, T]], format: None = None, *, dtype: onp.ToDType[ScalarT]
-) -> T: ...
 @overload  # sparray, format: "bsr", dtype: <known>
 def vstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtBSR, dtype: onp.ToDType[ScalarT]) -> bsr_array[ScalarT]: ...
 @overload  # sparray, format: "coo", dtype: <known>
@@ -1585,8 +1578,6 @@ def vstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtDIA, dtype: onp.
 def vstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtDOK, dtype: onp.ToDType[ScalarT]) -> _DOKArray2D[ScalarT]: ...
 @overload  # sparray, format: "lil", dtype: <known>
 def vstack[ScalarT: _Numeric](blocks: Seq[sparray], format: _FmtLIL, dtype: onp.ToDType[ScalarT]) -> lil_array[ScalarT]: ...
-@overload  # sparray, format: <default>, dtype: <unknown>
-def vstack[T](blocks: Seq[_CanStackAs[Any, T]], format: None = None, *, dtype: _ToDType) -> T: ...
 @overload  # sparray, format: "bsr", dtype: <unknown>
 def vstack(blocks: Seq[sparray], format: _FmtBSR, dtype: _ToDType) -> bsr_array: ...
 @overload  # sparray, format: "coo", dtype: <unknown>
@@ -1601,12 +1592,27 @@ def vstack(blocks: Seq[sparray], format: _FmtDIA, dtype: _ToDType) -> dia_array:
 def vstack(blocks: Seq[sparray], format: _FmtDOK, dtype: _ToDType) -> _DOKArray2D[Any]: ...
 @overload  # sparray, format: "lil", dtype: <unknown>
 def vstack(blocks: Seq[sparray], format: _FmtLIL, dtype: _ToDType) -> lil_array: ...
+@overload  # sparray, format: <default>, dtype: <default>
+def vstack[T](blocks: Seq[_CanStack[T]], format: None = None, dtype: None = None) -> T: ...
+@overload  # sparray, format: <default>, dtype: bool-like
+def vstack[T](blocks: Seq[_CanStackAs[np.bool, T]], format: None = None, *, dtype: onp.AnyBoolDType) -> T: ...
+@overload  # sparray, format: <default>, dtype: int-like
+def vstack[T](blocks: Seq[_CanStackAs[np.int_, T]], format: None = None, *, dtype: onp.AnyIntDType) -> T: ...
+@overload  # sparray, format: <default>, dtype: float64-like
+def vstack[T](blocks: Seq[_CanStackAs[np.float64, T]], format: None = None, *, dtype: onp.AnyFloat64DType) -> T: ...
+@overload  # sparray, format: <default>, dtype: complex128-like
+def vstack[T](blocks: Seq[_CanStackAs[np.complex128, T]], format: None = None, *, dtype: onp.AnyComplex128DType) -> T: ...
+@overload  # sparray, format: <default>, dtype: <known>
+def vstack[ScalarT: _Numeric, T](
+    blocks: Seq[_CanStackAs[ScalarT, T]], format: None = None, *, dtype: onp.ToDType[ScalarT]
+) -> T: ...
+@overload  # sparray, format: <default>, dtype: <unknown>
+def vstack[T](blocks: Seq[_CanStackAs[Any, T]], format: None = None, *, dtype: _ToDType) -> T: ...
 @overload
 def vstack(blocks: Seq[_spbase], format: _Format, dtype: _ToDType | None = None) -> Incomplete: ...
 
 #
-@overload  # blocks: <known, known>, format: <default>, dtype: <default>
-def block_array[T](blocks: _ToBlocks[_CanStack[T]], *, format: None = None, dtype: None = None) -> T: ...
+# NOTE: See the `hstack` note on the order of the overloads.
 @overload  # blocks: <array, known>, format: "bsr", dtype: <default>
 def block_array[ScalarT: _Numeric](
     blocks: _ToBlocksSpArray[ScalarT], *, format: _FmtBSR, dtype: None = None
@@ -1635,8 +1641,6 @@ def block_array[ScalarT: _Numeric](
 def block_array[ScalarT: _Numeric](
     blocks: _ToBlocksSpArray[ScalarT], *, format: _FmtLIL, dtype: None = None
 ) -> lil_array[ScalarT]: ...
-@overload  # blocks: <known, bool_>, format: <default>, dtype: bool-like
-def block_array[T](blocks: _ToBlocksCanStackAs[np.bool, T], *, format: None = None, dtype: onp.AnyBoolDType) -> T: ...
 @overload  # blocks: <unknown, unknown>, format: "bsr", dtype: bool-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtBSR, dtype: onp.AnyBoolDType) -> bsr_array[np.bool]: ...
 @overload  # blocks: <unknown, unknown>, format: "coo", dtype: bool-like
@@ -1651,8 +1655,6 @@ def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDIA, dtype: onp.AnyBoolD
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDOK, dtype: onp.AnyBoolDType) -> _DOKArray2D[np.bool]: ...
 @overload  # blocks: <unknown, unknown>, format: "lil", dtype: bool-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtLIL, dtype: onp.AnyBoolDType) -> lil_array[np.bool]: ...
-@overload  # blocks: <known, int_>, format: <default>, dtype: int-like
-def block_array[T](blocks: _ToBlocksCanStackAs[np.int64, T], *, format: None = None, dtype: onp.AnyIntDType) -> T: ...
 @overload  # blocks: <unknown, unknown>, format: "bsr", dtype: int-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtBSR, dtype: onp.AnyIntDType) -> bsr_array[np.int_]: ...
 @overload  # blocks: <unknown, unknown>, format: "coo", dtype: int-like
@@ -1667,8 +1669,6 @@ def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDIA, dtype: onp.AnyIntDT
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDOK, dtype: onp.AnyIntDType) -> _DOKArray2D[np.int_]: ...
 @overload  # blocks: <unknown, unknown>, format: "lil", dtype: int-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtLIL, dtype: onp.AnyIntDType) -> lil_array[np.int_]: ...
-@overload  # blocks: <known, float64>, format: <default>, dtype: float64-like
-def block_array[T](blocks: _ToBlocksCanStackAs[np.float64, T], *, format: None = None, dtype: onp.AnyFloat64DType) -> T: ...
 @overload  # blocks: <unknown, unknown>, format: "bsr", dtype: float64-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtBSR, dtype: onp.AnyFloat64DType) -> bsr_array[np.float64]: ...
 @overload  # blocks: <unknown, unknown>, format: "coo", dtype: float64-like
@@ -1683,8 +1683,6 @@ def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDIA, dtype: onp.AnyFloat
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDOK, dtype: onp.AnyFloat64DType) -> _DOKArray2D[np.float64]: ...
 @overload  # blocks: <unknown, unknown>, format: "lil", dtype: float64-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtLIL, dtype: onp.AnyFloat64DType) -> lil_array[np.float64]: ...
-@overload  # blocks: <known, complex128>, format: <default>, dtype: complex128-like
-def block_array[T](blocks: _ToBlocksCanStackAs[np.complex128, T], *, format: None = None, dtype: onp.AnyComplex128DType) -> T: ...
 @overload  # blocks: <unknown, unknown>, format: "bsr", dtype: complex128-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtBSR, dtype: onp.AnyComplex128DType) -> bsr_array[np.complex128]: ...
 @overload  # blocks: <unknown, unknown>, format: "coo", dtype: complex128-like
@@ -1699,10 +1697,6 @@ def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDIA, dtype: onp.AnyCompl
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDOK, dtype: onp.AnyComplex128DType) -> _DOKArray2D[np.complex128]: ...
 @overload  # blocks: <unknown, unknown>, format: "lil", dtype: complex128-like
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtLIL, dtype: onp.AnyComplex128DType) -> lil_array[np.complex128]: ...
-@overload  # blocks: <known, known>, format: <default>, dtype: <known>
-def block_array[ScalarT: _Numeric, T](
-    blocks: _ToBlocksCanStackAs[ScalarT, T], *, format: None = None, dtype: onp.ToDType[ScalarT]
-) -> T: ...
 @overload  # blocks: <unknown, unknown>, format: "bsr", dtype: <known>
 def block_array[ScalarT: _Numeric](
     blocks: _ToBlocksUnkown, *, format: _FmtBSR, dtype: onp.ToDType[ScalarT]
@@ -1731,8 +1725,6 @@ def block_array[ScalarT: _Numeric](
 def block_array[ScalarT: _Numeric](
     blocks: _ToBlocksUnkown, *, format: _FmtLIL, dtype: onp.ToDType[ScalarT]
 ) -> lil_array[ScalarT]: ...
-@overload  # blocks: <known, unknown>, format: <default>, dtype: <unknown>
-def block_array[T](blocks: _ToBlocksCanStackAs[Any, T], *, format: None = None, dtype: _ToDType | None = None) -> T: ...
 @overload  # blocks: <unknown, unknown>, format: "bsr", dtype: <unknown>
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtBSR, dtype: _ToDType | None = None) -> bsr_array: ...
 @overload  # blocks: <unknown, unknown>, format: "coo", dtype: <unknown>
@@ -1747,6 +1739,22 @@ def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDIA, dtype: _ToDType | N
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtDOK, dtype: _ToDType | None = None) -> _DOKArray2D[Any]: ...
 @overload  # blocks: <unknown, unknown>, format: "lil", dtype: <unknown>
 def block_array(blocks: _ToBlocksUnkown, *, format: _FmtLIL, dtype: _ToDType | None = None) -> lil_array: ...
+@overload  # blocks: <known, known>, format: <default>, dtype: <default>
+def block_array[T](blocks: _ToBlocks[_CanStack[T]], *, format: None = None, dtype: None = None) -> T: ...
+@overload  # blocks: <known, bool_>, format: <default>, dtype: bool-like
+def block_array[T](blocks: _ToBlocksCanStackAs[np.bool, T], *, format: None = None, dtype: onp.AnyBoolDType) -> T: ...
+@overload  # blocks: <known, int_>, format: <default>, dtype: int-like
+def block_array[T](blocks: _ToBlocksCanStackAs[np.int64, T], *, format: None = None, dtype: onp.AnyIntDType) -> T: ...
+@overload  # blocks: <known, float64>, format: <default>, dtype: float64-like
+def block_array[T](blocks: _ToBlocksCanStackAs[np.float64, T], *, format: None = None, dtype: onp.AnyFloat64DType) -> T: ...
+@overload  # blocks: <known, complex128>, format: <default>, dtype: complex128-like
+def block_array[T](blocks: _ToBlocksCanStackAs[np.complex128, T], *, format: None = None, dtype: onp.AnyComplex128DType) -> T: ...
+@overload  # blocks: <known, known>, format: <default>, dtype: <known>
+def block_array[ScalarT: _Numeric, T](
+    blocks: _ToBlocksCanStackAs[ScalarT, T], *, format: None = None, dtype: onp.ToDType[ScalarT]
+) -> T: ...
+@overload  # blocks: <known, unknown>, format: <default>, dtype: <unknown>
+def block_array[T](blocks: _ToBlocksCanStackAs[Any, T], *, format: None = None, dtype: _ToDType | None = None) -> T: ...
 
 #
 @overload  # blocks: <known, known>, format: <default>, dtype: <default>
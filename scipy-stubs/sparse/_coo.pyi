@@ -13,6 +13,7 @@ import optype.numpy as onp
 import optype.numpy.compat as npc
 
 from ._base import _spbase, sparray
+from ._csr import csr_array, csr_matrix
 from ._data import _data_matrix, _minmax_mixin
 from ._matrix import spmatrix
 from ._typing import _ToShape1D, _ToShape2D
@@ -174,6 +175,17 @@ class coo_array(_coo_base[_ScalarT_co, _ShapeT_co], sparray[_ScalarT_co, _ShapeT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> coo_array[Any, _ShapeT_co]: ...
+    # NOTE: 1-d and 2-d comparisons are converted to CSR, but n-d ones remain COO
+    @override
+    @overload
+    @type_check_only
+    def __assoc_compared__(self: coo_array[Any, tuple[int, int]], /) -> csr_array[np.bool, tuple[int, int]]: ...
+    @overload
+    @type_check_only
+    def __assoc_compared__(self: coo_array[Any, tuple[int]], /) -> csr_array[np.bool, tuple[int]]: ...
+    @overload
+    @type_check_only
+    def __assoc_compared__(self, /) -> coo_array[np.bool, _ShapeT_co]: ...
 
     # NOTE: keep in sync with `coo_array.__init__`
     @overload  # matrix-like (known dtype), dtype: None
@@ -547,6 +559,9 @@ class coo_matrix(_coo_base[_ScalarT_co, tuple[int, int]], spmatrix[_ScalarT_co],
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> coo_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_matrix[np.bool]: ...
 
     #
     @property
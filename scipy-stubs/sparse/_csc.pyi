@@ -80,6 +80,9 @@ class csc_array(_csc_base[_ScalarT_co], sparray[_ScalarT_co, tuple[int, int]], G
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> csc_array[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csc_array[np.bool]: ...
 
     # NOTE: keep in sync with `csc_matrix.__init__`
     @overload  # matrix-like (known dtype)
@@ -272,6 +275,9 @@ class csc_matrix(_csc_base[_ScalarT_co], spmatrix[_ScalarT_co], Generic[_ScalarT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> csc_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csc_matrix[np.bool]: ...
 
     # NOTE: keep in sync with `csc_array.__init__`
     @overload  # matrix-like (known dtype)
@@ -77,6 +77,9 @@ class csr_array(_csr_base[_ScalarT_co, _ShapeT_co], sparray[_ScalarT_co, _ShapeT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> csr_array[Any, _ShapeT_co]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_array[np.bool, _ShapeT_co]: ...
 
     #
     @overload  # sparse or dense (know dtype & shape)
@@ -395,6 +398,9 @@ class csr_matrix(_csr_base[_ScalarT_co], spmatrix[_ScalarT_co], Generic[_ScalarT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> csr_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_matrix[np.bool]: ...
 
     # NOTE: keep in sync with `csc_matrix.__init__`
     @overload  # matrix-like (known dtype)
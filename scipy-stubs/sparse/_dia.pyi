@@ -10,6 +10,7 @@ import optype.numpy.compat as npc
 
 from ._base import _spbase, sparray
 from ._coo import coo_array, coo_matrix
+from ._csr import csr_array, csr_matrix
 from ._data import _data_matrix
 from ._matrix import spmatrix
 from ._typing import _ToShape2D
@@ -72,6 +73,9 @@ class dia_array(_dia_base[_ScalarT_co], sparray[_ScalarT_co, tuple[int, int]], G
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> dia_array[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_array[np.bool, tuple[int, int]]: ...
 
     # NOTE: keep in sync with `dia_matrix.__init__`
     @overload  # matrix-like (known dtype), dtype: None
@@ -225,6 +229,9 @@ class dia_matrix(_dia_base[_ScalarT_co], spmatrix[_ScalarT_co], Generic[_ScalarT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> dia_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_matrix[np.bool]: ...
 
     # NOTE: keep in sync with `dia_array.__init__`
     @overload  # matrix-like (known dtype), dtype: None
@@ -13,6 +13,7 @@ import optype.numpy.compat as npc
 
 from ._base import _spbase, sparray
 from ._coo import coo_array, coo_matrix
+from ._csr import csr_array, csr_matrix
 from ._index import IndexMixin
 from ._matrix import spmatrix
 from ._typing import _ToShape1D, _ToShape2D
@@ -177,6 +178,9 @@ class dok_array(_dok_base[_ScalarT_co, _ShapeT_co], sparray[_ScalarT_co, _ShapeT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> dok_array[Any, _ShapeT_co]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_array[np.bool, _ShapeT_co]: ...
 
     # NOTE: keep the 2d overloads in sync with `dok_matrix.__init__`
     # TODO(jorenham): Overloads for specific shape types.
@@ -570,6 +574,9 @@ class dok_matrix(_dok_base[_ScalarT_co, _2D], spmatrix[_ScalarT_co], Generic[_Sc
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> dok_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_matrix[np.bool]: ...
 
     #
     @property
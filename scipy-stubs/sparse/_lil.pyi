@@ -9,7 +9,7 @@ import optype.numpy.compat as npc
 
 from ._base import _spbase, sparray
 from ._coo import coo_array, coo_matrix
-from ._csr import csr_matrix
+from ._csr import csr_array, csr_matrix
 from ._index import IndexMixin
 from ._matrix import spmatrix
 from ._typing import _ToShape2D
@@ -94,6 +94,9 @@ class lil_array(_lil_base[_ScalarT_co], sparray[_ScalarT_co, tuple[int, int]], G
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> lil_array[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_array[np.bool, tuple[int, int]]: ...
 
     # NOTE: keep the in sync with `lil_matrix.__init__`
     @overload  # matrix-like (known dtype), dtype: None
@@ -300,6 +303,9 @@ class lil_matrix(_lil_base[_ScalarT_co], spmatrix[_ScalarT_co], Generic[_ScalarT
     @override
     @type_check_only
     def __assoc_as_any__(self, /) -> lil_matrix[Any]: ...
+    @override
+    @type_check_only
+    def __assoc_compared__(self, /) -> csr_matrix[np.bool]: ...
 
     # NOTE: keep the in sync with `lil_array.__init__`
     @overload  # matrix-like (known dtype), dtype: None
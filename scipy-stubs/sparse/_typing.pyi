@@ -8,7 +8,7 @@ import optype.numpy.compat as npc
 from ._base import _spbase, sparray
 from ._matrix import spmatrix
 
-__all__ = "_CanAsAny", "_CanStack", "_CanStackAs", "_Format", "_Sparse2D", "_ToShape1D", "_ToShape2D"
+__all__ = "_CanAsAny", "_CanCompare", "_CanStack", "_CanStackAs", "_Format", "_Sparse2D", "_ToShape1D", "_ToShape2D"
 
 ###
 
@@ -46,3 +46,10 @@ class _CanStackAs(Protocol[_ScalarT_contra, _AssocT_co]):
 class _CanAsAny(Protocol[_AssocT_co]):
     @type_check_only
     def __assoc_as_any__(self, /) -> _AssocT_co: ...
+
+# `csr` or `csc` kind, `np.bool` scalar-type, same shape-type
+@final
+@type_check_only
+class _CanCompare(Protocol[_AssocT_co]):
+    @type_check_only
+    def __assoc_compared__(self, /) -> _AssocT_co: ...
@@ -612,7 +612,7 @@ class _UFuncWithout1out(_UFuncWithoutAt, _UFuncWithoutIdentity): ...
 class _UFuncWithout2in1out(_UFuncWithoutAt, _UFuncWithout2in): ...
 
 @type_check_only
-class _UFunc11(_UFuncWithout2in, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc11(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[1]: ...
@@ -624,7 +624,7 @@ class _UFunc11(_UFuncWithout2in, _UFunc[_NameT_co, _IdentityT_co], Generic[_Name
     def nargs(self, /) -> L[2]: ...
 
 @type_check_only
-class _UFunc12(_UFuncWithout2in, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc12(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[1]: ...
@@ -636,7 +636,7 @@ class _UFunc12(_UFuncWithout2in, _UFunc[_NameT_co, _IdentityT_co], Generic[_Name
     def nargs(self, /) -> L[3]: ...
 
 @type_check_only
-class _UFunc14(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc14(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[1]: ...
@@ -660,8 +660,7 @@ class _UFunc21(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_c
     def nargs(self, /) -> L[3]: ...
 
 @type_check_only
-class _UFunc22(_UFuncWithout1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
-    # NOTE: supports outer
+class _UFunc22(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[2]: ...
@@ -673,8 +672,7 @@ class _UFunc22(_UFuncWithout1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_Nam
     def nargs(self, /) -> L[4]: ...
 
 @type_check_only
-class _UFunc24(_UFuncWithout1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
-    # NOTE: supports outer
+class _UFunc24(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[2]: ...
@@ -686,7 +684,7 @@ class _UFunc24(_UFuncWithout1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_Nam
     def nargs(self, /) -> L[6]: ...
 
 @type_check_only
-class _UFunc31(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc31(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[3]: ...
@@ -698,7 +696,7 @@ class _UFunc31(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_
     def nargs(self, /) -> L[4]: ...
 
 @type_check_only
-class _UFunc32(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc32(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[3]: ...
@@ -710,7 +708,7 @@ class _UFunc32(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_
     def nargs(self, /) -> L[5]: ...
 
 @type_check_only
-class _UFunc41(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc41(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[4]: ...
@@ -722,7 +720,7 @@ class _UFunc41(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_
     def nargs(self, /) -> L[5]: ...
 
 @type_check_only
-class _UFunc42(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc42(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[4]: ...
@@ -734,7 +732,7 @@ class _UFunc42(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_
     def nargs(self, /) -> L[6]: ...
 
 @type_check_only
-class _UFunc52(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc52(_UFunc[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def nin(self, /) -> L[5]: ...
@@ -747,7 +745,7 @@ class _UFunc52(_UFuncWithout2in1out, _UFunc[_NameT_co, _IdentityT_co], Generic[_
 
 @final
 @type_check_only
-class _UFunc11f(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc11f(_UFuncWithout2in, _UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2]: ...
@@ -778,7 +776,7 @@ class _UFunc11f(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc11g(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc11g(_UFuncWithout2in, _UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[3]: ...
@@ -809,7 +807,7 @@ class _UFunc11g(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 # NOTE: `_UFunc11g` with `d->d` first: only an exact `float32` selects `f->f`, anything narrower promotes to `float64`.
 @final
 @type_check_only
-class _UFunc11dfg(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc11dfg(_UFuncWithout2in, _UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[3]: ...
@@ -835,7 +833,7 @@ class _UFunc11dfg(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identi
 
 @final
 @type_check_only
-class _UFunc11c(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc11c(_UFuncWithout2in, _UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2]: ...
@@ -857,7 +855,7 @@ class _UFunc11c(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc11fc(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc11fc(_UFuncWithout2in, _UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[4]: ...
@@ -887,7 +885,7 @@ class _UFunc11fc(_UFunc11[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identit
 
 @final
 @type_check_only
-class _UFunc12f(_UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc12f(_UFuncWithout2in1out, _UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # for `it[2]i0k0` and `it[2]j0y0`
     @property
     @override
@@ -913,7 +911,7 @@ class _UFunc12f(_UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc12c(_UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc12c(_UFuncWithout2in1out, _UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `modfresnel{m,p}`
     @property
     @override
@@ -937,7 +935,7 @@ class _UFunc12c(_UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc12fc(_UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc12fc(_UFuncWithout2in1out, _UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `fresnel`, `sici`, `shichi`
     @property
     @override
@@ -967,7 +965,7 @@ class _UFunc12fc(_UFunc12[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identit
 
 @final
 @type_check_only
-class _UFunc14f(_UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc14f(_UFuncWithout2in1out, _UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `itairy`
     @property
     @override
@@ -993,7 +991,7 @@ class _UFunc14f(_UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc14c(_UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc14c(_UFuncWithout2in1out, _UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `kelvin`
     @property
     @override
@@ -1017,7 +1015,7 @@ class _UFunc14c(_UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc14fc(_UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc14fc(_UFuncWithout2in1out, _UFunc14[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `airy[e]`
     @property
     @override
@@ -1588,7 +1586,7 @@ class _UFunc21fc2(_UFunc21[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identi
 
 @final
 @type_check_only
-class _UFunc22f(_UFunc22[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc22f(_UFuncWithout1out, _UFunc22[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `pb{dv,vv,wa}`
     @property
     @override
@@ -1604,10 +1602,6 @@ class _UFunc22f(_UFunc22[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
     @overload
     def __call__[ST: _Float_D](self, v: ST, x: _ToFloat32, /, out: _None2 = ..., **kw: Unpack[_KwBase]) -> _Tuple2[ST]: ...
     @overload
-    def __call__(
-        self, v: onp.ToFloat64_ND, x: onp.ToFloat64_ND, /, out: _None2 = ..., **kw: Unpack[_Kw22f]
-    ) -> _Tuple2[_FloatND]: ...
-    @overload
     def __call__(
         self, v: _ToFloat64OrND, x: onp.ToFloat64_ND, /, out: _None2 = ..., **kw: Unpack[_Kw22f]
     ) -> _Tuple2[_FloatND]: ...
@@ -1642,7 +1636,7 @@ class _UFunc22f(_UFunc22[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc24f(_UFunc24[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc24f(_UFuncWithout1out, _UFunc24[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `ellipj`
     @property
     @override
@@ -1692,13 +1686,15 @@ class _UFunc24f(_UFunc24[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc31f(_UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc31f(_UFuncWithout2in1out, _UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2, 3]: ...
     @property
     @override
-    def types(self, /) -> list[L["fff->f", "lld->d", "ddd->d"]] | list[L["fff->f", "dld->d", "ddd->d"]]: ...
+    def types(
+        self, /
+    ) -> list[L["fff->f", "lld->d", "ddd->d"]] | list[L["fff->f", "dld->d", "ddd->d"]] | list[L["fff->f", "ddd->d"]]: ...
     #
     @overload
     def __call__(
@@ -1735,14 +1731,16 @@ class _UFunc31f(_UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc31fc1(_UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc31fc1(_UFuncWithout2in1out, _UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `eval_{gegenbauer,genlaguerre}` and `hyp1f1`
     @property
     @override
-    def ntypes(self, /) -> L[3, 4]: ...
+    def ntypes(self, /) -> L[4, 5]: ...
     @property
     @override
-    def types(self, /) -> list[L["fff->f", "ldd->d", "ddd->d", "ffF->F", "ddD->D"]]: ...
+    def types(
+        self, /
+    ) -> list[L["fff->f", "ldd->d", "ddd->d", "ffF->F", "ddD->D"]] | list[L["fff->f", "ddd->d", "ffF->F", "ddD->D"]]: ...
     #
     @overload
     def __call__(
@@ -1799,7 +1797,7 @@ class _UFunc31fc1(_UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identi
 
 @final
 @type_check_only
-class _UFunc31fc3(_UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc31fc3(_UFuncWithout2in1out, _UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `ellipr{d,f,g}``
     @property
     @override
@@ -1859,7 +1857,7 @@ class _UFunc31fc3(_UFunc31[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identi
 
 @final
 @type_check_only
-class _UFunc32f(_UFunc32[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc32f(_UFuncWithout2in1out, _UFunc32[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2]: ...
@@ -1906,7 +1904,7 @@ class _UFunc32f(_UFunc32[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc41f(_UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc41f(_UFuncWithout2in1out, _UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2]: ...
@@ -2027,14 +2025,16 @@ class _UFunc41f(_UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc41fc1(_UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc41fc1(_UFuncWithout2in1out, _UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `eval_[sh_]jacobi` and `hyp2f1`
     @property
     @override
     def ntypes(self, /) -> L[4, 5]: ...
     @property
     @override
-    def types(self, /) -> list[L["ffff->f", "lddd->d", "dddd->d", "fffF->F", "dddD->D"]]: ...
+    def types(
+        self, /
+    ) -> list[L["ffff->f", "lddd->d", "dddd->d", "fffF->F", "dddD->D"]] | list[L["ffff->f", "dddd->d", "fffF->F", "dddD->D"]]: ...
     #
     @overload
     def __call__(
@@ -2166,7 +2166,7 @@ class _UFunc41fc1(_UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identi
 
 @final
 @type_check_only
-class _UFunc41fc4(_UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc41fc4(_UFuncWithout2in1out, _UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     # `elliprj``
     @property
     @override
@@ -2336,7 +2336,7 @@ class _UFunc41fc4(_UFunc41[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identi
 
 @final
 @type_check_only
-class _UFunc42f(_UFunc42[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc42f(_UFuncWithout2in1out, _UFunc42[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2]: ...
@@ -2434,7 +2434,7 @@ class _UFunc42f(_UFunc42[_NameT_co, _IdentityT_co], Generic[_NameT_co, _Identity
 
 @final
 @type_check_only
-class _UFunc52f(_UFunc52[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
+class _UFunc52f(_UFuncWithout2in1out, _UFunc52[_NameT_co, _IdentityT_co], Generic[_NameT_co, _IdentityT_co]):  # type: ignore[misc]
     @property
     @override
     def ntypes(self, /) -> L[2]: ...
@@ -2640,9 +2640,6 @@ class errstate(ExitMixin):
 
 ###
 
-# l->l
-_sf_error_test_function: np.ufunc  # undocumented
-
 # f->f; d->d
 _cosine_cdf: _UFunc11f[L["_cosine_cdf"], L[0]] = ...  # undocumented
 _cosine_invcdf: _UFunc11f[L["_cosine_invcdf"], L[0]] = ...  # undocumented
@@ -2652,42 +2649,42 @@ _kolmogci: _UFunc11f[L["_kolmogci"], L[0]] = ...  # undocumented
 _kolmogp: _UFunc11f[L["_kolmogp"], L[0]] = ...  # undocumented
 _lanczos_sum_expg_scaled: _UFunc11f[L["_lanczos_sum_expg_scaled"], L[0]] = ...  # undocumented
 _lgam1p: _UFunc11f[L["_lgam1p"], L[0]] = ...  # undocumented
-_log1pmx: _UFunc11f[L["_log1pmx"], L[0]] = ...  # undocumented
+_log1pmx: _UFunc11f[L["_log1pmx"]] = ...  # undocumented
 _scaled_exp1: _UFunc11f[L["_scaled_exp1"]] = ...  # undocumented
 round: _UFunc11f[L["round"], L[0]] = ...
-cbrt: _UFunc11f[L["cbrt"], L[0]] = ...
-cosm1: _UFunc11f[L["cosm1"], L[0]] = ...
-exp2: _UFunc11f[L["exp2"], L[0]] = ...
-exp10: _UFunc11f[L["exp10"], L[0]] = ...
+cbrt: _UFunc11f[L["cbrt"]] = ...
+cosm1: _UFunc11f[L["cosm1"]] = ...
+exp2: _UFunc11f[L["exp2"]] = ...
+exp10: _UFunc11f[L["exp10"]] = ...
 exprel: _UFunc11f[L["exprel"]] = ...
 gammaln: _UFunc11f[L["gammaln"]] = ...
-gammasgn: _UFunc11f[L["gammasgn"], L[0]] = ...
-cosdg: _UFunc11f[L["cosdg"], L[0]] = ...
-cotdg: _UFunc11f[L["cotdg"], L[0]] = ...
-sindg: _UFunc11f[L["sindg"], L[0]] = ...
-tandg: _UFunc11f[L["tandg"], L[0]] = ...
-ellipe: _UFunc11f[L["ellipe"], L[0]] = ...
-ellipk: _UFunc11f[L["ellipk"], L[0]] = ...
-ellipkm1: _UFunc11f[L["ellipkm1"], L[0]] = ...
+gammasgn: _UFunc11f[L["gammasgn"]] = ...
+cosdg: _UFunc11f[L["cosdg"]] = ...
+cotdg: _UFunc11f[L["cotdg"]] = ...
+sindg: _UFunc11f[L["sindg"]] = ...
+tandg: _UFunc11f[L["tandg"]] = ...
+ellipe: _UFunc11f[L["ellipe"]] = ...
+ellipk: _UFunc11f[L["ellipk"]] = ...
+ellipkm1: _UFunc11f[L["ellipkm1"]] = ...
 entr: _UFunc11f[L["entr"], L[0]] = ...
 erfinv: _UFunc11f[L["erfinv"], L[0]] = ...
 erfcinv: _UFunc11f[L["erfcinv"], L[0]] = ...
-i0: _UFunc11f[L["i0"], L[0]] = ...
-i0e: _UFunc11f[L["i0e"], L[0]] = ...
-i1: _UFunc11f[L["i1"], L[0]] = ...
-i1e: _UFunc11f[L["i1e"], L[0]] = ...
-j0: _UFunc11f[L["j0"], L[0]] = ...
-j1: _UFunc11f[L["j1"], L[0]] = ...
-y0: _UFunc11f[L["y0"], L[0]] = ...
-y1: _UFunc11f[L["y1"], L[0]] = ...
-k0: _UFunc11f[L["k0"], L[0]] = ...
-k0e: _UFunc11f[L["k0e"], L[0]] = ...
-k1: _UFunc11f[L["k1"], L[0]] = ...
+i0: _UFunc11f[L["i0"]] = ...
+i0e: _UFunc11f[L["i0e"]] = ...
+i1: _UFunc11f[L["i1"]] = ...
+i1e: _UFunc11f[L["i1e"]] = ...
+j0: _UFunc11f[L["j0"]] = ...
+j1: _UFunc11f[L["j1"]] = ...
+y0: _UFunc11f[L["y0"]] = ...
+y1: _UFunc11f[L["y1"]] = ...
+k0: _UFunc11f[L["k0"]] = ...
+k0e: _UFunc11f[L["k0e"]] = ...
+k1: _UFunc11f[L["k1"]] = ...
 bei: _UFunc11f[L["bei"]] = ...
 beip: _UFunc11f[L["beip"]] = ...
 ber: _UFunc11f[L["ber"]] = ...
 berp: _UFunc11f[L["berp"]] = ...
-k1e: _UFunc11f[L["k1e"], L[0]] = ...
+k1e: _UFunc11f[L["k1e"]] = ...
 kei: _UFunc11f[L["kei"]] = ...
 keip: _UFunc11f[L["keip"]] = ...
 ker: _UFunc11f[L["ker"]] = ...
@@ -2699,73 +2696,77 @@ kolmogi: _UFunc11f[L["kolmogi"], L[0]] = ...
 kolmogorov: _UFunc11f[L["kolmogorov"], L[0]] = ...
 ndtri: _UFunc11f[L["ndtri"], L[0]] = ...
 ndtri_exp: _UFunc11f[L["ndtri_exp"], L[0]] = ...
-zetac: _UFunc11f[L["zetac"], L[0]] = ...
-
-# d->d; f->f; g->g
-logit: _UFunc11dfg[L["logit"]] = ...
+zetac: _UFunc11f[L["zetac"]] = ...
+_log1mexp: _UFunc11f[L["_log1mexp"]] = ...  # undocumented
 
 # f->f; d->d; g->g
 expit: _UFunc11g[L["expit"]] = ...
 log_expit: _UFunc11g[L["log_expit"]] = ...
 
+# d->d; f->f; g->g
+logit: _UFunc11dfg[L["logit"]] = ...
+
 # F->F; D->D
-wofz: _UFunc11c[L["wofz"], L[0]] = ...
+wofz: _UFunc11c[L["wofz"]] = ...
 
 # f->f; d->d; F->F; D->D
 _cospi: _UFunc11fc[L["_cospi"]] = ...  # undocumented
 _sinpi: _UFunc11fc[L["_sinpi"]] = ...  # undocumented
-_riemann_zeta: _UFunc11fc[L["_riemann_zeta"], L[0]] = ...  # undocumented
-dawsn: _UFunc11fc[L["dawsn"], L[0]] = ...
-erf: _UFunc11fc[L["erf"], L[0]] = ...
-erfi: _UFunc11fc[L["erfi"], L[0]] = ...
-erfc: _UFunc11fc[L["erfc"], L[0]] = ...
-erfcx: _UFunc11fc[L["erfcx"], L[0]] = ...
+_riemann_zeta: _UFunc11fc[L["_riemann_zeta"]] = ...  # undocumented
+dawsn: _UFunc11fc[L["dawsn"]] = ...
+erf: _UFunc11fc[L["erf"]] = ...
+erfi: _UFunc11fc[L["erfi"]] = ...
+erfc: _UFunc11fc[L["erfc"]] = ...
+erfcx: _UFunc11fc[L["erfcx"]] = ...
 exp1: _UFunc11fc[L["exp1"]] = ...
 expi: _UFunc11fc[L["expi"]] = ...
 gamma: _UFunc11fc[L["gamma"]] = ...
 rgamma: _UFunc11fc[L["rgamma"]] = ...
 loggamma: _UFunc11fc[L["loggamma"]] = ...
-expm1: _UFunc11fc[L["expm1"], L[0]] = ...
-log1p: _UFunc11fc[L["log1p"], L[0]] = ...
-ndtr: _UFunc11fc[L["ndtr"], L[0]] = ...
-log_ndtr: _UFunc11fc[L["log_ndtr"], L[0]] = ...
+expm1: _UFunc11fc[L["expm1"]] = ...
+log1p: _UFunc11fc[L["log1p"]] = ...
+ndtr: _UFunc11fc[L["ndtr"]] = ...
+log_ndtr: _UFunc11fc[L["log_ndtr"]] = ...
 psi: _UFunc11fc[L["psi"]] = ...
 spence: _UFunc11fc[L["spence"], L[0]] = ...
 wrightomega: _UFunc11fc[L["wrightomega"], L[0]] = ...
 
+# l->l
+_sf_error_test_function: np.ufunc = ...  # undocumented
+
 # f->ff; d->dd
 iti0k0: _UFunc12f[L["iti0k0"]] = ...
 itj0y0: _UFunc12f[L["itj0y0"]] = ...
 it2i0k0: _UFunc12f[L["it2i0k0"]] = ...
 it2j0y0: _UFunc12f[L["it2j0y0"]] = ...
 
-# f->ff; d->dd; f->FF; D->DD
-sici: _UFunc12fc[L["sici"], L[0]] = ...
-shichi: _UFunc12fc[L["shichi"], L[0]] = ...
-fresnel: _UFunc12fc[L["fresnel"]] = ...
-
 # f->FF; d->DD
 modfresnelm: _UFunc12c[L["modfresnelm"]] = ...
 modfresnelp: _UFunc12c[L["modfresnelp"]] = ...
 
+# f->ff; d->dd; F->FF; D->DD
+sici: _UFunc12fc[L["sici"], L[0]] = ...
+shichi: _UFunc12fc[L["shichi"], L[0]] = ...
+fresnel: _UFunc12fc[L["fresnel"]] = ...
+
 # f->ffff; d->dddd
 itairy: _UFunc14f[L["itairy"]] = ...
 
+# f->FFFF; d->DDDD
+kelvin: _UFunc14c[L["kelvin"]] = ...
+
 # f->ffff; d->dddd; F->FFFF; D->DDDD
 airy: _UFunc14fc[L["airy"]] = ...
 airye: _UFunc14fc[L["airye"]] = ...
 
-# f->FFFF; d->DDDD
-kelvin: _UFunc14c[L["kelvin"]] = ...
-
 # ld->d
 eval_hermite: _UFunc21ld[L["eval_hermite"], L[0]] = ...
 eval_hermitenorm: _UFunc21ld[L["eval_hermitenorm"], L[0]] = ...
 
 # ff->f; (l|d)d->d
 _igam_fac: _UFunc21f[L["_igam_fac"], L[0]] = ...  # undocumented
-_iv_ratio: _UFunc21f[L["_iv_ratio"], L[0]] = ...  # undocumented
-_iv_ratio_c: _UFunc21f[L["_iv_ratio_c"], L[0]] = ...  # undocumented
+_iv_ratio: _UFunc21f[L["_iv_ratio"]] = ...  # undocumented
+_iv_ratio_c: _UFunc21f[L["_iv_ratio_c"]] = ...  # undocumented
 _nbinom_mean: _UFunc21f[L["_nbinom_mean"], L[0]] = ...  # undocumented
 _nbinom_variance: _UFunc21f[L["_nbinom_variance"], L[0]] = ...  # undocumented
 _nbinom_skewness: _UFunc21f[L["_nbinom_skewness"], L[0]] = ...  # undocumented
@@ -2774,30 +2775,30 @@ _nct_mean: _UFunc21f[L["_nct_mean"], L[0]] = ...  # undocumented
 _nct_variance: _UFunc21f[L["_nct_variance"], L[0]] = ...  # undocumented
 _nct_skewness: _UFunc21f[L["_nct_skewness"], L[0]] = ...  # undocumented
 _nct_kurtosis_excess: _UFunc21f[L["_nct_kurtosis_excess"], L[0]] = ...  # undocumented
-_stirling2_inexact: _UFunc21f[L["_stirling2_inexact"]] = ...  # undocumented
+_stirling2_inexact: _UFunc21f[L["_stirling2_inexact"], L[0]] = ...  # undocumented
 powm1: _UFunc21f[L["powm1"], L[0]] = ...
 binom: _UFunc21f[L["binom"]] = ...
-beta: _UFunc21f[L["beta"], L[0]] = ...
-betaln: _UFunc21f[L["betaln"], L[0]] = ...
-gammainc: _UFunc21f[L["gammainc"], L[0]] = ...
-gammaincinv: _UFunc21f[L["gammaincinv"], L[0]] = ...
-gammaincc: _UFunc21f[L["gammaincc"], L[0]] = ...
-gammainccinv: _UFunc21f[L["gammainccinv"], L[0]] = ...
+beta: _UFunc21f[L["beta"]] = ...
+betaln: _UFunc21f[L["betaln"]] = ...
+gammainc: _UFunc21f[L["gammainc"]] = ...
+gammaincinv: _UFunc21f[L["gammaincinv"]] = ...
+gammaincc: _UFunc21f[L["gammaincc"]] = ...
+gammainccinv: _UFunc21f[L["gammainccinv"]] = ...
 poch: _UFunc21f[L["poch"], L[0]] = ...
 boxcox: _UFunc21f[L["boxcox"], L[0]] = ...
 inv_boxcox: _UFunc21f[L["inv_boxcox"], L[0]] = ...
 boxcox1p: _UFunc21f[L["boxcox1p"], L[0]] = ...
 inv_boxcox1p: _UFunc21f[L["inv_boxcox1p"], L[0]] = ...
 expn: _UFunc21f[L["expn"], L[0]] = ...
-ellipeinc: _UFunc21f[L["ellipeinc"], L[0]] = ...
-ellipkinc: _UFunc21f[L["ellipkinc"], L[0]] = ...
+ellipeinc: _UFunc21f[L["ellipeinc"]] = ...
+ellipkinc: _UFunc21f[L["ellipkinc"]] = ...
 agm: _UFunc21f[L["agm"], L[0]] = ...
 huber: _UFunc21f[L["huber"], L[0]] = ...
 pseudo_huber: _UFunc21f[L["pseudo_huber"], L[0]] = ...
 mathieu_a: _UFunc21f[L["mathieu_a"]] = ...
 mathieu_b: _UFunc21f[L["mathieu_b"]] = ...
-struve: _UFunc21f[L["struve"], L[0]] = ...
-modstruve: _UFunc21f[L["modstruve"], L[0]] = ...
+struve: _UFunc21f[L["struve"]] = ...
+modstruve: _UFunc21f[L["modstruve"]] = ...
 owens_t: _UFunc21f[L["owens_t"], L[0]] = ...
 kl_div: _UFunc21f[L["kl_div"], L[0]] = ...
 rel_entr: _UFunc21f[L["rel_entr"], L[0]] = ...
@@ -2848,6 +2849,11 @@ jve: _UFunc21fc1[L["jve"]] = ...
 kve: _UFunc21fc1[L["kve"]] = ...
 yve: _UFunc21fc1[L["yve"]] = ...
 
+# ff->f; dd->d; FF->F; DD->D
+xlogy: _UFunc21fc2[L["xlogy"]] = ...
+xlog1py: _UFunc21fc2[L["xlog1py"]] = ...
+elliprc: _UFunc21fc2[L["elliprc"], L[0]] = ...
+
 # lf->f; ld->d; lF->F; lD->D
 _spherical_in: np.ufunc = ...  # undocumented
 _spherical_in_d: np.ufunc = ...  # undocumented
@@ -2858,14 +2864,12 @@ _spherical_kn_d: np.ufunc = ...  # undocumented
 _spherical_yn: np.ufunc = ...  # undocumented
 _spherical_yn_d: np.ufunc = ...  # undocumented
 
-# ff->f; dd->d; FF->F; DD->D
-xlogy: _UFunc21fc2[L["xlogy"], L[0]] = ...
-xlog1py: _UFunc21fc2[L["xlog1py"], L[0]] = ...
-elliprc: _UFunc21fc2[L["elliprc"], L[0]] = ...
-
-# ff->f; dd->d; Ff->F; Dd->D
+# ff->f; Ff->F; dd->d; Dd->D
 _zeta: np.ufunc = ...
 
+# ld->d; qd->d; dd->d
+_gen_harmonic: np.ufunc = ...  # undocumented
+
 # ff->ff; dd->dd
 pbdv: _UFunc22f[L["pbdv"]] = ...
 pbvv: _UFunc22f[L["pbvv"]] = ...
@@ -2874,11 +2878,6 @@ pbwa: _UFunc22f[L["pbwa"]] = ...
 # ff->ffff; dd->dddd
 ellipj: _UFunc24f[L["ellipj"]] = ...
 
-# ddl->dd
-_struve_asymp_large_z: np.ufunc = ...  # undocumented
-_struve_bessel_series: np.ufunc = ...  # undocumented
-_struve_power_series: np.ufunc = ...  # undocumented
-
 # fff->f; (ll|dl|dd)d->d
 _beta_pdf: _UFunc31f[L["_beta_pdf"], L[0]] = ...  # undocumented
 _beta_ppf: _UFunc31f[L["_beta_ppf"], L[0]] = ...  # undocumented
@@ -2908,24 +2907,20 @@ _ncf_mean: _UFunc31f[L["_ncf_mean"], L[0]] = ...  # undocumented
 _ncf_variance: _UFunc31f[L["_ncf_variance"], L[0]] = ...  # undocumented
 _ncf_skewness: _UFunc31f[L["_ncf_skewness"], L[0]] = ...  # undocumented
 _ncf_kurtosis_excess: _UFunc31f[L["_ncf_kurtosis_excess"], L[0]] = ...  # undocumented
-_nct_cdf: _UFunc31f[L["_nct_cdf"], L[0]] = ...  # undocumented
-_nct_ppf: _UFunc31f[L["_nct_ppf"], L[0]] = ...  # undocumented
 _nct_sf: _UFunc31f[L["_nct_sf"], L[0]] = ...  # undocumented
 _nct_isf: _UFunc31f[L["_nct_isf"], L[0]] = ...  # undocumented
 _ncx2_pdf: _UFunc31f[L["_ncx2_pdf"], L[0]] = ...  # undocumented
-_ncx2_cdf: _UFunc31f[L["_ncx2_cdf"], L[0]] = ...  # undocumented
-_ncx2_ppf: _UFunc31f[L["_ncx2_ppf"], L[0]] = ...  # undocumented
 _ncx2_sf: _UFunc31f[L["_ncx2_sf"], L[0]] = ...  # undocumented
 _ncx2_isf: _UFunc31f[L["_ncx2_isf"], L[0]] = ...  # undocumented
-radian: _UFunc31f[L["radian"], L[0]] = ...
+radian: _UFunc31f[L["radian"]] = ...
 lpmv: _UFunc31f[L["lpmv"], L[0]] = ...
 hyperu: _UFunc31f[L["hyperu"], L[0]] = ...
-besselpoly: _UFunc31f[L["besselpoly"], L[0]] = ...
+besselpoly: _UFunc31f[L["besselpoly"]] = ...
 obl_cv: _UFunc31f[L["obl_cv"]] = ...
 pro_cv: _UFunc31f[L["pro_cv"]] = ...
 wright_bessel: _UFunc31f[L["wright_bessel"]] = ...
 log_wright_bessel: _UFunc31f[L["log_wright_bessel"]] = ...
-voigt_profile: _UFunc31f[L["voigt_profile"], L[0]] = ...
+voigt_profile: _UFunc31f[L["voigt_profile"]] = ...
 bdtr: _UFunc31f[L["bdtr"], L[0]] = ...
 bdtrc: _UFunc31f[L["bdtrc"], L[0]] = ...
 bdtri: _UFunc31f[L["bdtri"], L[0]] = ...
@@ -2961,6 +2956,8 @@ nctdtrinc: _UFunc31f[L["nctdtrinc"], L[0]] = ...
 nctdtrit: _UFunc31f[L["nctdtrit"], L[0]] = ...
 nrdtrimn: _UFunc31f[L["nrdtrimn"], L[0]] = ...
 nrdtrisd: _UFunc31f[L["nrdtrisd"], L[0]] = ...
+_bivariate_normal_cdf: _UFunc31f[L["_bivariate_normal_cdf"]] = ...  # undocumented
+_nct_pdf: _UFunc31f[L["_nct_pdf"], L[0]] = ...  # undocumented
 
 # fff->f; (l|d)dd->d; ffF->F; ddD->D
 eval_gegenbauer: _UFunc31fc1[L["eval_gegenbauer"], L[0]] = ...
@@ -2972,7 +2969,7 @@ elliprd: _UFunc31fc3[L["elliprd"], L[0]] = ...
 elliprf: _UFunc31fc3[L["elliprf"], L[0]] = ...
 elliprg: _UFunc31fc3[L["elliprg"], L[0]] = ...
 
-# Flf->F; Dld->D
+# Dld->D; Flf->F
 _lambertw: np.ufunc = ...
 
 # fff->ff; ddd->dd
@@ -2983,13 +2980,16 @@ mathieu_modcem2: _UFunc32f[L["mathieu_modcem2"]] = ...
 mathieu_modsem1: _UFunc32f[L["mathieu_modsem1"]] = ...
 mathieu_modsem2: _UFunc32f[L["mathieu_modsem2"]] = ...
 
+# ddl->dd
+_struve_asymp_large_z: np.ufunc = ...  # undocumented
+_struve_bessel_series: np.ufunc = ...  # undocumented
+_struve_power_series: np.ufunc = ...  # undocumented
+
 # ffff->f; dddd->d
 _hypergeom_pmf: _UFunc41f[L["_hypergeom_pmf"], L[0]] = ...  # undocumented
 _hypergeom_cdf: _UFunc41f[L["_hypergeom_cdf"], L[0]] = ...  # undocumented
 _hypergeom_sf: _UFunc41f[L["_hypergeom_sf"], L[0]] = ...  # undocumented
 _ncf_pdf: _UFunc41f[L["_ncf_pdf"], L[0]] = ...  # undocumented
-_ncf_cdf: _UFunc41f[L["_ncf_cdf"], L[0]] = ...  # undocumented
-_ncf_ppf: _UFunc41f[L["_ncf_ppf"], L[0]] = ...  # undocumented
 _ncf_sf: _UFunc41f[L["_ncf_sf"], L[0]] = ...  # undocumented
 _ncf_isf: _UFunc41f[L["_ncf_isf"], L[0]] = ...  # undocumented
 _skewnorm_cdf: _UFunc41f[L["_skewnorm_cdf"], L[0]] = ...  # undocumented
@@ -3009,6 +3009,9 @@ hyp2f1: _UFunc41fc1[L["hyp2f1"]] = ...
 # ffff->f; dddd->d; FFFF->F; DDDD->D
 elliprj: _UFunc41fc4[L["elliprj"], L[0]] = ...
 
+# llld->d; qqqd->d; dddd->d
+_normalized_gen_harmonic: np.ufunc = ...  # undocumented
+
 # ffff->ff; dddd->dd
 obl_ang1: _UFunc42f[L["obl_ang1"]] = ...
 pro_ang1: _UFunc42f[L["pro_ang1"]] = ...
@@ -3025,5 +3028,5 @@ pro_rad1_cv: _UFunc52f[L["pro_rad1_cv"]] = ...
 obl_rad2_cv: _UFunc52f[L["obl_rad2_cv"]] = ...
 pro_rad2_cv: _UFunc52f[L["pro_rad2_cv"]] = ...
 
-# fffffff->f; dd(ll|dd)ddd->d
+# fffffff->f; ddllddd->d; ddddddd->d
 _ellip_harm: np.ufunc = ...  # undocumented
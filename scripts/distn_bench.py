@@ -0,0 +1,210 @@
+"""
+Benchmark how long the type-checkers take to check calls to the methods of the
+`scipy.stats` distributions.
+
+A probe module is generated that makes the given number of distribution method calls,
+which cycle through distributions with zero, one, and two shape parameters, and through
+the scalar- and array-valued methods. The time it takes to check it is compared to that
+of a probe with only its imports, so that the difference is the cost of the calls alone.
+
+For the checkers with a persistent cache (mypy), the cache is warmed once by checking a
+module with the same imports, and each measurement starts from a copy of it. That way
+the stubs are not re-analyzed in every run, and only the probes themselves are checked.
+
+The results can be written as JSON with `--output`, and compared against those of an
+earlier run (e.g. before a change to the stubs) with `--baseline`.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import itertools
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final, TypedDict
+
+from typecheck_bench import CACHED_CHECKERS, CHECKERS, Checker, checker_command, measure
+
+_HEADER: Final = """\
+import numpy as np
+import optype.numpy as onp
+
+from scipy import stats
+
+x: float
+q: float
+k: int
+xs: onp.Array1D[np.float64]
+qs: onp.Array2D[np.float64]
+"""
+
+# (distribution, shape arguments)
+_DISTRIBUTIONS: Final = (
+    ("norm", ""),
+    ("expon", ""),
+    ("logistic", ""),
+    ("gamma", "2.0, "),
+    ("t", "5.0, "),
+    ("beta", "2.0, 3.0, "),
+)
+_DISCRETE: Final = (("poisson", "3.0, "), ("binom", "10, 0.5, "))
+
+# the method calls, with `{}` as placeholder for the shape arguments
+_METHODS: Final = (
+    "pdf(x, {}loc=1.0, scale=2.0)",
+    "logpdf(xs, {})",
+    "cdf(x, {})",
+    "sf(xs, {}scale=2.0)",
+    "ppf(q, {})",
+    "isf(qs, {}loc=1.0)",
+    "mean({})",
+    "var({}loc=1.0)",
+    "stats({}moments='mvsk')",
+    "interval(0.9, {})",
+    "rvs({}size=10)",
+    "freeze({}).pdf(x)",
+)
+_DISCRETE_METHODS: Final = (
+    "pmf(k, {})",
+    "cdf(k, {})",
+    "sf(k, {}loc=1)",
+    "ppf(q, {})",
+    "mean({})",
+    "rvs({}size=10)",
+)
+
+
+class _Result(TypedDict):
+    probe: float
+    """Median time to check the imports only, in seconds."""
+    calls: float
+    """Median time to check the calls, without that of the imports, in seconds."""
+
+
+def _calls() -> list[str]:
+    calls = [
+        f"stats.{dist}.{method.format(args)}"
+        for method, (dist, args) in itertools.product(_METHODS, _DISTRIBUTIONS)
+    ]
+    calls += [
+        f"stats.{dist}.{method.format(args)}"
+        for method, (dist, args) in itertools.product(_DISCRETE_METHODS, _DISCRETE)
+    ]
+    return calls
+
+
+def synthetic_module(n_calls: int) -> str:
+    """A module with `n_calls` distribution method calls, split over functions."""
+    calls = itertools.islice(itertools.cycle(_calls()), n_calls)
+
+    lines = [_HEADER]
+    for i, batch in enumerate(itertools.batched(calls, 100)):
+        lines += ["", f"def calls_{i}() -> None:"]
+        lines += [f"    _ = {call}" for call in batch]
+    return "\n".join(lines) + "\n"
+
+
+def warm_cache(checker: Checker, /, *, work_dir: Path) -> Path | None:
+    """
+    The cache directory of the checker after checking the imports of the probes, or
+    `None` if the checker has no persistent cache.
+    """
+    if checker not in CACHED_CHECKERS:
+        return None
+
+    # a different module than the probes, so that those aren't cached themselves
+    warmup = work_dir / "warmup.py"
+    _ = warmup.write_text(_HEADER, encoding="utf-8")
+    cache_dir = work_dir / f"cache_{checker}"
+    _ = measure(checker_command(checker, [warmup], cache_dir=cache_dir))
+    return cache_dir
+
+
+def _timed(
+    checker: Checker, probe: Path, /, *, work_dir: Path, cache: Path | None, repeat: int
+) -> float:
+    times: list[float] = []
+    for i in range(repeat):
+        cache_dir = work_dir / f"cache_{checker}_{probe.stem}_{i}"
+        if cache is not None:
+            _ = shutil.copytree(cache, cache_dir)
+        times.append(
+            measure(checker_command(checker, [probe], cache_dir=cache_dir)).wall
+        )
+    return statistics.median(times)
+
+
+def bench(
+    checkers: Sequence[Checker], *, calls: int, repeat: int
+) -> dict[str, _Result]:
+    """Measure the time each checker takes to check the imports and the calls."""
+    results: dict[str, _Result] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        probe_imports = work_dir / "probe_imports.py"
+        _ = probe_imports.write_text(_HEADER, encoding="utf-8")
+        probe_calls = work_dir / "probe_calls.py"
+        _ = probe_calls.write_text(synthetic_module(calls), encoding="utf-8")
+
+        for checker in checkers:
+            cache = warm_cache(checker, work_dir=work_dir)
+            t_imports, t_calls = (
+                _timed(checker, probe, work_dir=work_dir, cache=cache, repeat=repeat)
+                for probe in (probe_imports, probe_calls)
+            )
+            results[checker] = {
+                "probe": round(t_imports, 3),
+                "calls": round(max(t_calls - t_imports, 0), 3),
+            }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the type-checking of scipy.stats distribution calls"
+    )
+    _ = parser.add_argument(
+        "--checker",
+        action="append",
+        choices=CHECKERS,
+        help="Type-checker to benchmark (default: all)",
+    )
+    _ = parser.add_argument(
+        "--calls", type=int, default=1000, help="Number of distribution method calls"
+    )
+    _ = parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per measurement"
+    )
+    _ = parser.add_argument("--output", type=Path, help="Output JSON file path")
+    _ = parser.add_argument(
+        "--baseline", type=Path, help="JSON file of a previous run to compare against"
+    )
+    args = parser.parse_args()
+
+    checkers: list[Checker] = args.checker or list(CHECKERS)
+    results = bench(checkers, calls=args.calls, repeat=args.repeat)
+    if args.output is not None:
+        _ = args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    baseline: dict[str, _Result] = {}
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    print(f"{'checker':<12} {'imports':>9} {f'{args.calls} calls':>12}")
+    for checker, result in results.items():
+        line = f"{checker:<12} {result['probe']:>8.2f}s {result['calls']:>11.2f}s"
+        if (old := baseline.get(checker)) and old["calls"] > 0:
+            ratio = result["calls"] / old["calls"]
+            line += f"  (was {old['calls']:.2f}s, {ratio:.2f}x)"
+        print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Generate `scipy-stubs/linalg/_flapack.pyi` and `scipy-stubs/linalg/cython_lapack.pyi`
+from the signature table in `scripts/lapack.json`.
+
+Each entry of the `flapack` table describes a family of LAPACK routines with the same
+signature, i.e. the (generic) parameters and return type of a callable protocol, and the
+routines that are bound to it, together with their type arguments. Families with
+structurally identical protocols share a single one, so that the type-checkers have
+fewer distinct protocols to load. A shared protocol is named after all of its families,
+e.g. `_function_hecon_sycon`, or `_function_gesdd_gesvd_lwork` for a common suffix.
+
+The `cython_lapack` table lists the names of the routines in `__pyx_capi__`, grouped by
+their name without the precision prefix.
+
+Run with `--check` to only verify that the stubs are up to date.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+# ruff: file-ignore[start-process-with-partial-path]
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final, TypedDict
+
+ROOT: Final = Path(__file__).parent.parent
+TABLE_PATH: Final = Path(__file__).parent / "lapack.json"
+FLAPACK_PATH: Final = ROOT / "scipy-stubs" / "linalg" / "_flapack.pyi"
+CYTHON_LAPACK_PATH: Final = ROOT / "scipy-stubs" / "linalg" / "cython_lapack.pyi"
+
+_PROTOCOL_PREFIX: Final = "_function_"
+
+_FLAPACK_HEADER: Final = """\
+from collections.abc import Callable
+from typing import Final, Protocol, type_check_only
+
+import numpy as np
+import optype.numpy as onp
+
+###
+
+type _rcond = float  # ruff: ignore[snake-case-type-alias]
+type _info = int  # ruff: ignore[snake-case-type-alias]
+
+###
+
+__f2py_numpy_version__: Final[str] = ...  # undocumented
+
+###
+"""
+
+_CYTHON_LAPACK_HEADER: Final = """\
+from collections.abc import Mapping
+from typing import Final, Never, TypedDict, type_check_only
+from typing_extensions import CapsuleType, ReadOnly
+
+@type_check_only
+class _CApiDict(TypedDict):
+"""
+
+_CYTHON_LAPACK_FOOTER: Final = """
+__pyx_capi__: Final[_CApiDict]
+__test__: Final[Mapping[Never, Never]]
+"""
+
+
+class _Family(TypedDict):
+    name: str
+    comment: list[str]
+    """The f2py signature, as comment lines above the protocol."""
+    type_params: list[str]
+    params: list[str]
+    """The parameters after `self, /`, optionally followed by a `  # ` comment."""
+    returns: str
+    routines: dict[str, str]
+    """The routine names, mapped to the type arguments of the protocol."""
+
+
+class _CythonTable(TypedDict):
+    routines: dict[str, str]
+    """The routine names without their prefix, mapped to the prefixes."""
+    other: list[str]
+    """The routines without precision prefix."""
+
+
+class _Table(TypedDict):
+    flapack: list[_Family]
+    cython_lapack: _CythonTable
+
+
+def _structure(family: _Family) -> tuple[str, ...]:
+    """The signature of the protocol, with the type parameters renamed by position."""
+    parts = [*family["type_params"], *family["params"], family["returns"]]
+    for i, type_param in enumerate(family["type_params"]):
+        name = type_param.partition(":")[0].strip()
+        pattern = re.compile(rf"\b{re.escape(name)}\b")
+        parts = [pattern.sub(f"_T{i}", part) for part in parts]
+    return tuple(parts)
+
+
+def _shared_name(names: Sequence[str]) -> str:
+    """The names of the families, joined after their common `_`-separated suffix."""
+    if len(names) == 1:
+        return names[0]
+
+    parts = [name.split("_") for name in names]
+    n_common = 0
+    while all(
+        n_common < len(p) - 1 and p[-1 - n_common] == parts[0][-1 - n_common]
+        for p in parts
+    ):
+        n_common += 1
+
+    suffix = parts[0][len(parts[0]) - n_common :]
+    stems = ["_".join(p[: len(p) - n_common]) for p in parts]
+    return "_".join([*stems, *suffix])
+
+
+def shared_protocols(families: Sequence[_Family]) -> dict[str, str]:
+    """Map the name of each family to that of the protocol it shares with others."""
+    groups: dict[tuple[str, ...], list[str]] = {}
+    for family in families:
+        groups.setdefault(_structure(family), []).append(family["name"])
+
+    return {name: _shared_name(names) for names in groups.values() for name in names}
+
+
+def _param(param: str) -> str:
+    code, _, comment = param.partition("  # ")
+    return f"{code},  # {comment}" if comment else f"{code},"
+
+
+def _protocol(family: _Family, protocol: str) -> list[str]:
+    name = f"{_PROTOCOL_PREFIX}{protocol}"
+    type_params = ", ".join(family["type_params"])
+    generic = f"[{type_params}]" if type_params else ""
+    returns = family["returns"]
+
+    lines = ["@type_check_only", f"class {name}{generic}(Protocol):"]
+    if any("  # " in param for param in family["params"]):
+        # the comments require one parameter per line
+        lines += ["    def __call__(", "        self,", "        /,"]
+        lines += [f"        {_param(param)}" for param in family["params"]]
+        lines += [f"    ) -> {returns}: ..."]
+    else:
+        params = ", ".join(["self", "/", *family["params"]])
+        lines += [f"    def __call__({params}) -> {returns}: ..."]
+    return lines
+
+
+def _binding(routine: str, protocol: str, type_args: str) -> str:
+    generic = f"[{type_args}]" if type_args else ""
+    return f"{routine}: {_PROTOCOL_PREFIX}{protocol}{generic} = ..."
+
+
+def render_flapack(families: Sequence[_Family]) -> str:
+    shared = shared_protocols(families)
+
+    blocks: list[str] = [_FLAPACK_HEADER]
+    defined: set[str] = set()
+    for family in families:
+        lines = [f"# {comment}" for comment in family["comment"]]
+
+        protocol = shared[family["name"]]
+        if protocol not in defined:
+            defined.add(protocol)
+            lines += [*_protocol(family, protocol), ""]
+
+        lines += [
+            _binding(routine, protocol, type_args)
+            for routine, type_args in family["routines"].items()
+        ]
+        blocks.append("\n".join(lines) + "\n")
+
+    return "\n".join(blocks)
+
+
+def render_cython_lapack(table: _CythonTable) -> str:
+    names = [
+        f"{prefix}{name}"
+        for name, prefixes in table["routines"].items()
+        for prefix in prefixes
+    ]
+    names += table["other"]
+    fields = [f"    {name}: ReadOnly[CapsuleType]\n" for name in sorted(names)]
+    return "".join([_CYTHON_LAPACK_HEADER, *fields, _CYTHON_LAPACK_FOOTER])
+
+
+def ruff_format(source: str, path: Path) -> str:
+    proc = subprocess.run(
+        ["ruff", "format", f"--stdin-filename={path}", "-"],
+        cwd=ROOT,
+        input=source,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return proc.stdout
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate the LAPACK stubs from the signature table"
+    )
+    _ = parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check whether the stubs are up to date",
+    )
+    args = parser.parse_args()
+
+    table: _Table = json.loads(TABLE_PATH.read_text(encoding="utf-8"))
+    outputs = {
+        FLAPACK_PATH: render_flapack(table["flapack"]),
+        CYTHON_LAPACK_PATH: render_cython_lapack(table["cython_lapack"]),
+    }
+
+    stale: list[Path] = []
+    for path, source in outputs.items():
+        formatted = ruff_format(source, path)
+        if path.read_text(encoding="utf-8") == formatted:
+            continue
+
+        stale.append(path)
+        if not args.check:
+            _ = path.write_text(formatted, encoding="utf-8")
+
+    for path in stale:
+        action = "is out of date" if args.check else "was regenerated"
+        print(f"{path.relative_to(ROOT)} {action}", file=sys.stderr)
+
+    n_families = len(table["flapack"])
+    n_protocols = len(set(shared_protocols(table["flapack"]).values()))
+    print(f"{n_families} routine families, {n_protocols} protocols")
+
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
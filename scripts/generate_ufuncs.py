@@ -0,0 +1,345 @@
+"""
+Generate the ufunc bindings in `scipy-stubs/special/_ufuncs.pyi` from the `types` of the
+ufuncs in `scipy.special._ufuncs`, or from the table in `scripts/ufuncs.json` if scipy
+is not installed.
+
+Each ufunc is bound to the `_UFunc*` protocol with a `types` variant in the table that
+has the same loops as the ufunc, or to `np.ufunc` if there is no such protocol. The
+loops must be in the same order only if that is what distinguishes two protocols, so
+that the variants can keep the order of the table. The `ntypes` and `types` properties
+of the protocols are generated from their variants, and so are their bases: the `at`,
+`outer`, and reduction methods are typed as returning `Never` if none of the loops of
+the protocol support them, so that only the methods that work at runtime remain. The
+`__call__` overloads of the protocols are written by hand.
+
+The `ufuncs` of the table are updated from the installed scipy, so that the stubs can
+also be generated without it. Run with `--check` to only verify that the stubs and the
+table are up to date, and with `--from-table` to ignore the installed scipy.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import ast
+import json
+import re
+import sys
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Final, TypedDict, cast
+
+from generate_lapack import ROOT, ruff_format
+
+TABLE_PATH: Final = Path(__file__).parent / "ufuncs.json"
+UFUNCS_PATH: Final = ROOT / "scipy-stubs" / "special" / "_ufuncs.pyi"
+
+_JSON_WIDTH: Final = 100
+_SECTION: Final = "\n###\n"
+_GENERIC: Final = "Generic[_NameT_co, _IdentityT_co]"
+
+# the mixin that overrides the methods that aren't supported with `Never`
+_MIXINS: Final[Mapping[frozenset[str], str | None]] = {
+    frozenset(): None,
+    frozenset({"reduce"}): "_UFuncWithoutIdentity",
+    frozenset({"reduce", "outer"}): "_UFuncWithout2in",
+    frozenset({"reduce", "at"}): "_UFuncWithout1out",
+    frozenset({"reduce", "outer", "at"}): "_UFuncWithout2in1out",
+}
+
+
+class _Protocol(TypedDict):
+    comment: str
+    """The loops of the protocol, as comment above its bindings."""
+    types: list[list[str]]
+    """The `types` of the ufuncs that the protocol accepts."""
+
+
+class _UFunc(TypedDict):
+    types: list[str]
+    identity: float | None
+    undocumented: bool
+
+
+class _Table(TypedDict):
+    protocols: dict[str, _Protocol]
+    ufuncs: dict[str, _UFunc]
+
+
+def _arity(types: Sequence[str]) -> tuple[int, int]:
+    ins, _, outs = types[0].partition("->")
+    return len(ins), len(outs)
+
+
+def unsupported_methods(types: Sequence[str]) -> frozenset[str]:
+    """
+    The ufunc methods that raise for all of the loops, where `"reduce"` also stands for
+    `accumulate` and `reduceat`.
+    """
+    n_in, n_out = _arity(types)
+    binary = n_in == 2  # ruff: ignore[magic-value-comparison]
+
+    unsupported: set[str] = set()
+    if not binary:
+        unsupported.add("outer")
+    if n_in > 2 or n_out != 1:  # ruff: ignore[magic-value-comparison]
+        unsupported.add("at")
+    # a reduction requires a loop with the same input and output types
+    if not binary or n_out != 1 or not any(t[0] == t[1] == t[-1] for t in types):
+        unsupported.add("reduce")
+    return frozenset(unsupported)
+
+
+def protocol_bases(name: str, protocol: _Protocol) -> str:
+    arities = {_arity(types) for types in protocol["types"]}
+    if len(arities) != 1:
+        msg = f"the types of {name} have different arities: {sorted(arities)}"
+        raise ValueError(msg)
+
+    (n_in, n_out) = arities.pop()
+    unsupported = unsupported_methods(protocol["types"][0])
+    for types in protocol["types"][1:]:
+        unsupported &= unsupported_methods(types)
+    mixin = _MIXINS[unsupported]
+
+    bases = [f"_UFunc{n_in}{n_out}[_NameT_co, _IdentityT_co]", _GENERIC]
+    return ", ".join([mixin, *bases] if mixin else bases)
+
+
+def _literal(values: Sequence[object]) -> str:
+    return f"L[{', '.join(json.dumps(v) for v in values)}]"
+
+
+def _properties(protocol: _Protocol) -> dict[str, str]:
+    ntypes = sorted({len(types) for types in protocol["types"]})
+    return {
+        "ntypes": _literal(ntypes),
+        "types": " | ".join(f"list[{_literal(t)}]" for t in protocol["types"]),
+    }
+
+
+def _replace_protocol(
+    lines: list[str], node: ast.ClassDef, protocol: _Protocol
+) -> None:
+    """Replace the bases, `ntypes`, and `types` of the protocol class in-place."""
+    edits: list[tuple[int, int, str]] = []
+
+    returns = _properties(protocol)
+    for method in node.body:
+        if isinstance(method, ast.FunctionDef) and method.name in returns:
+            line = f"    def {method.name}(self, /) -> {returns[method.name]}: ..."
+            edits.append((method.lineno - 1, method.end_lineno or method.lineno, line))
+
+    start, stop = node.lineno - 1, node.bases[-1].end_lineno or node.lineno
+    header = re.sub(
+        rf"^class {node.name}\((.*?)\):",
+        f"class {node.name}({protocol_bases(node.name, protocol)}):",
+        " ".join(lines[start:stop]),
+        flags=re.DOTALL,
+    )
+    edits.append((start, stop, header))
+
+    for start, stop, line in sorted(edits, reverse=True):
+        lines[start:stop] = [line]
+
+
+def render_protocols(source: str, protocols: Mapping[str, _Protocol]) -> str:
+    nodes = {
+        node.name: node
+        for node in ast.parse(source).body
+        if isinstance(node, ast.ClassDef) and node.name in protocols
+    }
+    if missing := protocols.keys() - nodes.keys():
+        msg = f"the protocols {sorted(missing)} must be written by hand first"
+        raise ValueError(msg)
+
+    lines = source.splitlines()
+    # bottom-up, so that the line numbers of the other classes remain valid
+    linenos = {name: node.lineno for name, node in nodes.items()}
+    for name in sorted(nodes, key=linenos.__getitem__, reverse=True):
+        _replace_protocol(lines, nodes[name], protocols[name])
+    return "\n".join(lines) + "\n"
+
+
+def _binding(name: str, ufunc: _UFunc, protocol: str | None) -> str:
+    if protocol is None:
+        annotation = "np.ufunc"
+    elif ufunc["identity"] is None:
+        annotation = f'{protocol}[L["{name}"]]'
+    else:
+        annotation = f'{protocol}[L["{name}"], L[0]]'
+
+    comment = "  # undocumented" if ufunc["undocumented"] else ""
+    return f"{name}: {annotation} = ...{comment}"
+
+
+def _match(
+    types: Sequence[str],
+    by_types: Mapping[tuple[str, ...], str],
+    by_loops: Mapping[frozenset[str], set[str]],
+) -> str | None:
+    if (protocol := by_types.get(tuple(types))) is not None:
+        return protocol
+    # the order of the loops only matters if it distinguishes two protocols
+    protocols = by_loops.get(frozenset(types), set())
+    return next(iter(protocols)) if len(protocols) == 1 else None
+
+
+def bind_protocols(table: _Table) -> dict[str, str | None]:
+    """The protocol of each ufunc, or `None` if it should be typed as `np.ufunc`."""
+    by_types: dict[tuple[str, ...], str] = {}
+    by_loops: dict[frozenset[str], set[str]] = {}
+    for name, protocol in table["protocols"].items():
+        for types in protocol["types"]:
+            if (other := by_types.setdefault(tuple(types), name)) != name:
+                msg = f"{name} and {other} both accept the types {types}"
+                raise ValueError(msg)
+            by_loops.setdefault(frozenset(types), set()).add(name)
+
+    return {
+        name: _match(ufunc["types"], by_types, by_loops)
+        if ufunc["identity"] in {0, None}
+        else None
+        for name, ufunc in table["ufuncs"].items()
+    }
+
+
+def render_bindings(table: _Table) -> str:
+    protocols = table["protocols"]
+    bindings = bind_protocols(table)
+
+    groups: dict[str | tuple[str, ...], list[str]] = {}
+    for name, protocol in bindings.items():
+        key = protocol or tuple(table["ufuncs"][name]["types"])
+        groups.setdefault(key, []).append(name)
+
+    def order(key: str | tuple[str, ...]) -> tuple[int, int, int]:
+        names = list(protocols)
+        if isinstance(key, str):
+            return (*_arity(protocols[key]["types"][0]), names.index(key))
+        return (*_arity(key), len(names) + list(groups).index(key))
+
+    blocks: list[str] = []
+    for key in sorted(groups, key=order):
+        comment = protocols[key]["comment"] if isinstance(key, str) else "; ".join(key)
+        lines = [f"# {comment}"]
+        lines += [
+            _binding(name, table["ufuncs"][name], bindings[name])
+            for name in groups[key]
+        ]
+        blocks.append("\n".join(lines) + "\n")
+
+    return "\n".join(blocks)
+
+
+def render_ufuncs(source: str, table: _Table) -> str:
+    head, _, _ = render_protocols(source, table["protocols"]).rpartition(_SECTION)
+    return f"{head}{_SECTION}\n{render_bindings(table)}"
+
+
+def runtime_ufuncs() -> dict[str, tuple[list[str], float | None]] | None:
+    """The `types` and `identity` of the installed ufuncs, or `None` without scipy."""
+    try:
+        import numpy as np  # ruff: ignore[import-outside-top-level]
+
+        from scipy.special import (  # ruff: ignore[import-outside-top-level]
+            _ufuncs,  # ruff: ignore[import-private-name]
+        )
+    except ImportError:
+        return None
+
+    return {
+        name: (list(ufunc.types), ufunc.identity)
+        for name, ufunc in sorted(vars(_ufuncs).items())
+        if isinstance(ufunc, np.ufunc)
+    }
+
+
+def update_ufuncs(
+    ufuncs: Mapping[str, _UFunc], runtime: Mapping[str, tuple[list[str], float | None]]
+) -> dict[str, _UFunc]:
+    """The ufuncs of the table with the runtime ones, keeping the order of the table."""
+    names = [name for name in ufuncs if name in runtime]
+    names += [name for name in runtime if name not in ufuncs]
+
+    updated: dict[str, _UFunc] = {}
+    for name in names:
+        types, identity = runtime[name]
+        private = name.startswith("_")
+        updated[name] = {
+            "types": types,
+            "identity": identity,
+            "undocumented": ufuncs[name]["undocumented"] if name in ufuncs else private,
+        }
+    return updated
+
+
+def _dump_json(value: object, width: int = 0, indent: str = "") -> str:
+    """Like `json.dumps(value, indent=2)`, with arrays on a single line if they fit."""
+    inner = indent + "  "
+    if isinstance(value, list):
+        line = json.dumps(value)
+        if width + len(line) < _JSON_WIDTH:
+            return line
+
+        values = cast("list[object]", value)
+        items = [inner + _dump_json(v, len(inner), inner) for v in values]
+        return "[\n" + ",\n".join(items) + f"\n{indent}]"
+
+    if isinstance(value, dict) and value:
+        fields: list[str] = []
+        for k, v in cast("dict[str, object]", value).items():
+            key = f"{inner}{json.dumps(k)}: "
+            fields.append(key + _dump_json(v, len(key), inner))
+        return "{\n" + ",\n".join(fields) + f"\n{indent}}}"
+
+    return json.dumps(value)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate the special ufunc stubs from their type signatures"
+    )
+    _ = parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check whether the stubs and the table are up to date",
+    )
+    _ = parser.add_argument(
+        "--from-table",
+        action="store_true",
+        help="Use the table, even if scipy is installed",
+    )
+    args = parser.parse_args()
+
+    table: _Table = json.loads(TABLE_PATH.read_text(encoding="utf-8"))
+    runtime = None if args.from_table else runtime_ufuncs()
+    if runtime is not None:
+        table["ufuncs"] = update_ufuncs(table["ufuncs"], runtime)
+
+    source = UFUNCS_PATH.read_text(encoding="utf-8")
+    outputs = {
+        TABLE_PATH: _dump_json(table) + "\n",
+        UFUNCS_PATH: ruff_format(render_ufuncs(source, table), UFUNCS_PATH),
+    }
+
+    stale: list[Path] = []
+    for path, output in outputs.items():
+        if path.read_text(encoding="utf-8") != output:
+            stale.append(path)
+            if not args.check:
+                _ = path.write_text(output, encoding="utf-8")
+
+    for path in stale:
+        action = "is out of date" if args.check else "was regenerated"
+        print(f"{path.relative_to(ROOT)} {action}", file=sys.stderr)
+
+    bindings = bind_protocols(table)
+    n_bound = sum(protocol is not None for protocol in bindings.values())
+    origin = "scipy" if runtime is not None else "the table"
+    print(f"{len(bindings)} ufuncs from {origin}, {n_bound} with a protocol")
+
+    return 1 if args.check and stale else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+"""
+Analyze the import graph of the stubs in `scipy-stubs/`.
+
+Reports the transitive fan-in and fan-out of the stub modules, the import cycles between
+them (i.e. the strongly connected components of the graph), and the number of stub
+lines that a type-checker has to load for each public subpackage. Exits with status 1
+if one of the subpackages exceeds its budget.
+
+The subpackage imports of `scipy/__init__.pyi` are not followed, because type-checkers
+such as pyright and pyrefly only load those when they are accessed. Parent packages, on
+the other hand, are always loaded when one of their submodules is imported.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import ast
+import json
+import sys
+from collections.abc import Iterable, Mapping, Set as AbstractSet
+from pathlib import Path
+from typing import Final, NamedTuple
+
+from overload_count import STUBS_PATH, resolve_import, stub_module_name
+from test_coverage import PACKAGES_PUBLIC
+
+SCIPY: Final = "scipy"
+_SCIPY_ONLY: Final = frozenset({SCIPY})
+
+# the maximum number of lines in the import closure of a public subpackage
+BUDGETS: Final[Mapping[str, int]] = {
+    "constants": 1_500,
+    "datasets": 600,
+    "differentiate": 1_000,
+    "fft": 3_000,
+    "ndimage": 6_500,
+    "special": 6_500,
+}
+
+type Graph = dict[str, set[str]]
+
+
+class Module(NamedTuple):
+    path: Path
+    lines: int
+    imports: frozenset[str]
+    """The `scipy` modules that are explicitly imported."""
+
+
+class Closure(NamedTuple):
+    modules: int
+    lines: int
+    budget: int | None
+
+
+def imported_names(
+    tree: ast.Module,
+    module: str,
+    *,
+    is_package: bool,
+    packages: AbstractSet[str] = _SCIPY_ONLY,
+) -> set[str]:
+    """The absolute names in `packages` that might refer to imported modules."""
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        match node:
+            case ast.Import(names=aliases):
+                names.update(alias.name for alias in aliases)
+            case ast.ImportFrom(names=aliases):
+                base = resolve_import(node, module, is_package=is_package)
+                names.add(base)
+                names.update(f"{base}.{alias.name}" for alias in aliases)
+            case _:
+                pass
+    return {name for name in names if name.split(".")[0] in packages}
+
+
+def existing_module(name: str, modules: Iterable[str]) -> str | None:
+    """The innermost module that `name` refers to, or is an attribute of."""
+    while name and name not in modules:
+        name = name.rpartition(".")[0]
+    return name or None
+
+
+def read_module(path: Path, modules: Iterable[str]) -> Module:
+    """Parse the stub, and resolve its imports to the names of the `modules`."""
+    name = stub_module_name(path)
+    source = path.read_text(encoding="utf-8")
+    is_package = path.name == "__init__.pyi"
+    imported = imported_names(ast.parse(source), name, is_package=is_package)
+    imports = {m for n in imported if (m := existing_module(n, modules)) and m != name}
+    return Module(path, len(source.splitlines()), frozenset(imports))
+
+
+def collect_modules() -> dict[str, Module]:
+    paths = {stub_module_name(path): path for path in sorted(STUBS_PATH.rglob("*.pyi"))}
+    return {name: read_module(path, paths) for name, path in paths.items()}
+
+
+def _is_lazy(source: str, target: str) -> bool:
+    """Whether the import is of a subpackage by `scipy/__init__.pyi`."""
+    return source == SCIPY and target.count(".") == 1
+
+
+def import_graph(modules: Mapping[str, Module]) -> Graph:
+    """The explicit imports of each module."""
+    return {name: set(module.imports) for name, module in modules.items()}
+
+
+def load_graph(modules: Mapping[str, Module]) -> Graph:
+    """The modules that are loaded with each module, including its parent packages."""
+    graph: Graph = {}
+    for name, module in modules.items():
+        parts = name.split(".")
+        parents = {".".join(parts[:i]) for i in range(1, len(parts))}
+        graph[name] = {m for m in module.imports if not _is_lazy(name, m)} | parents
+    return graph
+
+
+def closure(
+    graph: Graph, start: str, *, exclude: AbstractSet[str] | None = None
+) -> set[str]:
+    """The modules that can be reached from `start`, without passing `exclude`."""
+    exclude = exclude or set()
+    seen: set[str] = set()
+    stack = [start]
+    while stack:
+        name = stack.pop()
+        if name not in seen and name not in exclude:
+            seen.add(name)
+            stack.extend(graph[name] - seen)
+    return seen
+
+
+def _reverse(graph: Graph) -> Graph:
+    reverse: Graph = {name: set() for name in graph}
+    for name, targets in graph.items():
+        for target in targets:
+            reverse[target].add(name)
+    return reverse
+
+
+def _postorder(graph: Graph) -> list[str]:
+    order: list[str] = []
+    seen: set[str] = set()
+    for root in sorted(graph):
+        if root in seen:
+            continue
+
+        seen.add(root)
+        work = [(root, iter(sorted(graph[root])))]
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in seen:
+                    seen.add(successor)
+                    work.append((successor, iter(sorted(graph[successor]))))
+                    break
+            else:
+                order.append(node)
+                _ = work.pop()
+
+    return order
+
+
+def import_cycles(graph: Graph) -> list[list[str]]:
+    """The strongly connected components of more than one module (Kosaraju)."""
+    reverse = _reverse(graph)
+
+    assigned: set[str] = set()
+    cycles: list[list[str]] = []
+    for root in reversed(_postorder(graph)):
+        if root in assigned:
+            continue
+
+        component = closure(reverse, root, exclude=assigned)
+        assigned |= component
+        if len(component) > 1:
+            cycles.append(sorted(component))
+
+    return sorted(cycles, key=len, reverse=True)
+
+
+def fan_out(graph: Graph) -> dict[str, int]:
+    """The number of other modules that each module (transitively) loads."""
+    return {name: len(closure(graph, name)) - 1 for name in graph}
+
+
+def fan_in(graph: Graph) -> dict[str, int]:
+    """The number of other modules that (transitively) load each module."""
+    return fan_out(_reverse(graph))
+
+
+def subpackage_closures(
+    modules: Mapping[str, Module], graph: Graph, budgets: Mapping[str, int]
+) -> dict[str, Closure]:
+    closures: dict[str, Closure] = {}
+    for package in PACKAGES_PUBLIC:
+        name = f"{SCIPY}.{package}"
+        if name not in graph:
+            continue
+
+        members = closure(graph, name)
+        lines = sum(modules[member].lines for member in members)
+        closures[package] = Closure(len(members), lines, budgets.get(package))
+    return closures
+
+
+def _by_count(item: tuple[str, int], /) -> tuple[int, str]:
+    return -item[1], item[0]
+
+
+def _top(counts: Mapping[str, int], n: int) -> list[tuple[str, int]]:
+    return sorted(counts.items(), key=_by_count)[:n]
+
+
+def _parse_budget(value: str) -> tuple[str, int]:
+    package, _, lines = value.partition("=")
+    if package not in PACKAGES_PUBLIC or not lines.isdigit():
+        msg = f"expected PACKAGE=LINES with a public subpackage, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return package, int(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Analyze the import graph of the scipy-stubs modules"
+    )
+    _ = parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="Number of modules with the highest fan-in and fan-out to report",
+    )
+    _ = parser.add_argument(
+        "--budget",
+        type=_parse_budget,
+        action="append",
+        default=[],
+        metavar="PACKAGE=LINES",
+        help="Override the maximum closure size (in lines) of a public subpackage",
+    )
+    _ = parser.add_argument(
+        "--json", type=Path, help="Also write the full analysis to this JSON file"
+    )
+    args = parser.parse_args()
+
+    modules = collect_modules()
+    graph = load_graph(modules)
+    cycles = import_cycles(import_graph(modules))
+    fans_in, fans_out = fan_in(graph), fan_out(graph)
+    closures = subpackage_closures(modules, graph, {**BUDGETS, **dict(args.budget)})
+
+    print(f"{len(modules)} modules, {sum(m.lines for m in modules.values())} lines")
+
+    for title, counts in (("fan-in", fans_in), ("fan-out", fans_out)):
+        print(f"\nhighest transitive {title}:")
+        for name, count in _top(counts, args.top):
+            print(f"  {count:>5}  {name}")
+
+    print(f"\n{len(cycles)} import cycles:")
+    for component in cycles:
+        print(f"  {len(component):>5}  {', '.join(component)}")
+
+    print("\nsubpackage closures:")
+    exceeded: list[str] = []
+    for package, (n_modules, lines, budget) in closures.items():
+        limit = "" if budget is None else f" / {budget:>6}"
+        print(f"  {package:<24} {n_modules:>5} modules {lines:>7} lines{limit}")
+        if budget is not None and lines > budget:
+            exceeded.append(package)
+
+    if args.json:
+        report = {
+            "modules": {
+                name: {
+                    "lines": module.lines,
+                    "imports": sorted(module.imports),
+                    "fan_in": fans_in[name],
+                    "fan_out": fans_out[name],
+                }
+                for name, module in modules.items()
+            },
+            "cycles": cycles,
+            "closures": {package: c._asdict() for package, c in closures.items()},
+        }
+        _ = args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for package in exceeded:
+        print(f"the closure of scipy.{package} exceeds its budget", file=sys.stderr)
+
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
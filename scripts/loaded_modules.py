@@ -0,0 +1,175 @@
+"""
+Count the `scipy-stubs` modules that the type-checkers load for a small snippet of code,
+and fail if a checker loads more of them than its budget allows, or if it does not load
+the modules that the snippet requires (which usually means that the checker failed).
+
+The default snippet is `import scipy; scipy.linalg.norm`, which should only require the
+top-level package and the `linalg` subpackage (and what it depends on) to be loaded.
+
+Mypy always loads all modules that can be reached through the imports of the stubs, so
+it has no budget by default. Pyrefly, on the other hand, only loads what it needs.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+
+import argparse
+import csv
+import re
+import subprocess
+import sys
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final, Literal
+
+from typecheck_bench import ROOT, checker_command
+
+type Checker = Literal["mypy", "pyrefly"]
+
+CHECKERS: Final[tuple[Checker, ...]] = "mypy", "pyrefly"
+SNIPPET: Final = "import scipy\n\nscipy.linalg.norm\n"
+BUDGETS: Final[dict[Checker, int]] = {"pyrefly": 80}
+# the modules that must be loaded for the default snippet
+REQUIRED: Final = "scipy", "scipy.linalg"
+
+# e.g. `LOG:  Parsing /path/to/scipy-stubs/linalg/__init__.pyi (scipy.linalg)`
+_MYPY_PARSING: Final = re.compile(
+    r"^LOG:  Parsing .+ \((?P<module>[\w.]+)\)$", re.MULTILINE
+)
+
+
+def _is_scipy(module: str) -> bool:
+    return module == "scipy" or module.startswith("scipy.")
+
+
+def loaded_modules(checker: Checker, source: str, /, *, work_dir: Path) -> set[str]:
+    """The names of the `scipy` modules that the checker loads for `source`.
+
+    Raises `RuntimeError` if the checker didn't report which modules it loaded.
+    """
+    probe = work_dir / "probe.py"
+    _ = probe.write_text(source, encoding="utf-8")
+    cmd = checker_command(checker, [probe], cache_dir=work_dir / f"cache_{checker}")
+
+    match checker:
+        case "mypy":
+            # `--verbose` logs each module when it is parsed
+            proc = subprocess.run(
+                [*cmd, "--verbose"],
+                cwd=ROOT,
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+            modules = {m["module"] for m in _MYPY_PARSING.finditer(proc.stderr)}
+        case "pyrefly":
+            # the timings report has a row for each step of each module that is loaded
+            timings = work_dir / "timings.csv"
+            timings.unlink(missing_ok=True)
+            proc = subprocess.run(
+                [*cmd, f"--report-timings={timings}"],
+                cwd=ROOT,
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+            if not timings.exists():
+                # e.g. because pyrefly crashed before it could write the report
+                error = proc.stderr.strip() or f"exited with {proc.returncode}"
+                msg = f"pyrefly did not write its timings report:\n{error}"
+                raise RuntimeError(msg)
+            with timings.open(encoding="utf-8", newline="") as f:
+                modules = {row["Module"] for row in csv.DictReader(f)}
+
+    return {module for module in modules if _is_scipy(module)}
+
+
+def _print_modules(modules: Sequence[str]) -> None:
+    subpackages: dict[str, int] = {}
+    for module in modules:
+        subpackage = ".".join(module.split(".")[:2])
+        subpackages[subpackage] = subpackages.get(subpackage, 0) + 1
+
+    for subpackage, count in sorted(subpackages.items()):
+        print(f"    {subpackage:<32} {count:>4}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Count the scipy-stubs modules that the type-checkers load"
+    )
+    _ = parser.add_argument(
+        "source",
+        nargs="?",
+        default=SNIPPET,
+        help="Python code to type-check (default: `import scipy; scipy.linalg.norm`)",
+    )
+    _ = parser.add_argument(
+        "--checker",
+        action="append",
+        choices=CHECKERS,
+        help="Type-checker to count the loaded modules of (default: all)",
+    )
+    _ = parser.add_argument(
+        "--max-modules",
+        type=int,
+        help="Fail if any of the checkers loads more modules than this",
+    )
+    _ = parser.add_argument(
+        "--require",
+        action="append",
+        metavar="MODULE",
+        help=(
+            "Fail if any of the checkers does not load this module "
+            "(default: `scipy` and `scipy.linalg` for the default snippet)"
+        ),
+    )
+    _ = parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Print the number of loaded modules per subpackage",
+    )
+    args = parser.parse_args()
+
+    checkers: list[Checker] = args.checker or list(CHECKERS)
+    required: Sequence[str] = args.require or (
+        REQUIRED if args.source == SNIPPET else ()
+    )
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for checker in checkers:
+            try:
+                modules = loaded_modules(checker, args.source, work_dir=Path(tmp))
+            except RuntimeError as e:
+                failed = True
+                print(e, file=sys.stderr)
+                continue
+
+            budget = args.max_modules or BUDGETS.get(checker)
+
+            print(f"{checker}: {len(modules)} modules (budget: {budget or '-'})")
+            if args.verbose:
+                _print_modules(sorted(modules))
+
+            if budget is not None and len(modules) > budget:
+                failed = True
+                print(
+                    f"{checker} loads more modules than its budget of {budget}",
+                    file=sys.stderr,
+                )
+
+            missing = sorted(set(required) - modules)
+            if missing or not modules:
+                failed = True
+                print(
+                    f"{checker} did not load {', '.join(missing) or 'any modules'}",
+                    file=sys.stderr,
+                )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
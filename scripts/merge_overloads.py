@@ -0,0 +1,504 @@
+"""
+Find the overloads in scipy-stubs/** that can be merged without changing what the
+type-checkers infer, and optionally merge them.
+
+Two consecutive overloads of a function can be merged if they are identical, except for
+a single type in the annotation of one of their parameters, which is either the whole
+annotation, or one of its union members. Because a union is distributive, a call then
+matches the merged overload if and only if it matches one of the original ones, and
+the return type is the same. Consecutive runs of such overloads are merged into one,
+with the union of the differing types, e.g.
+
+    @overload
+    def f(x: onp.ToInt, n: int = 1) -> int: ...
+    @overload
+    def f(x: onp.ToBool, n: int = 1) -> int: ...
+
+becomes
+
+    @overload
+    def f(x: onp.ToInt | onp.ToBool, n: int = 1) -> int: ...
+
+If the differing types contain a type parameter, the solution of the type parameter
+could change, so these aren't merged. Neither are overloads that have comments, such
+as `# type: ignore`, that would get lost. If all overloads of a function are merged,
+the `@overload` decorator of the remaining signature is removed.
+
+Overloads whose parameter and return types differ together, like the complex128,
+complex64, and clongdouble overloads of `scipy.fft.fft`, are only reported as
+candidates for a generic signature. Such a mapping from input to output dtypes is
+usually many-to-one, and can't be expressed by a single type parameter without changing
+the inferred types of e.g. unions or `Any`, so it needs to be done by hand.
+
+With `--write`, the merged overloads are written to the stubs, after which ruff removes
+the imports that became unused, and formats them. With `--verify`, the type-tests in
+`tests/` are type-checked with mypy, basedpyright, and pyrefly after writing, and the
+stubs are restored if that fails.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+
+import argparse
+import ast
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Final, NamedTuple, cast
+
+from overload_count import STUBS_PATH, is_overload
+from typecheck_bench import ROOT
+from typetest import (
+    CHECKERS,
+    TESTS_DIR,
+    estimate,
+    print_diagnostics,
+    run_shard,
+    test_files,
+)
+
+# the fields of a function definition that make up its signature
+_SIGNATURE_FIELDS: Final = "decorator_list", "args", "returns", "type_params"
+_TYPE_PARAM_FACTORIES: Final = frozenset({"TypeVar", "ParamSpec", "TypeVarTuple"})
+
+# the fields and list indices that lead from a function definition to one of its nodes
+type _Path = tuple[str | int, ...]
+
+
+class _Difference(NamedTuple):
+    path: _Path
+    old: object
+    new: object
+
+
+class Merge(NamedTuple):
+    """A run of consecutive overloads that can be merged into its first one."""
+
+    name: str
+    """The qualified name of the function, relative to its module."""
+    overloads: list[ast.FunctionDef]
+    holes: list[ast.expr]
+    """The differing type of each overload, or none if they are identical."""
+    collapse: bool
+    """Whether these are all the overloads, so that `@overload` has to be removed."""
+
+
+class Candidate(NamedTuple):
+    """Consecutive overloads that only differ in their parameter and return types."""
+
+    name: str
+    overloads: list[ast.FunctionDef]
+
+
+def _is_leaf(value: object) -> bool:
+    return not isinstance(value, (ast.AST, list))
+
+
+def _differences(old: object, new: object, path: _Path) -> list[_Difference]:
+    """The outermost nodes in which two (signature) trees differ."""
+    if isinstance(old, list) and isinstance(new, list):
+        olds, news = cast("list[object]", old), cast("list[object]", new)
+        if len(olds) != len(news):
+            return [_Difference(path, old, new)]
+        differences: list[_Difference] = []
+        for i, (x, y) in enumerate(zip(olds, news, strict=True)):
+            differences += _differences(x, y, (*path, i))
+        return differences
+
+    if not isinstance(old, ast.AST) or type(old) is not type(new):
+        return [] if old == new else [_Difference(path, old, new)]
+
+    differences = []
+    for field in old._fields:
+        a: object = getattr(old, field)
+        b: object = getattr(new, field)
+        if not _is_leaf(a) or not _is_leaf(b):
+            differences += _differences(a, b, (*path, field))
+        elif a != b:
+            # e.g. the `id` of a `Name`, so the name itself differs
+            return [_Difference(path, old, new)]
+    return differences
+
+
+def _signature_differences(
+    old: ast.FunctionDef, new: ast.FunctionDef
+) -> list[_Difference]:
+    return [
+        difference
+        for field in _SIGNATURE_FIELDS
+        for difference in _differences(
+            getattr(old, field), getattr(new, field), (field,)
+        )
+    ]
+
+
+def _node_at(function: ast.FunctionDef, path: _Path) -> object:
+    node: object = function
+    for step in path:
+        if isinstance(step, str):
+            node = getattr(node, step)
+        elif isinstance(node, list):
+            node = cast("list[object]", node)[step]
+    return node
+
+
+def _is_union_member(function: ast.FunctionDef, path: _Path) -> bool:
+    """Whether the path leads to (a union member of) a parameter annotation."""
+    if not path or path[0] != "args" or "annotation" not in path:
+        return False
+
+    # the steps after the annotation may only go into the operands of `|`
+    i = path.index("annotation") + 1
+    node = _node_at(function, path[:i])
+    for step in path[i:]:
+        if not isinstance(node, ast.BinOp) or not isinstance(node.op, ast.BitOr):
+            return False
+        node = getattr(node, str(step))
+    return True
+
+
+def _type_params(tree: ast.Module) -> set[str]:
+    """The names of the type parameters that are defined in the module."""
+    names: set[str] = {"Self"}
+    for node in ast.walk(tree):
+        match node:
+            case ast.Assign(
+                targets=[ast.Name(id=name)],
+                value=ast.Call(func=ast.Name(id=factory) | ast.Attribute(attr=factory)),
+            ) if factory in _TYPE_PARAM_FACTORIES:
+                names.add(name)
+            case ast.TypeVar(name=name) | ast.ParamSpec(name=name):
+                names.add(name)
+            case ast.TypeVarTuple(name=name):
+                names.add(name)
+            case _:
+                pass
+    return names
+
+
+def _uses_type_params(node: object, type_params: set[str]) -> bool:
+    return isinstance(node, ast.AST) and any(
+        isinstance(n, ast.Name) and n.id in type_params for n in ast.walk(node)
+    )
+
+
+def _scopes(
+    body: list[ast.stmt], prefix: str = ""
+) -> Iterator[tuple[str, list[ast.stmt]]]:
+    """The statement lists in which functions can be defined, with their class name."""
+    yield prefix, body
+    for node in body:
+        match node:
+            case ast.ClassDef(name=name, body=class_body):
+                yield from _scopes(class_body, f"{prefix}{name}.")
+            case ast.If(body=if_body, orelse=orelse):
+                yield from _scopes(if_body, prefix)
+                yield from _scopes(orelse, prefix)
+            case _:
+                pass
+
+
+def _overload_groups(body: list[ast.stmt]) -> Iterator[list[ast.FunctionDef]]:
+    """The consecutive overloads of each function in the statement list."""
+    group: list[ast.FunctionDef] = []
+    for node in body:
+        if (
+            isinstance(node, ast.FunctionDef)
+            and any(is_overload(d) for d in node.decorator_list)
+            and (not group or node.name == group[0].name)
+        ):
+            group.append(node)
+            continue
+        if len(group) > 1:
+            yield group
+        group = (
+            [node]
+            if isinstance(node, ast.FunctionDef)
+            and any(is_overload(d) for d in node.decorator_list)
+            else []
+        )
+    if len(group) > 1:
+        yield group
+
+
+class _Source:
+    def __init__(self, text: str) -> None:
+        super().__init__()
+        self.text = text
+        self.lines = text.splitlines(keepends=True)
+        self.offsets = [0]
+        for line in self.lines:
+            self.offsets.append(self.offsets[-1] + len(line.encode("utf-8")))
+        self.data = text.encode("utf-8")
+
+    def offset(self, lineno: int, col_offset: int) -> int:
+        """The byte offset of a node position."""
+        return self.offsets[lineno - 1] + col_offset
+
+    def span(self, node: ast.expr) -> tuple[int, int]:
+        """The byte offsets of the start and end of the node."""
+        start = self.offset(node.lineno, node.col_offset)
+        end = self.offset(node.end_lineno or node.lineno, node.end_col_offset or 0)
+        return start, end
+
+    def segment(self, node: ast.expr) -> str:
+        start, end = self.span(node)
+        return self.data[start:end].decode("utf-8")
+
+    def has_comments(self, first: int, last: int) -> bool:
+        """Whether there are comments in the lines `first` through `last`."""
+        return any("#" in line for line in self.lines[first - 1 : last])
+
+    def is_blank(self, first: int, last: int) -> bool:
+        return all(not line.strip() for line in self.lines[first - 1 : last])
+
+
+def _start(function: ast.FunctionDef) -> int:
+    return min([function.lineno, *(d.lineno for d in function.decorator_list)])
+
+
+def _end(function: ast.FunctionDef) -> int:
+    return function.end_lineno or function.lineno
+
+
+def _can_follow(
+    source: _Source, run: Sequence[ast.FunctionDef], function: ast.FunctionDef
+) -> bool:
+    """Whether the function can be merged into a run without losing comments."""
+    return source.is_blank(_end(run[-1]) + 1, _start(function) - 1) and (
+        not source.has_comments(_start(function), _end(function))
+    )
+
+
+def _mergeable_run(
+    group: Sequence[ast.FunctionDef], source: _Source, type_params: set[str]
+) -> tuple[list[ast.FunctionDef], _Path | None]:
+    """The longest run at the start of the group that can be merged, and its hole."""
+    first = group[0]
+    run = [first]
+    hole: _Path | None = None
+    if source.has_comments(_start(first), _end(first)):
+        return run, hole
+    for function in group[1:]:
+        differences = _signature_differences(first, function)
+        if len(differences) > 1 or not _can_follow(source, run, function):
+            break
+        if differences:
+            path, old, new = differences[0]
+            if (
+                (hole is not None and path != hole)
+                or not _is_union_member(first, path)
+                or _uses_type_params(old, type_params)
+                or _uses_type_params(new, type_params)
+            ):
+                break
+            hole = path
+        run.append(function)
+    return run, hole
+
+
+def _candidate_run(group: Sequence[ast.FunctionDef]) -> list[ast.FunctionDef]:
+    """The longest run at the start of the group that only differs in the same
+    parameter and return type.
+    """
+    first = group[0]
+    run = [first]
+    holes: tuple[_Path, ...] | None = None
+    for function in group[1:]:
+        paths = tuple(d.path for d in _signature_differences(first, function))
+        if (
+            len(paths) != 2  # ruff: ignore[magic-value-comparison]
+            or (holes is not None and paths != holes)
+            or [path[0] for path in paths] != ["args", "returns"]
+        ):
+            break
+        holes = paths
+        run.append(function)
+    return run
+
+
+def find(tree: ast.Module, source: _Source) -> tuple[list[Merge], list[Candidate]]:
+    """The overloads in the module that can be merged, and the generic candidates."""
+    type_params = _type_params(tree)
+    merges: list[Merge] = []
+    candidates: list[Candidate] = []
+    for prefix, body in _scopes(tree.body):
+        for group in _overload_groups(body):
+            name = f"{prefix}{group[0].name}"
+            i = 0
+            while i < len(group):
+                run, hole = _mergeable_run(group[i:], source, type_params)
+                if len(run) > 1:
+                    holes = [
+                        node
+                        for f in run
+                        if hole is not None
+                        and isinstance(node := _node_at(f, hole), ast.expr)
+                    ]
+                    merges.append(Merge(name, run, holes, len(run) == len(group)))
+                i += len(run)
+
+            i = 0
+            while i < len(group):
+                if len(run := _candidate_run(group[i:])) > 1:
+                    candidates.append(Candidate(name, run))
+                i += len(run)
+    return merges, candidates
+
+
+def _members(node: ast.expr) -> list[ast.expr]:
+    match node:
+        case ast.BinOp(left=left, op=ast.BitOr(), right=right):
+            return [*_members(left), *_members(right)]
+        case _:
+            return [node]
+
+
+def _union(source: _Source, holes: Sequence[ast.expr]) -> str:
+    """The union of the holes, without duplicate members."""
+    members = dict.fromkeys(
+        source.segment(member) for hole in holes for member in _members(hole)
+    )
+    return " | ".join(members)
+
+
+def rewrite(source: _Source, merges: Sequence[Merge]) -> str:
+    """The source with the merged overloads."""
+    # (start, end, replacement) byte ranges, which don't overlap
+    edits: list[tuple[int, int, bytes]] = []
+    for merge in merges:
+        first, last = merge.overloads[0], merge.overloads[-1]
+        start, end = source.offset(_end(first) + 1, 0), source.offset(_end(last) + 1, 0)
+        edits.append((start, end, b""))
+
+        if merge.holes:
+            start, end = source.span(merge.holes[0])
+            edits.append((start, end, _union(source, merge.holes).encode("utf-8")))
+        if merge.collapse:
+            decorator = next(d for d in first.decorator_list if is_overload(d))
+            start = source.offset(decorator.lineno, 0)
+            edits.append((start, source.offset(decorator.lineno + 1, 0), b""))
+
+    data = source.data
+    for start, end, replacement in sorted(edits, reverse=True):
+        data = data[:start] + replacement + data[end:]
+    return data.decode("utf-8")
+
+
+def _stub_files(paths: Sequence[Path]) -> list[Path]:
+    files: set[Path] = set()
+    for path in paths:
+        files.update(path.rglob("*.pyi") if path.is_dir() else [path])
+    return sorted(file.resolve() for file in files)
+
+
+def _describe(merge: Merge, source: _Source) -> str:
+    lineno = _start(merge.overloads[0])
+    if merge.holes:
+        change = (
+            f"merge {len(merge.overloads)} overloads: {_union(source, merge.holes)}"
+        )
+    else:
+        change = f"remove {len(merge.overloads) - 1} duplicate overloads"
+    if merge.collapse:
+        change += " (no longer overloaded)"
+    return f"{lineno}: {merge.name}: {change}"
+
+
+def verify() -> bool:
+    """Type-check the type-tests with each of the checkers, and print the errors."""
+    files = test_files([TESTS_DIR])
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for checker in CHECKERS:
+            result = run_shard(
+                checker,
+                files,
+                work_dir=Path(tmp) / checker,
+                estimates=estimate(files, {}),
+            )
+            print_diagnostics(result.diagnostics)
+            if result.error:
+                print(result.error, file=sys.stderr)
+            status = "failed" if result.returncode else "passed"
+            print(f"{checker}: {status} in {result.wall:.1f}s", file=sys.stderr)
+            ok &= not result.returncode
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Find and merge redundant overloads in the stubs"
+    )
+    _ = parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[STUBS_PATH],
+        help="Stub files or directories (default: scipy-stubs/)",
+    )
+    _ = parser.add_argument(
+        "--write", action="store_true", help="Write the merged overloads to the stubs"
+    )
+    _ = parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Write, type-check the tests, and restore the stubs if that fails",
+    )
+    _ = parser.add_argument(
+        "--candidates",
+        action="store_true",
+        help="Also report the candidates for a hand-written generic signature",
+    )
+    args = parser.parse_args()
+
+    originals: dict[Path, str] = {}
+    n_merges = n_removed = n_candidates = 0
+    for path in _stub_files(args.paths):
+        source = _Source(path.read_text(encoding="utf-8"))
+        merges, candidates = find(ast.parse(source.text), source)
+        n_merges += len(merges)
+        n_removed += sum(len(m.overloads) - 1 for m in merges)
+        n_candidates += len(candidates)
+
+        name = path.relative_to(ROOT) if path.is_relative_to(ROOT) else path
+        for merge in merges:
+            print(f"{name}:{_describe(merge, source)}")
+        if args.candidates:
+            for candidate in candidates:
+                lineno = _start(candidate.overloads[0])
+                n = len(candidate.overloads)
+                print(
+                    f"{name}:{lineno}: {candidate.name}: {n} overloads may be generic"
+                )
+
+        if merges and (args.write or args.verify):
+            originals[path] = source.text
+            _ = path.write_text(rewrite(source, merges), encoding="utf-8")
+
+    print(
+        f"{n_merges} merges remove {n_removed} overloads, "
+        f"{n_candidates} runs of overloads could have a generic signature",
+        file=sys.stderr,
+    )
+
+    if originals:
+        # a collapsed function can leave `overload` as an unused import, which ruff
+        # only reports in stubs without the per-file ignores of `pyproject.toml`
+        paths = list(map(str, originals))
+        unused = ["--select=F401", "--config=lint.per-file-ignores = {}"]
+        for cmd in (["check", "--fix", *unused], ["format"]):
+            _ = subprocess.run(
+                [sys.executable, "-m", "ruff", *cmd, *paths], cwd=ROOT, check=False
+            )
+    if originals and args.verify and not verify():
+        for path, text in originals.items():
+            _ = path.write_text(text, encoding="utf-8")
+        print(f"restored {len(originals)} stubs", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
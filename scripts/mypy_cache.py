@@ -0,0 +1,288 @@
+"""
+Build a reusable mypy cache of the installed scipy-stubs, seed the mypy cache of a
+project with it, and benchmark how much faster a check with a seeded cache is.
+
+`build` type-checks a probe that imports all public subpackages, and archives the mypy
+cache as `scipy-stubs-{v}-mypy{v}-numpy{v}-py{v}-{profile}.tar.gz`, together with a
+`scipy-stubs-cache.json` manifest of these versions. Because mypy only reuses
+the cache of a module if it was checked with the same options, the archive is built for
+a profile: `default`, `strict`, or the options of a project's `--config-file`. The
+latter makes sense when many projects share the same mypy configuration.
+
+`seed` extracts such an archive into the (empty) mypy cache directory of a project,
+after checking that the installed versions match its manifest. Seeding can't change the
+results of mypy: it validates each cached module by the hash of its source, and checks
+the modules again if it has changed, or if it was checked with different options.
+
+`bench` compares the time it takes to check a probe project with a cold cache, and with
+a cache that was seeded with such an archive.
+
+Pyright, basedpyright, and pyrefly don't have a persistent cache, so there is nothing
+to prebuild for those.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import hashlib
+import json
+import platform
+import shutil
+import statistics
+import sys
+import tarfile
+import tempfile
+from collections.abc import Sequence
+from importlib.metadata import version
+from pathlib import Path
+from typing import Final, Literal, TypedDict
+
+from distn_bench import synthetic_module
+from test_coverage import PACKAGES_PUBLIC
+from typecheck_bench import ROOT, checker_command, measure
+
+MANIFEST_NAME: Final = "scipy-stubs-cache.json"
+
+_DEFAULT_CACHE_DIR: Final = Path(".mypy_cache")
+type _Versioned = Literal["scipy_stubs", "mypy", "numpy", "python", "platform"]
+
+_VERSIONED: Final[tuple[_Versioned, ...]] = (
+    "scipy_stubs",
+    "mypy",
+    "numpy",
+    "python",
+    "platform",
+)
+
+
+class Manifest(TypedDict):
+    scipy_stubs: str
+    mypy: str
+    numpy: str
+    python: str
+    """The `major.minor` version of Python."""
+    platform: str
+    profile: str
+    options: list[str]
+    """The mypy options that the cache was built with."""
+
+
+def _profile(*, strict: bool, config_file: Path | None) -> tuple[str, list[str]]:
+    """The name of the options profile, and the corresponding mypy options."""
+    if config_file is not None:
+        digest = hashlib.sha256(config_file.read_bytes()).hexdigest()
+        return f"config-{digest[:8]}", [f"--config-file={config_file.resolve()}"]
+    # without a configuration file, so that the one of the working directory is ignored
+    if strict:
+        return "strict", ["--config-file=", "--strict"]
+    return "default", ["--config-file="]
+
+
+def current_manifest(profile: str, options: Sequence[str]) -> Manifest:
+    return {
+        "scipy_stubs": version("scipy-stubs"),
+        "mypy": version("mypy"),
+        "numpy": version("numpy"),
+        "python": ".".join(platform.python_version_tuple()[:2]),
+        "platform": sys.platform,
+        "profile": profile,
+        "options": list(options),
+    }
+
+
+def archive_name(manifest: Manifest) -> str:
+    return (
+        f"scipy-stubs-{manifest['scipy_stubs']}-mypy{manifest['mypy']}"
+        f"-numpy{manifest['numpy']}-py{manifest['python']}-{manifest['profile']}.tar.gz"
+    )
+
+
+def _mypy(
+    paths: Sequence[Path], options: Sequence[str], *, cache_dir: Path, cwd: Path
+) -> float:
+    """Type-check the paths with mypy, and return the wall time."""
+    cmd = [*checker_command("mypy", paths, cache_dir=cache_dir), *options]
+    result = measure(cmd, cwd=cwd)
+    if result.returncode > 1:
+        msg = f"mypy exited with {result.returncode}: {' '.join(cmd)}"
+        raise RuntimeError(msg)
+    return result.wall
+
+
+def build(output_dir: Path, profile: str, options: Sequence[str]) -> Path:
+    """Build the cache of the installed stubs, and return the path of the archive."""
+    manifest = current_manifest(profile, options)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    archive = output_dir / archive_name(manifest)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        probe = work_dir / "probe.py"
+        imports = [f"import scipy.{package}\n" for package in PACKAGES_PUBLIC]
+        _ = probe.write_text("".join(imports), encoding="utf-8")
+
+        cache_dir = work_dir / "cache"
+        wall = _mypy([probe], options, cache_dir=cache_dir, cwd=work_dir)
+        print(f"built the {profile} cache in {wall:.1f}s", file=sys.stderr)
+
+        manifest_path = cache_dir / MANIFEST_NAME
+        _ = manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        with tarfile.open(archive, "w:gz") as tar:
+            for path in sorted(cache_dir.iterdir()):
+                tar.add(path, arcname=path.name)
+
+    return archive
+
+
+def read_manifest(archive: Path) -> Manifest:
+    with tarfile.open(archive) as tar:
+        member = tar.extractfile(MANIFEST_NAME)
+        if member is None:
+            msg = f"{archive} has no {MANIFEST_NAME}"
+            raise FileNotFoundError(msg)
+        manifest: Manifest = json.load(member)
+    return manifest
+
+
+def mismatches(manifest: Manifest) -> list[str]:
+    """The versions of the archive that don't match the installed ones."""
+    current = current_manifest(manifest["profile"], manifest["options"])
+    return [
+        f"{key}: {manifest[key]} (installed: {current[key]})"
+        for key in _VERSIONED
+        if manifest[key] != current[key]
+    ]
+
+
+def seed(archive: Path, cache_dir: Path) -> None:
+    """Extract the archive into the cache directory, without the manifest."""
+    with tarfile.open(archive) as tar:
+        members = [m for m in tar.getmembers() if m.name != MANIFEST_NAME]
+        tar.extractall(cache_dir, members=members, filter="data")
+
+
+def bench(archive: Path, *, repeat: int, calls: int) -> tuple[float, float]:
+    """The median times to check a probe project with a cold and a seeded cache."""
+    options = read_manifest(archive)["options"]
+    cold: list[float] = []
+    seeded: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        probe = work_dir / "probe.py"
+        _ = probe.write_text(synthetic_module(calls), encoding="utf-8")
+
+        for i in range(repeat):
+            cache_dir = work_dir / f"cold_{i}"
+            cold.append(_mypy([probe], options, cache_dir=cache_dir, cwd=work_dir))
+            shutil.rmtree(cache_dir)
+
+            cache_dir = work_dir / f"seeded_{i}"
+            seed(archive, cache_dir)
+            seeded.append(_mypy([probe], options, cache_dir=cache_dir, cwd=work_dir))
+            shutil.rmtree(cache_dir)
+
+    return statistics.median(cold), statistics.median(seeded)
+
+
+def _cmd_build(args: argparse.Namespace) -> int:
+    profile, options = _profile(strict=args.strict, config_file=args.config_file)
+    archive = build(args.output_dir, profile, options)
+    print(archive)
+    return 0
+
+
+def _cmd_seed(args: argparse.Namespace) -> int:
+    cache_dir: Path = args.cache_dir
+    if (problems := mismatches(read_manifest(args.archive))) and not args.force:
+        print(f"{args.archive.name} doesn't match the environment:", file=sys.stderr)
+        for problem in problems:
+            print(f"  {problem}", file=sys.stderr)
+        return 1
+    if cache_dir.exists() and any(cache_dir.iterdir()) and not args.force:
+        print(f"{cache_dir} is not empty, use --force to overwrite", file=sys.stderr)
+        return 1
+
+    seed(args.archive, cache_dir)
+    print(f"seeded {cache_dir} with {args.archive.name}", file=sys.stderr)
+    return 0
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        archive: Path = args.archive or build(
+            Path(tmp), *_profile(strict=args.strict, config_file=None)
+        )
+        cold, seeded = bench(archive, repeat=args.repeat, calls=args.calls)
+
+    print(f"{'cache':<8} {'time':>8}")
+    print(f"{'cold':<8} {cold:>7.2f}s")
+    print(f"{'seeded':<8} {seeded:>7.2f}s  ({cold / seeded:.1f}x faster)")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Build, seed, and benchmark prebuilt mypy caches of scipy-stubs"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_build = commands.add_parser("build", help="Build a cache archive")
+    _ = parser_build.add_argument(
+        "--output-dir", type=Path, default=ROOT / "dist", help="(default: dist/)"
+    )
+    profiles = parser_build.add_mutually_exclusive_group()
+    _ = profiles.add_argument(
+        "--strict", action="store_true", help="Build the cache for `mypy --strict`"
+    )
+    _ = profiles.add_argument(
+        "--config-file",
+        type=Path,
+        help="Build the cache for the mypy configuration of a project",
+    )
+
+    parser_seed = commands.add_parser("seed", help="Seed a mypy cache directory")
+    _ = parser_seed.add_argument("archive", type=Path, help="The cache archive")
+    _ = parser_seed.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=_DEFAULT_CACHE_DIR,
+        help="The mypy cache directory (default: .mypy_cache)",
+    )
+    _ = parser_seed.add_argument(
+        "--force",
+        action="store_true",
+        help="Seed even if the versions don't match, or if the cache directory isn't "
+        "empty",
+    )
+
+    parser_bench = commands.add_parser(
+        "bench", help="Compare checking a probe project with a cold and seeded cache"
+    )
+    _ = parser_bench.add_argument(
+        "archive", nargs="?", type=Path, help="The cache archive (default: build one)"
+    )
+    _ = parser_bench.add_argument(
+        "--strict", action="store_true", help="Build the cache for `mypy --strict`"
+    )
+    _ = parser_bench.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per measurement"
+    )
+    _ = parser_bench.add_argument(
+        "--calls",
+        type=int,
+        default=100,
+        help="Number of distribution method calls in the probe project",
+    )
+
+    args = parser.parse_args()
+    match args.command:
+        case "build":
+            return _cmd_build(args)
+        case "seed":
+            return _cmd_seed(args)
+        case _:
+            return _cmd_bench(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,42 @@
 """
 Collect the number of overloads for each function in scipy-stubs/** as a JSON file of
 fqname -> overload count.
+
+With `--profile`, the overloaded module-level functions are instead ranked by the time
+that the type-checkers need to resolve synthetic calls to each of their overloads. A
+checker that crashes, or fails on its configuration, stops the profile with its error.
 """
 
+# ruff: file-ignore[print]
+
 import argparse
 import ast
+import functools
 import json
+import statistics
+import sys
+import tempfile
+from collections.abc import Sequence
 from pathlib import Path
 from typing import override
 
+from typecheck_bench import CHECKERS, Checker, checked, checker_command
+
 STUBS_PATH = Path(__file__).parent.parent / "scipy-stubs"
 
+# (module, function name, overloads)
+type _Target = tuple[str, str, list[ast.FunctionDef]]
+
+
+def is_overload(node: ast.expr) -> bool:
+    match node:
+        case ast.Name(id="overload"):
+            return True
+        case ast.Attribute(attr="overload"):
+            return True
+        case _:
+            return False
+
 
 class OverloadCounter(ast.NodeVisitor):
     def __init__(self, module: str, counts: dict[str, int]) -> None:
@@ -28,7 +54,7 @@ class OverloadCounter(ast.NodeVisitor):
     @override
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         fqname = ".".join([self.module, *self.class_stack, node.name])
-        if any(self._is_overload(decorator) for decorator in node.decorator_list):
+        if any(is_overload(decorator) for decorator in node.decorator_list):
             self.counts[fqname] = self.counts.get(fqname, 0) + 1
         elif fqname not in self.counts:
             self.counts[fqname] = 1
@@ -36,20 +62,236 @@ class OverloadCounter(ast.NodeVisitor):
     @override
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         fqname = ".".join([self.module, *self.class_stack, node.name])
-        if any(self._is_overload(decorator) for decorator in node.decorator_list):
+        if any(is_overload(decorator) for decorator in node.decorator_list):
             self.counts[fqname] = self.counts.get(fqname, 0) + 1
         elif fqname not in self.counts:
             self.counts[fqname] = 1
 
-    @staticmethod
-    def _is_overload(node: ast.expr) -> bool:
+
+def stub_module_name(pyi_path: Path) -> str:
+    rel = pyi_path.relative_to(STUBS_PATH)
+    parts = list(rel.parts)
+    if parts[-1] == "__init__.pyi":
+        module_parts = parts[:-1]
+    else:
+        module_parts = [*parts[:-1], Path(parts[-1]).stem]
+
+    return ".".join(["scipy", *module_parts]) if module_parts else "scipy"
+
+
+def resolve_import(node: ast.ImportFrom, module: str, *, is_package: bool) -> str:
+    if not node.level:
+        return node.module or ""
+
+    parts = module.split(".")
+    base = parts if is_package else parts[:-1]
+    base = base[: len(base) - node.level + 1]
+    return ".".join([*base, node.module] if node.module else base)
+
+
+def _parse(pyi_path: Path) -> ast.Module:
+    return ast.parse(pyi_path.read_text(encoding="utf-8"), type_comments=True)
+
+
+###
+# overload resolution profiling
+
+
+def _probe_header(module: str, tree: ast.Module, *, is_package: bool) -> str:
+    """The imports of the stub module, and the names that are defined in it."""
+    lines: list[str] = []
+    defined: list[str] = []
+    for node in tree.body:
         match node:
-            case ast.Name(id="overload"):
-                return True
-            case ast.Attribute(attr="overload"):
-                return True
+            case ast.Import():
+                lines.append(ast.unparse(node))
+            case ast.ImportFrom(names=names):
+                base = resolve_import(node, module, is_package=is_package)
+                lines.append(ast.unparse(ast.ImportFrom(base, names, level=0)))
+            case ast.ClassDef(name=name) | ast.TypeAlias(name=ast.Name(id=name)):
+                defined.append(name)
+            case ast.Assign(targets=[ast.Name(id=name)]):
+                defined.append(name)
+            case ast.AnnAssign(target=ast.Name(id=name)):
+                defined.append(name)
             case _:
-                return False
+                pass
+
+    if defined:
+        lines.append(f"from {module} import {', '.join(dict.fromkeys(defined))}")
+    return "\n".join(lines) + "\n"
+
+
+def _distinguishing(overloads: Sequence[ast.FunctionDef]) -> set[str]:
+    """The names of the parameters whose annotations differ between the overloads."""
+    annotations: dict[str, set[str | None]] = {}
+    for node in overloads:
+        args = node.args
+        for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs]:
+            annotation = None if arg.annotation is None else ast.unparse(arg.annotation)
+            annotations.setdefault(arg.arg, set()).add(annotation)
+
+    n = len(overloads)
+    return {
+        name
+        for name, variants in annotations.items()
+        if len(variants) > 1 or sum(name in _param_names(o) for o in overloads) < n
+    }
+
+
+def _param_names(node: ast.FunctionDef) -> set[str]:
+    args = node.args
+    return {arg.arg for arg in [*args.posonlyargs, *args.args, *args.kwonlyargs]}
+
+
+def _probe_call(
+    name: str, index: int, node: ast.FunctionDef, passed: set[str], *, calls: int
+) -> str | None:
+    """A generic function that calls the overload with arguments of its own types."""
+    args = node.args
+    positional = [*args.posonlyargs, *args.args]
+    required = {a.arg for a in positional[: len(positional) - len(args.defaults)]}
+    required |= {
+        a.arg
+        for a, default in zip(args.kwonlyargs, args.kw_defaults, strict=True)
+        if default is None
+    }
+    wanted = required | passed
+
+    # positional-only arguments are passed up to and including the last wanted one
+    n_posonly = max(
+        (i + 1 for i, a in enumerate(args.posonlyargs) if a.arg in wanted), default=0
+    )
+    posonly = args.posonlyargs[:n_posonly]
+    keyword = [a for a in [*args.args, *args.kwonlyargs] if a.arg in wanted]
+
+    params: list[str] = []
+    for arg in [*posonly, *keyword]:
+        if arg.annotation is None:
+            return None
+        params.append(f"{arg.arg}: {ast.unparse(arg.annotation)}")
+    if posonly:
+        params.insert(len(posonly), "/")
+    if keyword:
+        params.insert(len(params) - len(keyword), "*")
+
+    call_args = [a.arg for a in posonly] + [f"{a.arg}={a.arg}" for a in keyword]
+    type_params = ", ".join(ast.unparse(tp) for tp in node.type_params)
+
+    generic = f"[{type_params}]" if type_params else ""
+    lines = [f"def call_{index}{generic}({', '.join(params)}) -> None:"]
+    lines += [f"    _ = {name}({', '.join(call_args)})"] * calls
+    return "\n".join(lines) + "\n"
+
+
+def _overloaded_functions(
+    tree: ast.Module, *, min_overloads: int
+) -> dict[str, list[ast.FunctionDef]]:
+    overloads: dict[str, list[ast.FunctionDef]] = {}
+    for node in tree.body:
+        if (
+            isinstance(node, ast.FunctionDef)
+            and not node.name.startswith("_")
+            and any(is_overload(d) for d in node.decorator_list)
+        ):
+            overloads.setdefault(node.name, []).append(node)
+
+    return {k: v for k, v in overloads.items() if len(v) >= min_overloads}
+
+
+def _timed(checker: Checker, source: str, /, *, work_dir: Path, repeat: int) -> float:
+    probe = work_dir / "probe.py"
+    _ = probe.write_text(source, encoding="utf-8")
+    cmd = checker_command(checker, [probe], cache_dir=work_dir / f"cache_{checker}")
+    return statistics.median(checked(cmd).wall for _ in range(repeat))
+
+
+def _probe_source(
+    header: str, module: str, name: str, nodes: list[ast.FunctionDef], *, calls: int
+) -> str:
+    passed = _distinguishing(nodes)
+    body = [
+        probe
+        for i, node in enumerate(nodes)
+        if (probe := _probe_call(name, i, node, passed, calls=calls))
+    ]
+    return "\n".join([f"{header}from {module} import {name}\n", *body])
+
+
+def _n_overloads(target: _Target, /) -> int:
+    return len(target[2])
+
+
+def _profile_targets(*, min_overloads: int) -> tuple[dict[str, str], list[_Target]]:
+    """The probe headers per module, and the overloaded functions to profile."""
+    headers: dict[str, str] = {}
+    targets: list[_Target] = []
+    for pyi_path in sorted(STUBS_PATH.rglob("*.pyi")):
+        tree = _parse(pyi_path)
+        if functions := _overloaded_functions(tree, min_overloads=min_overloads):
+            module = stub_module_name(pyi_path)
+            is_package = pyi_path.name == "__init__.pyi"
+            headers[module] = _probe_header(module, tree, is_package=is_package)
+            targets.extend((module, name, nodes) for name, nodes in functions.items())
+
+    targets.sort(key=_n_overloads, reverse=True)
+    return headers, targets
+
+
+def _by_total(item: tuple[str, dict[str, float]], /) -> float:
+    return item[1]["total"]
+
+
+def profile(
+    checkers: Sequence[Checker],
+    *,
+    min_overloads: int,
+    top: int | None,
+    repeat: int,
+    calls: int,
+) -> dict[str, dict[str, float]]:
+    """Measure the overload resolution time of each checker, in seconds per function.
+
+    Each probe file calls every overload `calls` times. The time it takes to check the
+    probe is compared to that of a probe with only the imports of the stub module.
+    """
+    headers, targets = _profile_targets(min_overloads=min_overloads)
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for checker in checkers:
+            timed = functools.partial(
+                _timed, checker, work_dir=Path(tmp), repeat=repeat
+            )
+
+            baselines: dict[str, float] = {}
+            for module, name, nodes in targets[:top]:
+                header = headers[module]
+                if module not in baselines:
+                    _ = timed(header)  # populates the cache, if any
+                    baselines[module] = timed(header)
+
+                source = _probe_source(header, module, name, nodes, calls=calls)
+                elapsed = max(timed(source) - baselines[module], 0.0)
+
+                fqname = f"{module}.{name}"
+                timings = results.setdefault(
+                    fqname, {"overloads": len(nodes), "calls": calls}
+                )
+                timings[checker] = round(elapsed, 3)
+                print(f"{checker:<12} {fqname:<60} {elapsed:>7.2f}s", file=sys.stderr)
+
+    for timings in results.values():
+        timings["total"] = round(sum(timings.get(c, 0.0) for c in checkers), 3)
+
+    return dict(sorted(results.items(), key=_by_total, reverse=True))
+
+
+def count() -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for pyi_path in STUBS_PATH.rglob("*.pyi"):
+        OverloadCounter(stub_module_name(pyi_path), counts).visit(_parse(pyi_path))
+    return dict(sorted(counts.items()))
 
 
 def main() -> None:
@@ -59,25 +301,50 @@ def main() -> None:
     _ = parser.add_argument(
         "output", nargs="?", default="overload_stats.json", help="Output JSON file path"
     )
+    _ = parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Rank the overloaded functions by their overload resolution time instead",
+    )
+    _ = parser.add_argument(
+        "--checker",
+        action="append",
+        choices=CHECKERS,
+        help="Type-checker to profile with (default: all)",
+    )
+    _ = parser.add_argument(
+        "--min-overloads",
+        type=int,
+        default=2,
+        help="Only profile functions with at least this many overloads",
+    )
+    _ = parser.add_argument(
+        "--top",
+        type=int,
+        help="Only profile the functions with the most overloads (default: all)",
+    )
+    _ = parser.add_argument(
+        "--repeat", type=int, default=1, help="Number of runs per measurement"
+    )
+    _ = parser.add_argument(
+        "--calls", type=int, default=10, help="Number of calls per overload"
+    )
     args = parser.parse_args()
 
-    counts: dict[str, int] = {}
-    for pyi_path in STUBS_PATH.rglob("*.pyi"):
-        rel = pyi_path.relative_to(STUBS_PATH)
-        parts = list(rel.parts)
-        if parts[-1] == "__init__.pyi":
-            module_parts = parts[:-1]
-        else:
-            module_parts = [*parts[:-1], Path(parts[-1]).stem]
-
-        module = ".".join(["scipy", *module_parts]) if module_parts else "scipy"
-        tree = ast.parse(pyi_path.read_text(encoding="utf-8"), type_comments=True)
-        OverloadCounter(module, counts).visit(tree)
+    result: dict[str, int] | dict[str, dict[str, float]]
+    if args.profile:
+        result = profile(
+            args.checker or CHECKERS,
+            min_overloads=args.min_overloads,
+            top=args.top,
+            repeat=args.repeat,
+            calls=args.calls,
+        )
+    else:
+        result = count()
 
     output_path = Path(args.output)
-    _ = output_path.write_text(
-        json.dumps(dict(sorted(counts.items())), indent=2), encoding="utf-8"
-    )
+    _ = output_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
 
 
 if __name__ == "__main__":
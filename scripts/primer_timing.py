@@ -0,0 +1,311 @@
+"""
+Compare the wall time and peak memory usage of mypy on downstream projects between two
+checkouts of this repository, e.g. the merge base and the head of a pull request.
+
+In each of the `--repeat` rounds, every project is type-checked once with the old and
+once with the new stubs, with a fresh cache each time, and alternating which of the two
+goes first. The stubs are put on the `PYTHONPATH`, so that mypy treats them as installed
+stubs that take precedence over the ones in the environment.
+
+A project is reported as a regression if its wall times (or peak memory usages) with the
+new stubs are significantly larger according to a one-sided Mann-Whitney U test, and if
+their median is larger by more than `--threshold`. With `n` runs per variant, the
+smallest p-value of this test is `1 / comb(2n, n)`, so `--repeat` has to be at least 4
+for the default `--alpha` of 0.05. A `--repeat` that is too small to ever report a
+regression is rejected, by checking that a synthetic slowdown would be flagged.
+
+Projects are given as directories, optionally followed by `=` and a comma-separated list
+of the paths to check. Without them, the `files` from the mypy configuration of the
+project are checked, or otherwise the whole directory. If there is a `.venv` in the
+project, or a `_<name>_venv` next to it (like in the checkouts of mypy_primer), then
+mypy uses it to find the dependencies, which should include those of scipy-stubs.
+
+The results are written as a Markdown table, with a summary as first line.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import configparser
+import math
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import tomllib
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Final, Literal, NamedTuple
+
+from typecheck_bench import Measurement, checker_command, measure
+
+from scipy import stats
+
+type Variant = Literal["old", "new"]
+
+VARIANTS: Final[tuple[Variant, ...]] = "old", "new"
+
+# in order of precedence, see https://mypy.readthedocs.io/en/stable/config_file.html
+_MYPY_CONFIGS: Final = "mypy.ini", ".mypy.ini", "pyproject.toml", "setup.cfg"
+
+
+class Project(NamedTuple):
+    name: str
+    path: Path
+    targets: tuple[str, ...]
+    """The paths to check, or none to use the `files` of the mypy configuration."""
+    python: Path | None
+    """The Python executable of the environment with the project dependencies."""
+
+
+class Comparison(NamedTuple):
+    old: float
+    """The median with the old stubs."""
+    new: float
+    """The median with the new stubs."""
+    pvalue: float
+    """The p-value of the hypothesis that the new values are not larger."""
+
+    def is_regression(self, *, alpha: float, threshold: float) -> bool:
+        return self.pvalue < alpha and self.new > self.old * (1 + threshold)
+
+
+def _has_config_files(path: Path) -> bool:
+    """Whether the mypy configuration of the project specifies the `files` to check."""
+    for name in _MYPY_CONFIGS:
+        config_path = path / name
+        if not config_path.is_file():
+            continue
+
+        if config_path.suffix == ".toml":
+            with config_path.open("rb") as f:
+                tool = tomllib.load(f).get("tool", {})
+            if "mypy" in tool:
+                return "files" in tool["mypy"]
+            continue
+
+        config = configparser.ConfigParser()
+        _ = config.read(config_path, encoding="utf-8")
+        if config.has_section("mypy"):
+            return config.has_option("mypy", "files")
+
+    return False
+
+
+def _find_python(path: Path) -> Path | None:
+    bin_dir, exe = (
+        ("Scripts", "python.exe") if sys.platform == "win32" else ("bin", "python")
+    )
+    for venv in (path / ".venv", path.parent / f"_{path.name}_venv"):
+        if (python := venv / bin_dir / exe).is_file():
+            return python
+    return None
+
+
+def parse_project(value: str) -> Project:
+    location, _, paths = value.partition("=")
+    path = Path(location).resolve()
+    if not path.is_dir():
+        msg = f"not a directory: {location!r}"
+        raise argparse.ArgumentTypeError(msg)
+
+    targets = tuple(target for target in paths.split(",") if target)
+    if not targets and not _has_config_files(path):
+        targets = (".",)
+    return Project(path.name, path, targets, _find_python(path))
+
+
+def _copy_stubs(checkout: Path, python_path: Path) -> Path:
+    """Copy the stubs of the checkout to the `python_path` directory."""
+    stubs = checkout / "scipy-stubs"
+    if not stubs.is_dir():
+        msg = f"{checkout} has no scipy-stubs directory"
+        raise FileNotFoundError(msg)
+
+    _ = shutil.copytree(
+        stubs, python_path / "scipy-stubs", ignore=shutil.ignore_patterns("*.py[co]")
+    )
+    return python_path
+
+
+def check(project: Project, *, python_path: Path, cache_dir: Path) -> Measurement:
+    """Type-check the project with mypy, using the stubs in `python_path`."""
+    cmd = checker_command("mypy", project.targets, cache_dir=cache_dir)
+    if project.python is not None:
+        cmd.append(f"--python-executable={project.python}")
+
+    env = os.environ | {"PYTHONPATH": str(python_path)}
+    try:
+        return measure(cmd, cwd=project.path, env=env)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def compare(old: Sequence[float], new: Sequence[float]) -> Comparison:
+    pvalue = stats.mannwhitneyu(new, old, alternative="greater").pvalue
+    return Comparison(statistics.median(old), statistics.median(new), float(pvalue))
+
+
+def detects_slowdown(*, repeat: int, alpha: float, threshold: float) -> bool:
+    """Whether `repeat` runs that are all slower by over `threshold` are flagged."""
+    old = [1 + i / 100 for i in range(repeat)]
+    new = [max(old) + (1 + threshold) * t for t in old]
+    return compare(old, new).is_regression(alpha=alpha, threshold=threshold)
+
+
+def bench_project(
+    project: Project,
+    python_paths: Mapping[Variant, Path],
+    *,
+    repeat: int,
+    work_dir: Path,
+) -> dict[Variant, list[Measurement]]:
+    """Check the project `repeat` times with each variant of the stubs, interleaved."""
+    measurements: dict[Variant, list[Measurement]] = {v: [] for v in VARIANTS}
+    for i in range(repeat):
+        for variant in VARIANTS if i % 2 == 0 else VARIANTS[::-1]:
+            cache_dir = work_dir / f"cache_{project.name}_{variant}_{i}"
+            result = check(
+                project, python_path=python_paths[variant], cache_dir=cache_dir
+            )
+            measurements[variant].append(result)
+    return measurements
+
+
+def _change(comparison: Comparison) -> str:
+    if comparison.old <= 0:
+        return ""
+    return f" ({comparison.new / comparison.old - 1:+.0%})"
+
+
+def report(
+    results: Mapping[str, dict[Variant, list[Measurement]]],
+    *,
+    alpha: float,
+    threshold: float,
+) -> tuple[list[str], list[str]]:
+    """The Markdown report lines, and the names of the projects that regressed."""
+    rows: list[str] = []
+    regressions: list[str] = []
+    for name, measurements in results.items():
+        old, new = measurements["old"], measurements["new"]
+        if failed := [m.returncode for m in [*old, *new] if m.returncode > 1]:
+            rows.append(f"| {name} | mypy exited with {failed[0]} | | | | | |")
+            regressions.append(name)
+            continue
+
+        walls = [m.wall for m in old], [m.wall for m in new]
+        rss = [m.rss for m in old if m.rss], [m.rss for m in new if m.rss]
+
+        cells: list[str] = []
+        regressed = False
+        for unit, (old_values, new_values) in (("s", walls), (" MiB", rss)):
+            if not old_values or not new_values:
+                cells += ["n/a", "n/a", ""]
+                continue
+
+            comparison = compare(old_values, new_values)
+            regressed |= comparison.is_regression(alpha=alpha, threshold=threshold)
+            cells += [
+                f"{comparison.old:.1f}{unit}",
+                f"{comparison.new:.1f}{unit}{_change(comparison)}",
+                f"{comparison.pvalue:.3f}",
+            ]
+
+        if regressed:
+            regressions.append(name)
+        marker = " ⚠️" if regressed else ""
+        rows.append(f"| {name}{marker} | {' | '.join(cells)} |")
+
+    timed = f"{len(results)} timed projects ({', '.join(results)})"
+    if regressions:
+        summary = (
+            f"⚠️ {len(regressions)} of the {timed} take significantly "
+            "more time or memory to check with the new stubs"
+        )
+    else:
+        summary = f"✅ No significant check-time or memory regressions in the {timed}"
+
+    lines = [
+        summary,
+        "",
+        "| project | time (old) | time (new) | p | memory (old) | memory (new) | p |",
+        "| :------ | ---------: | ---------: | -: | -----------: | -----------: | -: |",
+        *rows,
+    ]
+    return lines, regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the mypy check time of downstream projects between stubs"
+    )
+    _ = parser.add_argument("old", type=Path, help="Checkout with the old stubs")
+    _ = parser.add_argument("new", type=Path, help="Checkout with the new stubs")
+    _ = parser.add_argument(
+        "projects",
+        nargs="+",
+        type=parse_project,
+        metavar="PROJECT[=PATHS]",
+        help="Project directory, optionally with the comma-separated paths to check",
+    )
+    _ = parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of runs per project and stubs"
+    )
+    _ = parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="Significance level of the Mann-Whitney U test",
+    )
+    _ = parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.05,
+        help="Minimum relative increase of the median that is reported as regression",
+    )
+    _ = parser.add_argument("--output", type=Path, help="Output Markdown file path")
+    args = parser.parse_args()
+
+    if not detects_slowdown(
+        repeat=args.repeat, alpha=args.alpha, threshold=args.threshold
+    ):
+        pmin = 1 / math.comb(2 * args.repeat, args.repeat)
+        parser.error(
+            f"--repeat={args.repeat} can't report regressions at --alpha={args.alpha}, "
+            f"since the smallest possible p-value is {pmin:.3f}"
+        )
+
+    projects: list[Project] = args.projects
+    results: dict[str, dict[Variant, list[Measurement]]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        python_paths: dict[Variant, Path] = {
+            "old": _copy_stubs(args.old, work_dir / "old"),
+            "new": _copy_stubs(args.new, work_dir / "new"),
+        }
+
+        for project in projects:
+            results[project.name] = measurements = bench_project(
+                project, python_paths, repeat=args.repeat, work_dir=work_dir
+            )
+            old, new = (
+                statistics.median(m.wall for m in measurements[v]) for v in VARIANTS
+            )
+            print(
+                f"{project.name:<24} old {old:>7.2f}s  new {new:>7.2f}s",
+                file=sys.stderr,
+            )
+
+    lines, regressions = report(results, alpha=args.alpha, threshold=args.threshold)
+    text = "\n".join(lines) + "\n"
+    print(text)
+    if args.output is not None:
+        _ = args.output.write_text(text, encoding="utf-8")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,20 +4,23 @@
 import argparse
 import ast
 import functools
-import importlib
-import inspect
+import hashlib
+import itertools
 import json
 import logging
-import operator
+import os
 import sys
 import tempfile
 import urllib.error
 import urllib.request
 import zipfile
-from collections import Counter
-from collections.abc import Generator
-from pathlib import Path
-from typing import cast, override
+from collections import Counter, deque
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Final, Literal, cast, override
+
+from unstubbed_modules import TYPECHECK_ONLY_STUBS, record_modules, stubs
 
 # List of repositories from the README
 DEFAULT_REPOS = [
@@ -90,27 +93,47 @@ IGNORE_DIRS = {
 
 logger = logging.getLogger(__name__)
 
+# bump this whenever the results of `parse_scipy_usage` change
+_CACHE_VERSION: Final = 2
+_CHUNKSIZE: Final = 32
+
+type _Usage = tuple[set[str], set[str]]
+
+# where the names of the scipy modules are taken from
+type ModuleIndex = Literal["stubs", "record"]
+MODULE_INDICES: Final[tuple[ModuleIndex, ...]] = "stubs", "record"
+
 
 @functools.cache
-def is_scipy_module(name: str) -> bool:
-    if not name.startswith("scipy"):
-        return False
+def scipy_modules(index: ModuleIndex = "stubs") -> frozenset[str]:
+    """
+    The names of the scipy modules, according to the layout of `scipy-stubs/`, or to
+    the RECORD of the installed scipy distribution. Neither of these imports scipy.
+    """
+    if index == "record":
+        return frozenset(record_modules())
+
+    return frozenset(
+        name for name in ["scipy", *stubs()] if not name.endswith(TYPECHECK_ONLY_STUBS)
+    )
 
-    try:
-        module = importlib.import_module(name)
-    except ImportError:
-        return False
 
-    return inspect.ismodule(module)
+def is_scipy_module(name: str, index: ModuleIndex = "stubs") -> bool:
+    return name in scipy_modules(index)
+
+
+def _archive_stem(repo_name: str) -> str:
+    return repo_name.replace("/", "_")
 
 
 def download_repo(repo_name: str, target_dir: Path) -> Path:
+    """Download the zip archive of the repository, and return its path."""
     logger.info("Downloading %s...", repo_name)
 
     # Try main branch first, then master if main fails
     for branch in ["master", "main"]:
         zip_url = f"https://github.com/{repo_name}/archive/refs/heads/{branch}.zip"
-        zip_path = target_dir / f"{repo_name.replace('/', '_')}_{branch}.zip"
+        zip_path = target_dir / f"{_archive_stem(repo_name)}_{branch}.zip"
 
         try:
             _, _ = urllib.request.urlretrieve(zip_url, zip_path)
@@ -124,30 +147,78 @@ def download_repo(repo_name: str, target_dir: Path) -> Path:
 
             raise
 
-        extract_dir = target_dir / repo_name.replace("/", "_")
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
-            zip_ref.extractall(extract_dir)
-
-        zip_path.unlink()
+        return zip_path
 
-        # Find the extracted directory (should be repo_name-branch)
-        extracted_dirs = list(extract_dir.glob(f"*-{branch}"))
-        if extracted_dirs:
-            return extracted_dirs[0]
+    raise RuntimeError(f"Could not download {repo_name} - no valid branches found")  # ruff: ignore[raise-vanilla-args]
 
-        # Fallback: return the first directory
-        return next(extract_dir.iterdir())
 
-    raise RuntimeError(f"Could not download {repo_name} - no valid branches found")  # ruff: ignore[raise-vanilla-args]
+@functools.cache
+def _cache_salt(index: ModuleIndex) -> bytes:
+    # the results depend on the Python version (`ast`) and on the module index
+    modules = "\n".join(sorted(scipy_modules(index)))
+    python_version = ".".join(map(str, sys.version_info[:2]))
+    return f"{_CACHE_VERSION}:{python_version}:{modules}\n".encode()
+
+
+def find_archive(repo_name: str, archive_dir: Path) -> Path | None:
+    """A checkout or zip archive of the repository in `archive_dir`, if there is one."""
+    stem = _archive_stem(repo_name)
+    candidates = [
+        archive_dir / stem,
+        *(archive_dir / f"{stem}{suffix}.zip" for suffix in ["", "_master", "_main"]),
+    ]
+    return next((path for path in candidates if path.exists()), None)
+
+
+def read_manifest(manifest_path: Path) -> dict[str, Path]:
+    """
+    Read a JSON object that maps `owner/repo` to the path of a checkout or zip archive
+    of the repository. Relative paths are resolved w.r.t. the manifest's directory.
+    """
+    manifest = cast(
+        "dict[str, str]", json.loads(manifest_path.read_text(encoding="utf-8"))
+    )
+    return {name: manifest_path.parent / path for name, path in manifest.items()}
 
 
 def find_python_files(repo_path: Path) -> Generator[Path]:
     for pattern in ["*.py", "*.pyi"]:
         for file_path in repo_path.rglob(pattern):
-            if not any(part in IGNORE_DIRS for part in file_path.parts):
+            parts = file_path.relative_to(repo_path).parts
+            if not any(part in IGNORE_DIRS for part in parts):
                 yield file_path
 
 
+def _filename(info: zipfile.ZipInfo, /) -> str:
+    return info.filename
+
+
+def _is_python_member(info: zipfile.ZipInfo, /) -> bool:
+    # the member names are relative to the root of the archive
+    path = PurePosixPath(info.filename)
+    return (
+        not info.is_dir()
+        and path.suffix in {".py", ".pyi"}
+        and not any(part in IGNORE_DIRS for part in path.parts)
+    )
+
+
+def iter_sources(repo_path: Path) -> Generator[tuple[str, bytes]]:
+    """
+    Yield the paths and contents of the Python files in a checkout or a zip archive,
+    in sorted order. The members of a zip archive are read without extracting them.
+    """
+    if repo_path.is_dir():
+        for file_path in sorted(find_python_files(repo_path)):
+            yield str(file_path.relative_to(repo_path)), file_path.read_bytes()
+        return
+
+    with zipfile.ZipFile(repo_path) as archive:
+        members = [info for info in archive.infolist() if _is_python_member(info)]
+        for info in sorted(members, key=_filename):
+            yield info.filename, archive.read(info)
+
+
 def _create_counts_data(
     counter: Counter[str], by_repo_dict: dict[str, set[str]]
 ) -> dict[str, dict[str, int]]:
@@ -156,28 +227,141 @@ def _create_counts_data(
         project_count = len(by_repo_dict.get(name, set()))
         counts[name] = {"references": usage_count, "projects": project_count}
 
-    def sort_key(item: tuple[str, dict[str, int]], /) -> tuple[int, int]:
-        return item[1]["projects"], item[1]["references"]
+    def sort_key(item: tuple[str, dict[str, int]], /) -> tuple[int, int, str]:
+        return -item[1]["projects"], -item[1]["references"], item[0]
 
-    return dict(sorted(counts.items(), key=sort_key, reverse=True))
+    return dict(sorted(counts.items(), key=sort_key))
 
 
-def parse_scipy_usage(file_path: Path) -> tuple[set[str], set[str]]:
-    tree = ast.parse(file_path.read_text(encoding="utf-8", errors="ignore"))
+def _by_count(item: tuple[str, int], /) -> tuple[int, str]:
+    return -item[1], item[0]
 
-    visitor = ScipyVisitor()
-    visitor.visit(tree)
 
-    calls = {name for name in visitor.calls if not is_scipy_module(name)}
-    modules = {name for name in visitor.imports if is_scipy_module(name)}
+def _parse_source(
+    source: str, index: ModuleIndex, visitor: "ScipyVisitor | None" = None
+) -> _Usage:
+    if visitor is None:
+        visitor = ScipyVisitor()
+    else:
+        visitor.reset()
+    visitor.visit(ast.parse(source))
+
+    calls = {name for name in visitor.calls if not is_scipy_module(name, index)}
+    modules = {name for name in visitor.imports if is_scipy_module(name, index)}
 
     return calls, modules
 
 
+def parse_scipy_usage(file_path: Path, index: ModuleIndex = "stubs") -> _Usage:
+    source = file_path.read_text(encoding="utf-8", errors="ignore")
+    return _parse_source(source, index)
+
+
+def analyze_source(
+    data: bytes,
+    cache_dir: Path | None = None,
+    index: ModuleIndex = "stubs",
+    visitor: "ScipyVisitor | None" = None,
+) -> _Usage | None:
+    """
+    Like `parse_scipy_usage`, but for the contents of a file, and returns `None` if it
+    cannot be parsed. If a `cache_dir` is given, the results are cached there, keyed by
+    the contents. The `visitor` is reset and reused, if given.
+    """
+    if cache_dir is None:
+        try:
+            return _parse_source(data.decode("utf-8", errors="ignore"), index, visitor)
+        except SyntaxError:
+            return None
+
+    digest = hashlib.sha256(_cache_salt(index) + data).hexdigest()
+    cache_path = cache_dir / digest[:2] / f"{digest}.json"
+
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    else:
+        return None if cached is None else (set(cached[0]), set(cached[1]))
+
+    try:
+        usage = _parse_source(data.decode("utf-8", errors="ignore"), index, visitor)
+    except SyntaxError:
+        usage = None
+
+    # write to a temporary file first, so that concurrent readers never see a partial
+    # cache entry
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    result = None if usage is None else [sorted(usage[0]), sorted(usage[1])]
+    _ = tmp_path.write_text(json.dumps(result), encoding="utf-8")
+    _ = tmp_path.replace(cache_path)
+
+    return usage
+
+
+def analyze_sources(
+    sources: Iterable[bytes],
+    cache_dir: Path | None = None,
+    index: ModuleIndex = "stubs",
+) -> list[_Usage | None]:
+    """`analyze_source` for a batch of files, that share a single visitor."""
+    visitor = ScipyVisitor()
+    return [analyze_source(data, cache_dir, index, visitor) for data in sources]
+
+
+class RepoLocator:
+    """Finds the checkouts or zip archives of the repositories to analyze."""
+
+    def __init__(
+        self,
+        *,
+        archive_dir: Path | None = None,
+        manifest: Mapping[str, Path] | None = None,
+        offline: bool = False,
+    ) -> None:
+        self.archive_dir = archive_dir
+        self.manifest = manifest or {}
+        self.offline = offline
+
+        super().__init__()
+
+    def locate(self, repo_name: str, download_dir: Path) -> Path:
+        """
+        The checkout or zip archive of the repository: from the manifest, the archive
+        directory, or otherwise downloaded (into the archive directory, if any).
+        """
+        if repo_name in self.manifest:
+            return self.manifest[repo_name]
+
+        if self.archive_dir is not None:
+            if repo_path := find_archive(repo_name, self.archive_dir):
+                return repo_path
+            download_dir = self.archive_dir
+
+        if self.offline:
+            raise FileNotFoundError(f"No local archive or checkout of {repo_name}")  # ruff: ignore[raise-vanilla-args]
+
+        download_dir.mkdir(parents=True, exist_ok=True)
+        return download_repo(repo_name, download_dir)
+
+
 class ScipyUsageAnalyzer:
     """Analyzes scipy usage patterns in Python code."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        jobs: int = 1,
+        cache_dir: Path | None = None,
+        locator: RepoLocator | None = None,
+        module_index: ModuleIndex = "stubs",
+    ) -> None:
+        self.jobs = jobs
+        self.cache_dir = cache_dir
+        self.locator = locator or RepoLocator()
+        self.module_index: ModuleIndex = module_index
+
         self.call_count: Counter[str] = Counter()
         self.call_repos: dict[str, set[str]] = {}
         self.module_count: Counter[str] = Counter()
@@ -186,8 +370,41 @@ class ScipyUsageAnalyzer:
 
         super().__init__()
 
-    def analyze_repo(self, repo_name: str, repo_path: Path) -> None:
-        """Analyze a single repository for scipy usage."""
+    def _analyze_sources(
+        self, sources: Iterable[tuple[str, bytes]], pool: Executor | None
+    ) -> Iterator[tuple[str, _Usage | None]]:
+        """
+        Analyze the `(path, contents)` pairs in order, while reading them lazily. With a
+        pool, at most two batches per worker are read ahead of the results.
+        """
+        if pool is None:
+            visitor = ScipyVisitor()
+            for path, data in sources:
+                usage = analyze_source(data, self.cache_dir, self.module_index, visitor)
+                yield path, usage
+            return
+
+        analyze = functools.partial(
+            analyze_sources, cache_dir=self.cache_dir, index=self.module_index
+        )
+        pending: deque[tuple[list[str], Future[list[_Usage | None]]]] = deque()
+        for batch in itertools.batched(sources, _CHUNKSIZE):
+            paths = [path for path, _ in batch]
+            pending.append((paths, pool.submit(analyze, [data for _, data in batch])))
+            if len(pending) > 2 * self.jobs:
+                paths, future = pending.popleft()
+                yield from zip(paths, future.result(), strict=True)
+
+        for paths, future in pending:
+            yield from zip(paths, future.result(), strict=True)
+
+    def analyze_repo(
+        self, repo_name: str, repo_path: Path, pool: Executor | None = None
+    ) -> None:
+        """
+        Analyze a single repository (a checkout or zip archive) for scipy usage,
+        optionally parsing its files in the given worker pool.
+        """
         logger.info("Analyzing %s...", repo_name)
 
         repo_calls: Counter[str] = Counter()
@@ -196,15 +413,13 @@ class ScipyUsageAnalyzer:
         n_total = 0
         n_relevant = 0
 
-        for py_path in find_python_files(repo_path):
+        for source_path, usage in self._analyze_sources(iter_sources(repo_path), pool):
             n_total += 1
-
-            try:
-                calls, modules = parse_scipy_usage(py_path)
-            except SyntaxError:
-                logger.exception("Failed to parse %s", py_path)
+            if usage is None:
+                logger.error("Failed to parse %s in %s", source_path, repo_name)
                 continue
 
+            calls, modules = usage
             if calls or modules:
                 n_relevant += 1
                 repo_calls.update(calls)
@@ -245,11 +460,20 @@ class ScipyUsageAnalyzer:
     ) -> None:
         """Analyze multiple repositories and save results."""
         with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            for repo_name in repo_list:
-                repo_path = download_repo(repo_name, temp_path)
-                self.analyze_repo(repo_name, repo_path)
+            locate = functools.partial(self.locator.locate, download_dir=Path(temp_dir))
+
+            if self.jobs == 1:
+                for repo_name in repo_list:
+                    self.analyze_repo(repo_name, locate(repo_name))
+            else:
+                # repos are downloaded in the background, but analyzed in order
+                with (
+                    ThreadPoolExecutor(self.jobs) as downloads,
+                    ProcessPoolExecutor(self.jobs) as pool,
+                ):
+                    repo_paths: Iterable[Path] = downloads.map(locate, repo_list)
+                    for repo_name, repo_path in zip(repo_list, repo_paths, strict=True):
+                        self.analyze_repo(repo_name, repo_path, pool)
 
         self.generate_report(output_file)
 
@@ -284,9 +508,7 @@ class ScipyUsageAnalyzer:
                 if field_name in sorted_stats:
                     field_dict = sorted_stats[field_name]
                     sorted_stats[field_name] = dict(
-                        sorted(
-                            field_dict.items(), key=operator.itemgetter(1), reverse=True
-                        )
+                        sorted(field_dict.items(), key=_by_count)
                     )
             sorted_repo_stats[repo_name] = sorted_stats
 
@@ -338,16 +560,26 @@ class ScipyVisitor(ast.NodeVisitor):
         self.calls: set[str] = set()
         self.scipy_aliases: dict[str, str] = {}  # Maps aliases to scipy modules
 
+    def reset(self) -> None:
+        """Forget the results, so that the visitor can be reused for another file."""
+        self.imports = set()
+        self.calls = set()
+        self.scipy_aliases = {}
+
     @override
     def visit_Import(self, node: ast.Import) -> None:
         """Handle 'import scipy...' statements."""
         for alias in node.names:
             if alias.name.startswith("scipy"):
                 import_name = alias.name
-                alias_name = alias.asname or alias.name
-
                 self.imports.add(import_name)
-                self.scipy_aliases[alias_name] = import_name
+
+                # `import scipy.linalg` binds `scipy`
+                if alias.asname:
+                    self.scipy_aliases[alias.asname] = import_name
+                else:
+                    root = import_name.partition(".")[0]
+                    self.scipy_aliases[root] = root
 
         self.generic_visit(node)
 
@@ -379,11 +611,10 @@ class ScipyVisitor(ast.NodeVisitor):
         # Only count names that are not in call position (handled by visit_Call)
         # This catches cases like: map(gammaln, x) where gammaln is passed as arg
 
-        if scipy_ref := self._resolve_scipy_call(node.id):
+        # a name has no dots, so it can only refer to scipy through an alias
+        if scipy_ref := self.scipy_aliases.get(node.id):
             self.calls.add(scipy_ref)
 
-        self.generic_visit(node)
-
     # Remove visit_Attribute - we only want actual function calls, not attribute access
 
     def _get_call_name(self, node: ast.expr) -> str:
@@ -411,16 +642,11 @@ class ScipyVisitor(ast.NodeVisitor):
         if call_name.startswith("scipy."):
             return call_name
 
-        # Check if it matches any known scipy aliases
-        for alias, scipy_module in self.scipy_aliases.items():
-            if call_name.startswith(alias + "."):
-                # Replace the alias with the actual scipy module
-                return call_name.replace(alias, scipy_module, 1)
-            if call_name == alias:
-                # Direct call to an imported function
-                return scipy_module
-
-        return None
+        # Replace the alias (the first segment) with the actual scipy module
+        alias, dot, rest = call_name.partition(".")
+        if (scipy_module := self.scipy_aliases.get(alias)) is None:
+            return None
+        return f"{scipy_module}{dot}{rest}"
 
 
 def main() -> None:
@@ -444,11 +670,55 @@ def main() -> None:
     _ = parser.add_argument(
         "--sample", type=int, help="Analyze only a sample of N repositories"
     )
+    _ = parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of repositories to download, and files to parse, concurrently",
+    )
+    _ = parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory in which the results per file are cached (default: no cache)",
+    )
+    _ = parser.add_argument(
+        "--archive-dir",
+        type=Path,
+        help=(
+            "Directory with checkouts (`owner_repo/`) or zip archives "
+            "(`owner_repo[_branch].zip`) of the repositories. Missing ones are "
+            "downloaded into it, and kept for later runs"
+        ),
+    )
+    _ = parser.add_argument(
+        "--manifest",
+        type=Path,
+        help=(
+            "JSON file that maps `owner/repo` to the path of a checkout or zip "
+            "archive; its repositories are analyzed if --repos is not given"
+        ),
+    )
+    _ = parser.add_argument(
+        "--module-index",
+        choices=MODULE_INDICES,
+        default="stubs",
+        help=(
+            "Determine the names of the scipy modules from the layout of scipy-stubs, "
+            "or from the RECORD of the installed scipy (default: stubs)"
+        ),
+    )
+    _ = parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Fail instead of downloading the repositories that aren't available",
+    )
 
     args = parser.parse_args()
 
-    # Use provided repos or default list
-    repos = args.repos or DEFAULT_REPOS
+    manifest: dict[str, Path] = read_manifest(args.manifest) if args.manifest else {}
+
+    # Use provided repos, those in the manifest, or the default list
+    repos = args.repos or list(manifest) or DEFAULT_REPOS
 
     # Use sample if specified
     if args.sample:
@@ -456,7 +726,14 @@ def main() -> None:
         logger.info("Analyzing sample of %d repositories", len(repos))
 
     # Run the analysis
-    analyzer = ScipyUsageAnalyzer()
+    analyzer = ScipyUsageAnalyzer(
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        locator=RepoLocator(
+            archive_dir=args.archive_dir, manifest=manifest, offline=args.offline
+        ),
+        module_index=args.module_index,
+    )
     analyzer.analyze_repositories(repos, args.output)
 
 
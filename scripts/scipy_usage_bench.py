@@ -0,0 +1,99 @@
+"""
+Micro-benchmark of the `ScipyVisitor` of `scipy_usage.py` on a large synthetic module.
+
+The module imports many scipy functions under an alias, and then calls each of them
+many times. It is visited with the current visitor, and with a reference visitor that
+resolves names by scanning all of the aliases, as `ScipyVisitor` did before it used a
+dict lookup. Both must find the same calls.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import ast
+import statistics
+import sys
+import time
+from typing import override
+
+from scipy_usage import ScipyVisitor
+
+
+class LinearScipyVisitor(ScipyVisitor):
+    """Reference visitor that resolves the aliases with a linear scan."""
+
+    @override
+    def visit_Name(self, node: ast.Name) -> None:
+        if scipy_ref := self._resolve_scipy_call(node.id):
+            self.calls.add(scipy_ref)
+
+    @override
+    def _resolve_scipy_call(self, call_name: str) -> str | None:
+        if call_name.startswith("scipy."):
+            return call_name
+
+        for alias, scipy_module in self.scipy_aliases.items():
+            if call_name.startswith(alias + "."):
+                return call_name.replace(alias, scipy_module, 1)
+            if call_name == alias:
+                return scipy_module
+
+        return None
+
+
+def synthetic_module(n_imports: int, n_calls: int) -> str:
+    """A module with `n_imports` aliased imports, each called `n_calls` times."""
+    lines = [f"from scipy.special import f{i} as alias_{i}" for i in range(n_imports)]
+    lines += ["", "def main(x):"]
+    lines += [
+        f"    y = alias_{i}(x) + alias_{i}.attr(x, local_{j})"
+        for j in range(n_calls)
+        for i in range(n_imports)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _time_visitor(visitor: ScipyVisitor, tree: ast.Module, *, repeat: int) -> float:
+    times: list[float] = []
+    for _ in range(repeat):
+        visitor.reset()
+        start = time.perf_counter()
+        visitor.visit(tree)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ScipyVisitor alias lookup on a synthetic module"
+    )
+    _ = parser.add_argument(
+        "--imports", type=int, default=200, help="Number of aliased scipy imports"
+    )
+    _ = parser.add_argument(
+        "--calls", type=int, default=10, help="Number of calls per import"
+    )
+    _ = parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per measurement"
+    )
+    args = parser.parse_args()
+
+    tree = ast.parse(synthetic_module(args.imports, args.calls))
+
+    linear, current = LinearScipyVisitor(), ScipyVisitor()
+    t_linear = _time_visitor(linear, tree, repeat=args.repeat)
+    t_current = _time_visitor(current, tree, repeat=args.repeat)
+
+    if linear.calls != current.calls or linear.imports != current.imports:
+        print("the visitors found different scipy calls", file=sys.stderr)
+        return 1
+
+    n_nodes = sum(1 for _ in ast.walk(tree))
+    print(f"{n_nodes} nodes, {len(current.calls)} scipy calls")
+    print(f"linear scan: {t_linear * 1000:>9.1f} ms")
+    print(f"dict lookup: {t_current * 1000:>9.1f} ms ({t_linear / t_current:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,667 @@
+"""
+Report complexity metrics of the stubs in `scipy-stubs/`, per function and per module.
+
+For each function (or method), these are:
+
+- `overloads`: the number of overloads (1 if it isn't overloaded)
+- `union_width`: the maximum number of members of a union in its signature(s)
+- `literal_cardinality`: the maximum number of `Literal` values of an annotation
+- `type_params`: the maximum number of type parameters of its signature(s)
+- `protocol_depth`: the maximum inheritance depth of the protocols that its annotations
+  (or its class) refer to, where a protocol without protocol bases has depth 1
+
+The unions and literals are counted as written, so type aliases aren't expanded. For
+each module, these are the total number of overloads and the maxima of the others, over
+the whole module. In addition, the lines, and the number of modules and lines in the
+transitive import closure of the module are reported.
+
+With `--history`, the metrics are instead computed for each (first-parent) commit in the
+given git revision range, e.g. `v1.16.0.0..HEAD`. Per commit, a summary is reported,
+together with the metrics of the modules that changed since the previous commit. The
+facts that are extracted from each stub file are cached by the hash of its git blob, so
+only the stubs that changed between commits are parsed.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+# ruff: file-ignore[start-process-with-partial-path]
+
+import argparse
+import ast
+import hashlib
+import json
+import subprocess
+import sys
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path, PurePosixPath
+from typing import Final, NamedTuple, NotRequired, TypedDict, override
+
+from import_graph import (
+    SCIPY,
+    Module,
+    closure,
+    existing_module,
+    imported_names,
+    load_graph,
+)
+from overload_count import STUBS_PATH, is_overload, resolve_import, stub_module_name
+from test_coverage import PACKAGES_PUBLIC, load_cache, save_cache, script_hash
+from typecheck_bench import ROOT
+
+CACHE_PATH: Final = ROOT / ".cache" / "stub_metrics.json"
+_STUBS_DIR: Final = STUBS_PATH.name
+_LITERALS: Final = frozenset({"Literal", "L"})
+
+
+class Metrics(TypedDict):
+    overloads: int
+    union_width: int
+    literal_cardinality: int
+    type_params: int
+    protocol_depth: int
+
+
+class ModuleMetrics(Metrics):
+    lines: int
+    closure_modules: int
+    closure_lines: int
+
+
+class Summary(TypedDict):
+    modules: int
+    lines: int
+    functions: int
+    overloads: int
+    union_width: int
+    literal_cardinality: int
+    type_params: int
+    protocol_depth: int
+    public_closure_lines: int
+    """The total lines in the import closures of the public subpackages."""
+
+
+class CommitReport(TypedDict):
+    commit: str
+    date: str
+    subject: str
+    summary: Summary
+    changed: dict[str, ModuleMetrics | None]
+    """The modules whose metrics changed, or `None` if they were removed."""
+
+
+class _FunctionFacts(TypedDict):
+    overloads: int
+    union_width: int
+    literal_cardinality: int
+    type_params: int
+    references: list[str]
+    """The names of the `scipy` classes that it refers to, including its own class."""
+
+
+class ModuleFacts(TypedDict):
+    """The metrics of a stub file that don't depend on the other stubs."""
+
+    lines: int
+    imports: list[str]
+    """The `scipy` names that are imported, which might refer to modules."""
+    aliases: dict[str, str]
+    """The imported `scipy` names, mapped to their fully qualified names."""
+    star_imports: list[str]
+    """The `scipy` modules that all public names are imported from."""
+    classes: dict[str, list[str]]
+    """The classes, mapped to the fully qualified names of their `scipy` bases."""
+    protocols: list[str]
+    """The names of the protocol classes."""
+    variables: dict[str, str]
+    """The module attributes, mapped to the fully qualified name of their type."""
+    union_width: int
+    literal_cardinality: int
+    type_params: int
+    functions: dict[str, _FunctionFacts]
+
+
+class _Blob(NamedTuple):
+    name: str
+    """The git object name of the stub file."""
+    is_package: bool
+
+
+class _Cache(TypedDict):
+    script: str
+    """The hash of this script, which invalidates the cache when it changes."""
+    blobs: dict[str, ModuleFacts]
+    """The facts per `{blob}:{module}`."""
+
+
+class _Snapshot(TypedDict):
+    modules: dict[str, ModuleMetrics]
+    functions: dict[str, Metrics]
+    summary: NotRequired[Summary]
+
+
+###
+# per-file facts
+
+
+def _union_width(node: ast.expr) -> int:
+    match node:
+        case ast.BinOp(op=ast.BitOr()):
+            return _union_width(node.left) + _union_width(node.right)
+        case ast.Subscript(value=ast.Name(id="Union") | ast.Attribute(attr="Union")):
+            return len(node.slice.elts) if isinstance(node.slice, ast.Tuple) else 1
+        case ast.Subscript(
+            value=ast.Name(id="Optional") | ast.Attribute(attr="Optional")
+        ):
+            return 2
+        case _:
+            return 1
+
+
+def _literal_values(node: ast.expr) -> int:
+    match node:
+        case ast.BinOp(op=ast.BitOr()):
+            return _literal_values(node.left) + _literal_values(node.right)
+        case ast.Subscript(value=ast.Name(id=name)) if name in _LITERALS:
+            return len(node.slice.elts) if isinstance(node.slice, ast.Tuple) else 1
+        case ast.Subscript(value=ast.Attribute(attr="Literal")):
+            return len(node.slice.elts) if isinstance(node.slice, ast.Tuple) else 1
+        case _:
+            return 0
+
+
+def _expression_metrics(nodes: Iterable[ast.AST]) -> tuple[int, int]:
+    """The maximum union width and literal cardinality of the expressions."""
+    union_width = literal_cardinality = 0
+    for root in nodes:
+        for node in ast.walk(root):
+            if isinstance(node, ast.expr):
+                union_width = max(union_width, _union_width(node))
+                literal_cardinality = max(literal_cardinality, _literal_values(node))
+    return union_width, literal_cardinality
+
+
+def _is_protocol(base: ast.expr) -> bool:
+    match base:
+        case ast.Subscript(value=value):
+            return _is_protocol(value)
+        case ast.Name(id="Protocol") | ast.Attribute(attr="Protocol"):
+            return True
+        case _:
+            return False
+
+
+def _base_name(base: ast.expr) -> str | None:
+    match base:
+        case ast.Subscript(value=ast.Name(id=name)) | ast.Name(id=name):
+            return name
+        case _:
+            return None
+
+
+def _annotations(node: ast.FunctionDef | ast.AsyncFunctionDef) -> list[ast.expr]:
+    args = node.args
+    params = [*args.posonlyargs, *args.args, *args.kwonlyargs, args.vararg, args.kwarg]
+    annotations = [p.annotation for p in params if p is not None and p.annotation]
+    return [*annotations, node.returns] if node.returns else annotations
+
+
+class _FactsCollector(ast.NodeVisitor):
+    def __init__(self, module: str, aliases: Mapping[str, str]) -> None:
+        super().__init__()
+        self.module = module
+        self.aliases = aliases
+        self.class_stack: list[str] = []
+        self.functions: dict[str, _FunctionFacts] = {}
+        self.classes: dict[str, list[str]] = {}
+        self.protocols: list[str] = []
+        self.variables: dict[str, str] = {}
+
+    def _resolve(self, name: str) -> str | None:
+        return self.aliases.get(name)
+
+    @override
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        fqname = ".".join([self.module, *self.class_stack, node.name])
+        self.classes[fqname] = [
+            fqbase
+            for base in node.bases
+            if (name := _base_name(base)) and (fqbase := self._resolve(name))
+        ]
+        if any(_is_protocol(base) for base in node.bases):
+            self.protocols.append(fqname)
+
+        self.class_stack.append(node.name)
+        self.generic_visit(node)
+        _ = self.class_stack.pop()
+
+    def _visit_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        fqname = ".".join([self.module, *self.class_stack, node.name])
+        annotations = _annotations(node)
+        union_width, literal_cardinality = _expression_metrics(annotations)
+
+        references = {
+            fqref
+            for annotation in annotations
+            for name in ast.walk(annotation)
+            if isinstance(name, ast.Name) and (fqref := self._resolve(name.id))
+        }
+        if self.class_stack:
+            references.add(".".join([self.module, *self.class_stack]))
+
+        empty: _FunctionFacts = {
+            "overloads": 0,
+            "union_width": 0,
+            "literal_cardinality": 0,
+            "type_params": 0,
+            "references": [],
+        }
+        facts = self.functions.setdefault(fqname, empty)
+        # the other definitions of a function without overloads are e.g. setters
+        if not facts["overloads"] or any(map(is_overload, node.decorator_list)):
+            facts["overloads"] += 1
+
+        facts["union_width"] = max(facts["union_width"], union_width)
+        facts["literal_cardinality"] = max(
+            facts["literal_cardinality"], literal_cardinality
+        )
+        facts["type_params"] = max(facts["type_params"], len(node.type_params))
+        facts["references"] = sorted(references.union(facts["references"]))
+
+    @override
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        annotation = node.annotation
+        if isinstance(annotation, ast.Subscript) and _base_name(annotation) == "Final":
+            annotation = annotation.slice
+        if (
+            not self.class_stack
+            and isinstance(node.target, ast.Name)
+            and (name := _base_name(annotation))
+            and (fqtype := self._resolve(name))
+        ):
+            self.variables[node.target.id] = fqtype
+
+    @override
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    @override
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+
+def _aliases(tree: ast.Module, module: str, *, is_package: bool) -> dict[str, str]:
+    """
+    The fully qualified names of the top-level classes, the imported scipy names, and
+    the names that are assigned to those, e.g. `tsem = tvar`.
+    """
+    aliases: dict[str, str] = {}
+    for node in tree.body:
+        match node:
+            case ast.ClassDef(name=name):
+                aliases[name] = f"{module}.{name}"
+            case ast.ImportFrom(names=names):
+                base = resolve_import(node, module, is_package=is_package)
+                if base.split(".")[0] == SCIPY:
+                    for alias in names:
+                        if alias.name != "*":
+                            fqname = f"{base}.{alias.name}"
+                            aliases[alias.asname or alias.name] = fqname
+            case ast.Assign(targets=[ast.Name(id=name)], value=ast.Name(id=value)):
+                aliases[name] = aliases.get(value, f"{module}.{value}")
+            case _:
+                pass
+    return aliases
+
+
+def _star_imports(tree: ast.Module, module: str, *, is_package: bool) -> list[str]:
+    return [
+        base
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom)
+        and node.names[0].name == "*"
+        and (base := resolve_import(node, module, is_package=is_package)).startswith(
+            SCIPY
+        )
+    ]
+
+
+def module_facts(source: str, module: str, *, is_package: bool) -> ModuleFacts:
+    tree = ast.parse(source)
+    aliases = _aliases(tree, module, is_package=is_package)
+
+    collector = _FactsCollector(module, aliases)
+    collector.visit(tree)
+
+    union_width, literal_cardinality = _expression_metrics([tree])
+    generics = [
+        len(node.type_params)
+        for node in ast.walk(tree)
+        if isinstance(
+            node, ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef | ast.TypeAlias
+        )
+    ]
+    return {
+        "lines": len(source.splitlines()),
+        "imports": sorted(imported_names(tree, module, is_package=is_package)),
+        "aliases": aliases,
+        "star_imports": _star_imports(tree, module, is_package=is_package),
+        "classes": collector.classes,
+        "protocols": collector.protocols,
+        "variables": collector.variables,
+        "union_width": union_width,
+        "literal_cardinality": literal_cardinality,
+        "type_params": max(generics, default=0),
+        "functions": collector.functions,
+    }
+
+
+###
+# metrics of all stubs
+
+
+def _protocol_depths(facts: Mapping[str, ModuleFacts]) -> dict[str, int]:
+    """The inheritance depth of each protocol, following re-exports of the bases."""
+    protocols = {
+        name: f["classes"][name] for f in facts.values() for name in f["protocols"]
+    }
+    reexports = {
+        f"{module}.{local}": target
+        for module, f in facts.items()
+        for local, target in f["aliases"].items()
+        if target != f"{module}.{local}"
+    }
+
+    def resolve(name: str) -> str:
+        seen: set[str] = set()
+        while name not in protocols and name in reexports and name not in seen:
+            seen.add(name)
+            name = reexports[name]
+        return name
+
+    depths: dict[str, int] = {}
+
+    def depth(name: str, visiting: frozenset[str]) -> int:
+        if name not in protocols or name in visiting:
+            return 0
+        if name not in depths:
+            bases = (resolve(base) for base in protocols[name])
+            depths[name] = 1 + max(
+                (depth(base, visiting | {name}) for base in bases), default=0
+            )
+        return depths[name]
+
+    return {
+        reference: d
+        for f in facts.values()
+        for function in f["functions"].values()
+        for reference in function["references"]
+        if (d := depth(resolve(reference), frozenset()))
+    } | {name: depth(name, frozenset()) for name in protocols}
+
+
+def compute(facts: Mapping[str, ModuleFacts]) -> _Snapshot:
+    """The metrics of the stub modules, given the facts of each of them."""
+    depths = _protocol_depths(facts)
+
+    functions: dict[str, Metrics] = {}
+    for module_facts_ in facts.values():
+        for name, function in module_facts_["functions"].items():
+            functions[name] = {
+                "overloads": function["overloads"],
+                "union_width": function["union_width"],
+                "literal_cardinality": function["literal_cardinality"],
+                "type_params": function["type_params"],
+                "protocol_depth": max(
+                    (depths.get(ref, 0) for ref in function["references"]), default=0
+                ),
+            }
+
+    graph_modules = {
+        name: Module(
+            Path(name),
+            f["lines"],
+            frozenset(
+                target
+                for imported in f["imports"]
+                if (target := existing_module(imported, facts)) and target != name
+            ),
+        )
+        for name, f in facts.items()
+    }
+    graph = load_graph(graph_modules)
+
+    modules: dict[str, ModuleMetrics] = {}
+    for name, f in facts.items():
+        own = [functions[fq] for fq in f["functions"]]
+        members = closure(graph, name)
+        modules[name] = {
+            "overloads": sum(m["overloads"] for m in own if m["overloads"] > 1),
+            "union_width": f["union_width"],
+            "literal_cardinality": f["literal_cardinality"],
+            "type_params": f["type_params"],
+            "protocol_depth": max(
+                [
+                    *(depths[protocol] for protocol in f["protocols"]),
+                    *(m["protocol_depth"] for m in own),
+                ],
+                default=0,
+            ),
+            "lines": f["lines"],
+            "closure_modules": len(members),
+            "closure_lines": sum(facts[member]["lines"] for member in members),
+        }
+
+    return {
+        "modules": dict(sorted(modules.items())),
+        "functions": dict(sorted(functions.items())),
+    }
+
+
+def summarize(snapshot: _Snapshot) -> Summary:
+    modules = snapshot["modules"].values()
+    functions = snapshot["functions"].values()
+    public = (snapshot["modules"].get(f"{SCIPY}.{p}") for p in PACKAGES_PUBLIC)
+    return {
+        "modules": len(modules),
+        "lines": sum(m["lines"] for m in modules),
+        "functions": len(functions),
+        "overloads": sum(m["overloads"] for m in modules),
+        "union_width": max((m["union_width"] for m in modules), default=0),
+        "literal_cardinality": max(
+            (m["literal_cardinality"] for m in modules), default=0
+        ),
+        "type_params": max((m["type_params"] for m in modules), default=0),
+        "protocol_depth": max((m["protocol_depth"] for m in modules), default=0),
+        "public_closure_lines": sum(m["closure_lines"] for m in public if m),
+    }
+
+
+###
+# caching and git history
+
+
+def empty_cache() -> _Cache:
+    return {"script": script_hash(Path(__file__)), "blobs": {}}
+
+
+def blob_hash(data: bytes) -> str:
+    """The git object name of a blob with this content."""
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+def _git(*args: str, stdin: bytes | None = None) -> bytes:
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, input=stdin, capture_output=True, check=True
+    ).stdout
+
+
+def _read_blobs(blobs: Iterable[str]) -> dict[str, bytes]:
+    """The contents of the git blobs, read with a single `git cat-file` process."""
+    names = list(dict.fromkeys(blobs))
+    if not names:
+        return {}
+
+    output = _git(
+        "cat-file", "--batch", stdin="".join(f"{b}\n" for b in names).encode()
+    )
+    contents: dict[str, bytes] = {}
+    offset = 0
+    for name in names:
+        end = output.index(b"\n", offset)
+        size = int(output[offset:end].split()[2])
+        contents[name] = output[end + 1 : end + 1 + size]
+        offset = end + 1 + size + 1
+    return contents
+
+
+def _module_of(path: PurePosixPath) -> str:
+    """The module name of a path relative to the repository root."""
+    return stub_module_name(STUBS_PATH.joinpath(*path.parts[1:]))
+
+
+def _tree(commit: str) -> dict[str, _Blob]:
+    """The blobs of the stubs at the commit, by module name."""
+    output = _git("ls-tree", "-r", "--full-tree", commit, "--", _STUBS_DIR)
+    blobs: dict[str, _Blob] = {}
+    for line in output.decode().splitlines():
+        info, _, path = line.partition("\t")
+        if path.endswith(".pyi"):
+            pure_path = PurePosixPath(path)
+            is_package = pure_path.name == "__init__.pyi"
+            blobs[_module_of(pure_path)] = _Blob(info.split()[2], is_package)
+    return blobs
+
+
+def _facts(
+    blobs: Mapping[str, _Blob], cache: _Cache, contents: Mapping[str, bytes]
+) -> dict[str, ModuleFacts]:
+    """The facts of each module, parsing only those that aren't cached yet."""
+    facts: dict[str, ModuleFacts] = {}
+    for module, blob in blobs.items():
+        key = f"{blob.name}:{module}"
+        if key not in cache["blobs"]:
+            source = contents[blob.name].decode("utf-8")
+            cache["blobs"][key] = module_facts(
+                source, module, is_package=blob.is_package
+            )
+        facts[module] = cache["blobs"][key]
+    return facts
+
+
+def stub_facts(cache: _Cache) -> dict[str, ModuleFacts]:
+    """The facts of the stubs in the working tree."""
+    blobs: dict[str, _Blob] = {}
+    contents: dict[str, bytes] = {}
+    for path in sorted(STUBS_PATH.rglob("*.pyi")):
+        data = path.read_bytes()
+        blob = _Blob(blob_hash(data), path.name == "__init__.pyi")
+        blobs[stub_module_name(path)] = blob
+        contents[blob.name] = data
+    return _facts(blobs, cache, contents)
+
+
+def snapshot(cache: _Cache) -> _Snapshot:
+    """The metrics of the stubs in the working tree."""
+    return compute(stub_facts(cache))
+
+
+def history(revisions: str, cache: _Cache) -> list[CommitReport]:
+    """The summary and changed module metrics of each first-parent commit."""
+    log = _git(
+        "log", "--first-parent", "--reverse", "--format=%H%x00%cI%x00%s", revisions
+    )
+    commits = [line.split("\0") for line in log.decode().splitlines()]
+
+    trees = {commit: _tree(commit) for commit, _, _ in commits}
+    missing = {
+        blob.name
+        for blobs in trees.values()
+        for module, blob in blobs.items()
+        if f"{blob.name}:{module}" not in cache["blobs"]
+    }
+    contents = _read_blobs(sorted(missing))
+
+    reports: list[CommitReport] = []
+    previous: dict[str, ModuleMetrics] = {}
+    previous_tree: dict[str, _Blob] | None = None
+    current = compute({})
+    for commit, date, subject in commits:
+        # most commits don't touch the stubs, and the closures take a while
+        if trees[commit] != previous_tree:
+            current = compute(_facts(trees[commit], cache, contents))
+            previous_tree = trees[commit]
+        modules = current["modules"]
+        changed: dict[str, ModuleMetrics | None] = {
+            name: metrics
+            for name, metrics in modules.items()
+            if previous.get(name) != metrics
+        }
+        changed |= dict.fromkeys(previous.keys() - modules.keys())
+        reports.append({
+            "commit": commit,
+            "date": date,
+            "subject": subject,
+            "summary": summarize(current),
+            "changed": dict(sorted(changed.items())),
+        })
+        previous = modules
+        print(
+            f"{commit[:10]} {len(changed):>4} modules changed  {subject}",
+            file=sys.stderr,
+        )
+
+    return reports
+
+
+def _print_summary(summary: Summary) -> None:
+    for key, value in summary.items():
+        print(f"{key:<24} {value:>8}", file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Report complexity metrics of the scipy-stubs modules"
+    )
+    _ = parser.add_argument(
+        "output", nargs="?", default="stub_metrics.json", help="Output JSON file path"
+    )
+    _ = parser.add_argument(
+        "--history",
+        metavar="REVISIONS",
+        help="Report the metrics of each commit in this git revision range instead",
+    )
+    _ = parser.add_argument(
+        "--cache",
+        type=Path,
+        default=CACHE_PATH,
+        help="Path of the cache file (default: .cache/stub_metrics.json)",
+    )
+    _ = parser.add_argument(
+        "--no-cache", action="store_true", help="Don't read or write the cache"
+    )
+    args = parser.parse_args()
+
+    cache = empty_cache() if args.no_cache else load_cache(args.cache, empty_cache())
+
+    result: _Snapshot | Sequence[CommitReport]
+    if args.history:
+        try:
+            result = reports = history(args.history, cache)
+        except subprocess.CalledProcessError as e:
+            parser.error(f"invalid revision range: {e.stderr.decode().strip()}")
+        if reports:
+            _print_summary(reports[-1]["summary"])
+    else:
+        result = current = snapshot(cache)
+        current["summary"] = summarize(current)
+        _print_summary(current["summary"])
+
+    if not args.no_cache:
+        save_cache(args.cache, cache)
+
+    _ = Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""
+Run stubtest on the stubs in concurrent shards, one per subpackage of `scipy`.
+
+Each subpackage of `scipy-stubs/` (including the private ones) is checked by a separate
+stubtest process, together with its submodules, and the top-level modules of `scipy`
+are checked by another one, without their submodules. Their errors are merged into a
+single report, and an allowlist entry of `.mypyignore` is reported as unused only if
+none of the shards used it.
+
+The shards that pass are cached in `.cache/stubtest.json`, keyed by the installed
+versions of scipy, numpy, mypy, and Python, the allowlist, and the contents of the stubs
+in the import closure of the shard. So after a change to `scipy-stubs/signal/`, only the
+shards that (transitively) import `scipy.signal` are checked again, and the other
+subpackages of scipy aren't even imported.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Iterable, Mapping, Sequence, Set as AbstractSet
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version
+from pathlib import Path
+from typing import Final, NamedTuple, TypedDict
+
+from import_graph import SCIPY, Module, closure, collect_modules, load_graph
+from overload_count import STUBS_PATH
+from test_coverage import load_cache, save_cache, script_hash
+from typecheck_bench import ROOT
+
+ALLOWLIST_PATH: Final = ROOT / ".mypyignore"
+
+_CACHE_PATH: Final = ROOT / ".cache" / "stubtest.json"
+_UNUSED: Final = "note: unused allowlist entry "
+_STUBTEST_ARGS: Final = (
+    "--concise",
+    f"--mypy-config-file={ROOT / 'pyproject.toml'}",
+    f"--allowlist={ALLOWLIST_PATH}",
+)
+
+# stubtest also checks all submodules of the given modules, which for `scipy` would be
+# all of them, and it has no option to disable that. So the top-level modules are
+# checked with `find_submodules=False` passed to the internal `build_stubs` of stubtest.
+# Its signature is checked first, so that a `mypy` upgrade (it is pinned in
+# `pyproject.toml`) that changes it makes the shard fail, instead of silently checking
+# all submodules.
+_STUBTEST_NONRECURSIVE: Final = """\
+import inspect
+import sys
+from mypy import stubtest
+
+_build_stubs = stubtest.build_stubs
+_params = list(inspect.signature(_build_stubs).parameters)
+if _params != ["modules", "options", "find_submodules"]:
+    sys.exit(f"unsupported signature of mypy.stubtest.build_stubs: {_params}")
+
+def build_stubs(modules, options, find_submodules=False):
+    return _build_stubs(modules, options, find_submodules=False)
+
+stubtest.build_stubs = build_stubs
+sys.exit(stubtest.main())
+"""
+
+
+class Shard(NamedTuple):
+    name: str
+    """The subpackage name, or `scipy` for the top-level modules."""
+    modules: tuple[str, ...]
+    recursive: bool
+    closure: frozenset[str]
+    """The stub modules that the shard loads."""
+
+
+class ShardResult(NamedTuple):
+    errors: list[str]
+    unused: list[str]
+    """The allowlist entries that weren't used."""
+    wall: float
+    returncode: int
+
+
+class _CacheEntry(TypedDict):
+    key: str
+    unused: list[str]
+    wall: float
+
+
+class _Cache(TypedDict):
+    script: str
+    """The hash of this script, which invalidates the cache when it changes."""
+    shards: dict[str, _CacheEntry]
+
+
+def make_shards(modules: Mapping[str, Module]) -> list[Shard]:
+    """The shards, in order of decreasing number of stub lines that they load."""
+    graph = load_graph(modules)
+
+    subpackages: dict[str, list[str]] = {}
+    for name, module in modules.items():
+        toplevel = module.path.parent == STUBS_PATH
+        key = SCIPY if toplevel else name.split(".")[1]
+        subpackages.setdefault(key, []).append(name)
+
+    # so that stubtest also reports the runtime modules without stubs
+    runtime = _runtime_modules()
+    for name, is_package in runtime.items():
+        _ = subpackages.setdefault(name if is_package else SCIPY, [])
+
+    shards: list[Shard] = []
+    for key, members in subpackages.items():
+        recursive = key != SCIPY
+        if recursive:
+            targets = (f"{SCIPY}.{key}",)
+        else:
+            toplevel = {f"{SCIPY}.{name}" for name, pkg in runtime.items() if not pkg}
+            targets = tuple(sorted({*members, *toplevel}))
+        loaded = frozenset[str]().union(*(closure(graph, member) for member in members))
+        shards.append(Shard(key, targets, recursive, loaded))
+
+    def lines(shard: Shard) -> int:
+        return sum(modules[name].lines for name in shard.closure)
+
+    return sorted(shards, key=lines, reverse=True)
+
+
+def _runtime_modules() -> dict[str, bool]:
+    """Whether each submodule of `scipy` is a package, without importing scipy."""
+    spec = importlib.util.find_spec(SCIPY)
+    if spec is None or spec.submodule_search_locations is None:
+        return {}
+
+    locations = spec.submodule_search_locations
+    return {module.name: module.ispkg for module in pkgutil.iter_modules(locations)}
+
+
+def _environment() -> str:
+    versions = [f"{dist}=={version(dist)}" for dist in ("scipy", "numpy", "mypy")]
+    return " ".join([*versions, platform.python_version()])
+
+
+def shard_key(shard: Shard, modules: Mapping[str, Module], environment: str) -> str:
+    """The hash of everything that the result of stubtest on the shard depends on."""
+    digest = hashlib.sha256(environment.encode())
+    digest.update(ALLOWLIST_PATH.read_bytes())
+    digest.update(repr(shard.modules).encode())
+    for name in sorted(shard.closure):
+        digest.update(name.encode())
+        digest.update(modules[name].path.read_bytes())
+    return digest.hexdigest()
+
+
+def _empty_cache() -> _Cache:
+    return {"script": script_hash(Path(__file__)), "shards": {}}
+
+
+def stubtest_command(shard: Shard) -> list[str]:
+    if shard.recursive:
+        return [sys.executable, "-m", "mypy.stubtest", *_STUBTEST_ARGS, *shard.modules]
+    return [
+        sys.executable,
+        "-c",
+        _STUBTEST_NONRECURSIVE,
+        *_STUBTEST_ARGS,
+        *shard.modules,
+    ]
+
+
+def run_shard(shard: Shard) -> ShardResult:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        stubtest_command(shard), cwd=ROOT, check=False, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+
+    errors: list[str] = []
+    unused: list[str] = []
+    for line in proc.stdout.splitlines():
+        if line.startswith(_UNUSED):
+            unused.append(line.removeprefix(_UNUSED))
+        elif line.strip():
+            errors.append(line)
+
+    if proc.returncode and not errors and not unused:
+        # a crash, e.g. because the stubs could not be built
+        errors = proc.stderr.splitlines() or [f"stubtest exited with {proc.returncode}"]
+
+    return ShardResult(errors, unused, wall, proc.returncode)
+
+
+def cached_results(cache: _Cache, keys: Mapping[str, str]) -> dict[str, ShardResult]:
+    """The results of the shards that passed before, and haven't changed since."""
+    return {
+        name: ShardResult([], entry["unused"], entry["wall"], 0)
+        for name, key in keys.items()
+        if (entry := cache["shards"].get(name)) is not None and entry["key"] == key
+    }
+
+
+def update_cache(
+    cache: _Cache, keys: Mapping[str, str], results: Mapping[str, ShardResult]
+) -> None:
+    """Add the shards that passed to the cache."""
+    for name, result in results.items():
+        if not result.errors:
+            cache["shards"][name] = {
+                "key": keys[name],
+                "unused": result.unused,
+                "wall": round(result.wall, 2),
+            }
+
+
+def unused_entries(results: Iterable[ShardResult]) -> set[str]:
+    """The allowlist entries that none of the shards used."""
+    unused = [set(result.unused) for result in results]
+    return set[str].intersection(*unused) if unused else set()
+
+
+def _print_summary(
+    shards: Sequence[Shard],
+    results: Mapping[str, ShardResult],
+    cached: AbstractSet[str],
+) -> None:
+    print(f"\n{'shard':<16} {'modules':>7} {'time':>8}  status", file=sys.stderr)
+    for shard in shards:
+        result = results[shard.name]
+        if shard.name in cached:
+            status = "cached"
+        else:
+            status = f"{len(result.errors)} errors" if result.errors else "ok"
+        line = (
+            f"{shard.name:<16} {len(shard.closure):>7} {result.wall:>7.1f}s  {status}"
+        )
+        print(line, file=sys.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Run stubtest in concurrent shards per subpackage"
+    )
+    _ = parser.add_argument(
+        "subpackages",
+        nargs="*",
+        help="The subpackages to check, or `scipy` for the top-level modules "
+        "(default: all)",
+    )
+    _ = parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of shards that are checked concurrently (default: all cores)",
+    )
+    _ = parser.add_argument(
+        "--cache",
+        type=Path,
+        default=_CACHE_PATH,
+        help="Path of the cache file (default: .cache/stubtest.json)",
+    )
+    _ = parser.add_argument(
+        "--no-cache", action="store_true", help="Don't read or write the cache"
+    )
+    args = parser.parse_args()
+
+    modules = collect_modules()
+    shards = make_shards(modules)
+    if args.subpackages:
+        if unknown := set(args.subpackages) - {shard.name for shard in shards}:
+            parser.error(f"unknown subpackages: {', '.join(sorted(unknown))}")
+        shards = [shard for shard in shards if shard.name in args.subpackages]
+
+    cache = load_cache(args.cache, _empty_cache()) if not args.no_cache else None
+    environment = _environment()
+    keys = {shard.name: shard_key(shard, modules, environment) for shard in shards}
+
+    results: dict[str, ShardResult] = {}
+    if cache is not None:
+        results |= cached_results(cache, keys)
+    cached = set(results)
+
+    pending = [shard for shard in shards if shard.name not in cached]
+    with ThreadPoolExecutor(max(args.jobs, 1)) as pool:
+        for shard, result in zip(pending, pool.map(run_shard, pending), strict=True):
+            results[shard.name] = result
+
+    for shard in shards:
+        for error in results[shard.name].errors:
+            print(error)
+
+    # the other allowlist entries might be used by the shards that weren't checked
+    unused = unused_entries(results.values()) if not args.subpackages else set[str]()
+    for entry in sorted(unused):
+        print(f"{_UNUSED}{entry}")
+
+    _print_summary(shards, results, cached)
+
+    if cache is not None:
+        update_cache(cache, keys, results)
+        save_cache(args.cache, cache)
+
+    return 1 if unused or any(result.errors for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,27 @@
-"""Require that every public `scipy.*` name is accessed somewhere in tests/."""
+"""
+Require that every public `scipy.*` name is accessed somewhere in tests/.
+
+The names that each test file accesses are cached by its mtime and hash, and the public
+names are cached per scipy version, so that only the changed test files are parsed, and
+scipy is only imported after it was upgraded.
+"""
 
 # ruff: file-ignore[assert, print]
 
+import argparse
 import ast
+import hashlib
 import importlib
+import json
 import sys
+from collections.abc import Mapping
+from importlib.metadata import version
 from pathlib import Path
-from typing import Final
+from typing import Final, TypedDict
 
 _SCIPY: Final = "scipy"
+_ROOT: Final = Path(__file__).parent.parent
+_CACHE_PATH: Final = _ROOT / ".cache" / "test_coverage.json"
 _IGNORED_SUFFIXES: Final = {"__class__"}
 _IGNORED_QUALNAMES: Final = {
     # `scipy.special.digamma` is an alias of `scipy.special.psi`.
@@ -31,7 +44,7 @@ _IGNORED_QUALNAMES: Final = {
     "scipy.stats.mstats.ttest_onesamp",
 }
 
-_PACKAGES_PUBLIC: Final = (
+PACKAGES_PUBLIC: Final = (
     "cluster",
     "cluster.hierarchy",
     "cluster.vq",
@@ -185,6 +198,48 @@ _PACKAGES_DEPRECATED: Final = (
 )
 
 
+class _FileEntry(TypedDict):
+    mtime_ns: int
+    size: int
+    sha256: str
+    names: list[str]
+
+
+class _Cache(TypedDict):
+    script: str
+    """The hash of this script, which invalidates the cache when it changes."""
+    files: dict[str, _FileEntry]
+    public: dict[str, list[str]]
+    """The public names per scipy version."""
+
+
+def script_hash(script: Path) -> str:
+    """The hash of a script, which invalidates its cache when the script changes."""
+    return hashlib.sha256(script.read_bytes()).hexdigest()
+
+
+def load_cache[CacheT: Mapping[str, object]](path: Path, empty: CacheT) -> CacheT:
+    """Load the cache, or return `empty` if it is missing or outdated."""
+    try:
+        cache: CacheT = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+    else:
+        if cache.get("script") == empty["script"]:
+            return cache
+
+    return empty
+
+
+def save_cache(path: Path, cache: Mapping[str, object]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _ = path.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+
+
+def _empty_cache() -> _Cache:
+    return {"script": script_hash(Path(__file__)), "files": {}, "public": {}}
+
+
 def _extract_attribute_chain(node: ast.Attribute) -> list[str]:
     """Extract the full attribute chain from an ast.Attribute node.
 
@@ -223,25 +278,22 @@ def _resolve_to_qualname(parts: list[str], imports: dict[str, str]) -> str | Non
     return None
 
 
-def _parse_scipy_imports(tree: ast.AST) -> dict[str, str]:
-    """Extract scipy imports, returning a mapping of local name -> qualified name."""
-    imports: dict[str, str] = {}
-
-    for node in ast.walk(tree):
-        match node:
-            case ast.ImportFrom(module=str(m), names=aliases) if m.startswith(_SCIPY):
-                for alias in aliases:
-                    imports[alias.asname or alias.name] = f"{m}.{alias.name}"
-
-            case ast.Import(names=aliases):
-                for alias in aliases:
-                    if alias.name.startswith(_SCIPY):
-                        imports[alias.asname or alias.name] = alias.name
+def _add_scipy_imports(
+    node: ast.Import | ast.ImportFrom, imports: dict[str, str]
+) -> None:
+    """Add the scipy imports as a mapping of local name -> qualified name."""
+    match node:
+        case ast.ImportFrom(module=str(m), names=aliases) if m.startswith(_SCIPY):
+            for alias in aliases:
+                imports[alias.asname or alias.name] = f"{m}.{alias.name}"
 
-            case _:
-                pass
+        case ast.Import(names=aliases):
+            for alias in aliases:
+                if alias.name.startswith(_SCIPY):
+                    imports[alias.asname or alias.name] = alias.name
 
-    return imports
+        case _:
+            pass
 
 
 def _should_ignore(qualname: str) -> bool:
@@ -253,7 +305,7 @@ def _should_ignore(qualname: str) -> bool:
     parts = qualname.split(".")
     if any(part.startswith("_") for part in parts[1:]):
         return True  # private
-    if len(parts) < 3 or qualname.removeprefix("scipy.") in _PACKAGES_PUBLIC:  # ruff: ignore[magic-value-comparison]
+    if len(parts) < 3 or qualname.removeprefix("scipy.") in PACKAGES_PUBLIC:  # ruff: ignore[magic-value-comparison]
         return True  # bare package
     for deprecated_pkg in _PACKAGES_DEPRECATED:
         if (
@@ -264,58 +316,107 @@ def _should_ignore(qualname: str) -> bool:
     return False
 
 
-def _find_scipy_names_in_tree(tree: ast.AST, imports: dict[str, str]) -> set[str]:
-    """Find all scipy names that are actually used in the AST."""
-    used: set[str] = set()
-
-    for node in ast.walk(tree):
-        qualname: str | None = None
-        if isinstance(node, ast.Name) and node.id in imports:
-            qualname = imports[node.id]
-        elif isinstance(node, ast.Attribute):
-            qualname = _resolve_to_qualname(_extract_attribute_chain(node), imports)
-        if qualname is None:
-            continue
-
-        if not _should_ignore(qualname):
-            used.add(qualname)
+def _find_scipy_names_in_tree(tree: ast.AST) -> set[str]:
+    """Find all scipy names that are actually used in the AST.
 
-    return used
+    The imports and the name accesses are collected in a single pass, and the names are
+    resolved afterwards, so that imports below their first use are also taken into
+    account.
+    """
+    imports: dict[str, str] = {}
+    names: list[str] = []
+    chains: list[list[str]] = []
 
+    for node in ast.walk(tree):
+        match node:
+            case ast.Import() | ast.ImportFrom():
+                _add_scipy_imports(node, imports)
+            case ast.Name(id=name):
+                names.append(name)
+            case ast.Attribute():
+                chains.append(_extract_attribute_chain(node))
+            case _:
+                pass
 
-def names_tested(tests_dir: Path | None = None) -> set[str]:
+    qualnames = [imports[name] for name in names if name in imports]
+    qualnames += [
+        qualname
+        for chain in chains
+        if (qualname := _resolve_to_qualname(chain, imports)) is not None
+    ]
+    return {qualname for qualname in qualnames if not _should_ignore(qualname)}
+
+
+def _names_in_file(path: Path, entry: _FileEntry | None) -> _FileEntry:
+    """The (cached) names that the test file accesses."""
+    stat = path.stat()
+    if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return entry
+
+    data = path.read_bytes()
+    sha256 = hashlib.sha256(data).hexdigest()
+    if entry and entry["sha256"] == sha256:
+        names = entry["names"]
+    else:
+        tree = ast.parse(data.decode(), type_comments=True)
+        names = sorted(_find_scipy_names_in_tree(tree))
+
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+        "names": names,
+    }
+
+
+def names_tested(
+    tests_dir: Path | None = None, cache: _Cache | None = None
+) -> set[str]:
     """Collect all public scipy names accessed in test files.
 
     Args:
         tests_dir: Path to the tests directory. Defaults to `tests/` relative to
             this script's parent directory.
+        cache: If given, only the test files that changed since they were cached are
+            parsed, and the cache is updated in-place.
 
     Returns:
         A set of fully qualified scipy names (e.g., "scipy.stats.pearsonr").
     """
     if tests_dir is None:
-        tests_dir = Path(__file__).parent.parent / "tests"
+        tests_dir = _ROOT / "tests"
 
     assert tests_dir.exists(), f"Tests directory not found: {tests_dir}"
 
-    all_names: set[str] = set()
-    for pyi_file in tests_dir.rglob("*.pyi"):
-        tree = ast.parse(pyi_file.read_text(), type_comments=True)
-        imports = _parse_scipy_imports(tree)
-        all_names.update(_find_scipy_names_in_tree(tree, imports))
+    cached = cache["files"] if cache is not None else {}
+    entries: dict[str, _FileEntry] = {}
+    for pyi_file in sorted(tests_dir.rglob("*.pyi")):
+        key = pyi_file.relative_to(tests_dir).as_posix()
+        entries[key] = _names_in_file(pyi_file, cached.get(key))
 
-    return all_names
+    if cache is not None:
+        cache["files"] = entries
+
+    return {name for entry in entries.values() for name in entry["names"]}
 
 
-def names_public() -> set[str]:
+def names_public(cache: _Cache | None = None) -> set[str]:
     """Collect all public scipy API names by inspecting `__all__` at runtime.
 
+    Args:
+        cache: If given, scipy is only imported if the installed version has no
+            snapshot of its public names in the cache yet, in which case it is added.
+
     Returns:
         A set of fully qualified scipy names (e.g., "scipy.stats.pearsonr").
     """
+    scipy_version = version(_SCIPY)
+    if cache is not None and scipy_version in cache["public"]:
+        return set(cache["public"][scipy_version])
+
     all_names: set[str] = set()
 
-    for subpkg in _PACKAGES_PUBLIC:
+    for subpkg in PACKAGES_PUBLIC:
         qualname = f"scipy.{subpkg}"
         try:
             module = importlib.import_module(qualname)
@@ -330,12 +431,32 @@ def names_public() -> set[str]:
                 if not _should_ignore(f"{qualname}.{name}")
             )
 
+    if cache is not None:
+        cache["public"][scipy_version] = sorted(all_names)
+
     return all_names
 
 
 def main() -> int:
-    public = names_public()
-    missing = public - names_tested()
+    parser = argparse.ArgumentParser(
+        description="Require that every public scipy name is type-tested"
+    )
+    _ = parser.add_argument(
+        "--cache",
+        type=Path,
+        default=_CACHE_PATH,
+        help="Path of the cache file (default: .cache/test_coverage.json)",
+    )
+    _ = parser.add_argument(
+        "--no-cache", action="store_true", help="Don't read or write the cache"
+    )
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else load_cache(args.cache, _empty_cache())
+    public = names_public(cache)
+    missing = public - names_tested(cache=cache)
+    if cache is not None:
+        save_cache(args.cache, cache)
 
     if not missing:
         print(f"all {len(public)} public names are type-tested")
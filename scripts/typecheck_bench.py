@@ -0,0 +1,267 @@
+"""
+Benchmark the wall time and peak memory usage of the type-checkers on each of the public
+scipy subpackages.
+
+For each public subpackage, a probe file is generated that star-imports it, which is
+type-checked once with a cold cache, and then again with a warm one. Only mypy has a
+persistent cache, so the other checkers are only measured cold. The results are written
+as a JSON baseline, which later runs can be compared against with `--baseline`.
+
+A checker that exits with a status other than 0 or 1 (i.e. it crashed, or it was
+misconfigured) fails the benchmark, instead of being reported as a fast timing.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Final, Literal, NamedTuple, TypedDict
+
+from test_coverage import PACKAGES_PUBLIC
+
+ROOT: Final = Path(__file__).parent.parent
+
+type Checker = Literal["mypy", "basedpyright", "pyrefly", "ty", "zuban"]
+type CacheState = Literal["cold", "warm"]
+
+CHECKERS: Final[tuple[Checker, ...]] = (
+    "mypy",
+    "basedpyright",
+    "pyrefly",
+    "ty",
+    "zuban",
+)
+
+# the checkers with a persistent cache, that are also measured with a warm cache
+CACHED_CHECKERS: Final[frozenset[Checker]] = frozenset({"mypy"})
+
+# `ru_maxrss` is reported in bytes on macOS, and in KiB elsewhere
+_RSS_UNIT: Final = 1 if sys.platform == "darwin" else 1024
+_MIB: Final = 1 << 20
+
+
+class Measurement(NamedTuple):
+    wall: float
+    """Elapsed wall time in seconds."""
+    rss: float | None
+    """Peak resident set size in MiB, or `None` if not supported on this platform."""
+    returncode: int
+    stderr: str = ""
+    """What the command wrote to stderr, e.g. the traceback if it crashed."""
+
+
+class _Stats(TypedDict):
+    wall: float
+    rss: float | None
+
+
+type _Results = dict[str, dict[str, dict[CacheState, _Stats]]]
+
+
+class _Report(TypedDict):
+    meta: dict[str, str]
+    results: _Results
+
+
+def checker_command(
+    checker: Checker, paths: Sequence[str | Path], *, cache_dir: Path
+) -> list[str]:
+    """The command that type-checks `paths`, with its cache (if any) in `cache_dir`."""
+    args = [str(path) for path in paths]
+    match checker:
+        case "mypy":
+            return ["mypy", f"--cache-dir={cache_dir}", *args]
+        case "basedpyright":
+            return ["basedpyright", *args]
+        case "pyrefly" | "ty" | "zuban":
+            return [checker, "check", *args]
+
+
+def measure(
+    cmd: Sequence[str], /, *, cwd: Path = ROOT, env: Mapping[str, str] | None = None
+) -> Measurement:
+    """Run the command, and measure its wall time and peak memory usage."""
+    # a file instead of a pipe, so that the checker can't block on a full pipe buffer
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=stderr
+        )
+
+        rss: float | None = None
+        if sys.platform == "win32":
+            returncode = proc.wait()
+        else:
+            # unlike `proc.wait()`, this also reports the resource usage of the process
+            _, status, usage = os.wait4(proc.pid, 0)
+            returncode = proc.returncode = os.waitstatus_to_exitcode(status)
+            rss = usage.ru_maxrss * _RSS_UNIT / _MIB
+        wall = time.perf_counter() - start
+
+        _ = stderr.seek(0)
+        errors = stderr.read().decode("utf-8", errors="replace")
+
+    return Measurement(wall, rss, returncode, errors)
+
+
+def checked(cmd: Sequence[str], /) -> Measurement:
+    """Measure the command, and raise if the checker didn't run to completion."""
+    result = measure(cmd)
+    if result.returncode > 1:
+        msg = f"{cmd[0]} exited with {result.returncode}: {' '.join(cmd)}"
+        if result.stderr.strip():
+            msg = f"{msg}\n{result.stderr.rstrip()}"
+        raise RuntimeError(msg)
+    return result
+
+
+def _summarize(measurements: Sequence[Measurement]) -> _Stats:
+    wall = statistics.median(m.wall for m in measurements)
+    rss = max((m.rss for m in measurements if m.rss is not None), default=None)
+    return {"wall": round(wall, 3), "rss": None if rss is None else round(rss, 1)}
+
+
+def _write_probe(probe_dir: Path, package: str) -> Path:
+    path = probe_dir / f"probe_{package.replace('.', '_')}.py"
+    _ = path.write_text(f"from scipy.{package} import *\n", encoding="utf-8")
+    return path
+
+
+def bench_package(
+    checker: Checker, package: str, *, repeat: int, work_dir: Path
+) -> dict[CacheState, _Stats]:
+    """Measure the cold (and if cached, warm) type-checking of a probe that imports
+    the package.
+    """
+    probe = _write_probe(work_dir, package)
+
+    cold: list[Measurement] = []
+    warm: list[Measurement] = []
+    for i in range(repeat):
+        cache_dir = work_dir / f"cache_{checker}_{package}_{i}"
+        cmd = checker_command(checker, [probe], cache_dir=cache_dir)
+        cold.append(checked(cmd))
+        if checker in CACHED_CHECKERS:
+            warm.append(checked(cmd))
+
+    stats: dict[CacheState, _Stats] = {"cold": _summarize(cold)}
+    if warm:
+        stats["warm"] = _summarize(warm)
+    return stats
+
+
+def _versions(checkers: Sequence[Checker]) -> dict[str, str]:
+    versions = {"python": platform.python_version()}
+    for dist in ("scipy-stubs", "numpy", "optype", *checkers):
+        try:
+            versions[dist] = version(dist)
+        except PackageNotFoundError:
+            versions[dist] = "n/a"
+    return versions
+
+
+def find_regressions(
+    baseline: _Results, results: _Results, *, threshold: float
+) -> list[str]:
+    """Describe the wall-time increases by more than the `threshold` factor."""
+    regressions: list[str] = []
+    for checker, packages in results.items():
+        for package, states in packages.items():
+            for state, stats in states.items():
+                try:
+                    old = baseline[checker][package][state]["wall"]
+                except KeyError:
+                    continue
+
+                if old > 0 and (ratio := stats["wall"] / old) > threshold:
+                    regressions.append(
+                        f"{checker} {package} ({state}): "
+                        f"{old:.2f}s -> {stats['wall']:.2f}s ({ratio:.1f}x)"
+                    )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the type-checkers on each public scipy subpackage"
+    )
+    _ = parser.add_argument(
+        "output",
+        nargs="?",
+        default="typecheck_bench.json",
+        help="Output JSON file path",
+    )
+    _ = parser.add_argument(
+        "--checker",
+        action="append",
+        choices=CHECKERS,
+        help="Type-checker to benchmark (default: all)",
+    )
+    _ = parser.add_argument(
+        "--package",
+        action="append",
+        choices=PACKAGES_PUBLIC,
+        help="Public subpackage to benchmark (default: all)",
+    )
+    _ = parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of runs per measurement"
+    )
+    _ = parser.add_argument(
+        "--baseline", type=Path, help="JSON file of a previous run to compare against"
+    )
+    _ = parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Slowdown factor w.r.t. the baseline that is reported as a regression",
+    )
+    args = parser.parse_args()
+
+    checkers: list[Checker] = args.checker or list(CHECKERS)
+    packages: list[str] = args.package or list(PACKAGES_PUBLIC)
+
+    results: _Results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for checker in checkers:
+            results[checker] = {}
+            for package in packages:
+                stats = bench_package(
+                    checker, package, repeat=args.repeat, work_dir=Path(tmp)
+                )
+                results[checker][package] = stats
+                warm = f"warm {stats['warm']['wall']:>7.2f}s" if "warm" in stats else ""
+                print(
+                    f"{checker:<12} {package:<24} "
+                    f"cold {stats['cold']['wall']:>7.2f}s  {warm:<13} "
+                    f"rss {stats['cold']['rss'] or 0:>7.1f}MiB",
+                    file=sys.stderr,
+                )
+
+    report: _Report = {"meta": _versions(checkers), "results": results}
+    _ = Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+
+    baseline: _Report = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = find_regressions(
+        baseline["results"], results, threshold=args.threshold
+    )
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,437 @@
+"""
+Type-check the type-tests in `tests/` with mypy, basedpyright, and pyrefly, in shards
+that run concurrently.
+
+The test files are distributed over the shards so that each shard takes about the same
+time to check, based on the check time of each test file in earlier runs. These timings
+are recorded in `.cache/typetest_timings.json` after each run. Test files without a
+recorded timing are assumed to take a time that is proportional to their length.
+
+The diagnostics of all shards are merged into a single report, which is followed by the
+slowest test files of each checker. If a checker fails without reporting diagnostics,
+e.g. because it crashed or its configuration is invalid, its error output is printed
+instead.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+
+import argparse
+import csv
+import heapq
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Final, Literal, NamedTuple, NotRequired, TypedDict, cast
+from urllib.parse import unquote, urlparse
+
+from typecheck_bench import ROOT, checker_command
+
+type Checker = Literal["mypy", "basedpyright", "pyrefly"]
+type _Timings = dict[str, float]
+
+CHECKERS: Final[tuple[Checker, ...]] = "mypy", "basedpyright", "pyrefly"
+TESTS_DIR: Final = ROOT / "tests"
+
+_TIMINGS_PATH: Final = ROOT / ".cache" / "typetest_timings.json"
+_MICROSECONDS: Final = 1e-6
+_MILLISECONDS: Final = 1e-3
+
+# e.g. `  /path/to/test.pyi:2:10 - error: message (reportAssignmentType)`
+_PYRIGHT_DIAGNOSTIC: Final = re.compile(
+    r"^  (?P<path>\S.*?):(?P<line>\d+):(?P<column>\d+) - "
+    r"(?P<severity>\w+): (?P<message>.*)$"
+)
+_PYRIGHT_RULE: Final = re.compile(r"\s*\((?P<rule>report\w+)\)$")
+# e.g. `Long operation: checking: file:///path/to/test.pyi (12681ms)`
+_PYRIGHT_CHECKING: Final = re.compile(
+    r"checking: (?P<uri>file://\S+) \((?P<ms>\d+)ms\)"
+)
+_PYRIGHT_CHECK_TOTAL: Final = re.compile(
+    r"^Check:\s+(?P<seconds>[\d.]+)sec$", re.MULTILINE
+)
+
+
+class Diagnostic(NamedTuple):
+    path: str
+    line: int
+    column: int
+    severity: str
+    message: str
+    code: str
+    checker: Checker
+
+
+class ShardResult(NamedTuple):
+    diagnostics: list[Diagnostic]
+    timings: _Timings
+    """The check time of each test file in the shard, in seconds."""
+    wall: float
+    returncode: int
+    error: str = ""
+    """Why the checker failed, if it exited with an error but without diagnostics."""
+
+
+class _RunOutput(NamedTuple):
+    stdout: str
+    stderr: str
+    report: str
+    """The contents of the timings report, if any."""
+    wall: float
+    returncode: int
+
+
+class _PyreflyError(TypedDict):
+    path: str
+    line: int
+    column: int
+    severity: str
+    name: str
+    description: str
+
+
+class _PyreflyOutput(TypedDict):
+    errors: NotRequired[list[_PyreflyError]]
+
+
+class _MypyDiagnostic(TypedDict):
+    file: str
+    line: int
+    column: int
+    severity: str
+    message: str
+    code: str | None
+
+
+def relative_path(path: str | Path) -> str:
+    path = Path(path)
+    if path.is_absolute() and path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    return path.as_posix()
+
+
+def test_module_name(path: str) -> str:
+    """The dotted name of a test file, relative to the root of the repository."""
+    return path.removesuffix(".pyi").removesuffix("/__init__").replace("/", ".")
+
+
+def test_files(paths: Sequence[Path]) -> list[str]:
+    """The `.pyi` test files in the paths, relative to the root of the repository."""
+    files: set[str] = set()
+    for path in paths:
+        found = path.rglob("*.pyi") if path.is_dir() else [path]
+        files.update(relative_path(file.resolve()) for file in found)
+    return sorted(files)
+
+
+def estimate(files: Sequence[str], timings: Mapping[str, float]) -> _Timings:
+    """The expected check time of each file, based on the earlier `timings`."""
+    lines = {file: len((ROOT / file).read_bytes().splitlines()) for file in files}
+
+    known = [file for file in files if file in timings]
+    known_lines = sum(lines[file] for file in known)
+    rate = sum(timings[file] for file in known) / known_lines if known_lines else 1.0
+
+    return {file: timings.get(file, rate * lines[file]) for file in files}
+
+
+def make_shards(estimates: Mapping[str, float], n_shards: int) -> list[list[str]]:
+    """Distribute the files over the shards, longest first, to balance their times."""
+    shards: list[list[str]] = [[] for _ in range(n_shards)]
+    heap = [(0.0, i) for i in range(n_shards)]
+    for file in sorted(estimates, key=estimates.__getitem__, reverse=True):
+        total, i = heapq.heappop(heap)
+        shards[i].append(file)
+        heapq.heappush(heap, (total + estimates[file], i))
+    return [sorted(shard) for shard in shards if shard]
+
+
+def _run(cmd: Sequence[str], report: Path) -> _RunOutput:
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT, check=False, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+
+    contents = report.read_text(encoding="utf-8") if report.exists() else ""
+    return _RunOutput(proc.stdout, proc.stderr, contents, wall, proc.returncode)
+
+
+def _shard_result(
+    out: _RunOutput, diagnostics: list[Diagnostic], timings: _Timings
+) -> ShardResult:
+    error = ""
+    if out.returncode and not diagnostics:
+        # a crash or a configuration error, e.g. mypy's exit status 2
+        output = out.stderr.strip() or out.stdout.strip()
+        error = output or f"exited with {out.returncode}"
+    return ShardResult(diagnostics, timings, out.wall, out.returncode, error)
+
+
+def parse_mypy_diagnostics(stdout: str) -> list[Diagnostic]:
+    """The diagnostics in the `--output=json` lines of mypy."""
+    diagnostics: list[Diagnostic] = []
+    for line in stdout.splitlines():
+        if line.startswith("{"):
+            d = cast("_MypyDiagnostic", json.loads(line))
+            diagnostics.append(
+                Diagnostic(
+                    relative_path(d["file"]),
+                    d["line"],
+                    d["column"] + 1,
+                    d["severity"],
+                    d["message"],
+                    d["code"] or "",
+                    "mypy",
+                )
+            )
+    return diagnostics
+
+
+def _run_mypy(files: Sequence[str], work_dir: Path) -> ShardResult:
+    stats = work_dir / "timing_stats.txt"
+    cmd = checker_command("mypy", files, cache_dir=work_dir / "cache")
+    out = _run([*cmd, "--output=json", f"--timing-stats={stats}"], stats)
+
+    diagnostics = parse_mypy_diagnostics(out.stdout)
+
+    # the module names are relative to the innermost directory without `__init__`
+    module_times: _Timings = {}
+    for line in out.report.splitlines():
+        module, _, microseconds = line.rpartition(" ")
+        module_times[module] = int(microseconds) * _MICROSECONDS
+
+    timings: _Timings = {}
+    for file in files:
+        parts = test_module_name(file).split(".")
+        candidates = (".".join(parts[i:]) for i in range(len(parts)))
+        if module := next((m for m in candidates if m in module_times), ""):
+            timings[file] = module_times[module]
+
+    return _shard_result(out, diagnostics, timings)
+
+
+def _run_pyrefly(files: Sequence[str], work_dir: Path) -> ShardResult:
+    report = work_dir / "timings.csv"
+    cmd = checker_command("pyrefly", files, cache_dir=work_dir / "cache")
+    out = _run([*cmd, "--output-format=json", f"--report-timings={report}"], report)
+
+    try:
+        output = cast("_PyreflyOutput", json.loads(out.stdout or "{}"))
+    except json.JSONDecodeError:
+        # e.g. a panic, which is printed instead of the JSON report
+        return _shard_result(out._replace(returncode=out.returncode or 1), [], {})
+
+    errors = output.get("errors", [])
+    diagnostics = [
+        Diagnostic(
+            relative_path(e["path"]),
+            e["line"],
+            e["column"],
+            e["severity"],
+            e["description"],
+            e["name"],
+            "pyrefly",
+        )
+        for e in errors
+    ]
+
+    # there is a row for each step of each module
+    files_by_module = {test_module_name(file): file for file in files}
+    timings: _Timings = {}
+    for row in csv.DictReader(out.report.splitlines()):
+        if file := files_by_module.get(row["Module"]):
+            timings[file] = timings.get(file, 0.0) + float(row["Seconds"])
+
+    return _shard_result(out, diagnostics, timings)
+
+
+def _parse_pyright_diagnostics(stdout: str) -> list[Diagnostic]:
+    diagnostics: list[Diagnostic] = []
+    for line in stdout.splitlines():
+        if match := _PYRIGHT_DIAGNOSTIC.match(line):
+            path, lineno, column, severity, message = match.groups()
+            diagnostic = Diagnostic(
+                relative_path(path),
+                int(lineno),
+                int(column),
+                severity,
+                message,
+                "",
+                "basedpyright",
+            )
+            diagnostics.append(diagnostic)
+        elif diagnostics and line.startswith("  "):
+            # continuation of the message of the previous diagnostic, which is
+            # indented with non-breaking spaces
+            last = diagnostics[-1]
+            diagnostics[-1] = last._replace(message=f"{last.message}\n{line.strip()}")
+
+    for i, diagnostic in enumerate(diagnostics):
+        if rule := _PYRIGHT_RULE.search(diagnostic.message):
+            message = diagnostic.message[: rule.start()]
+            diagnostics[i] = diagnostic._replace(message=message, code=rule["rule"])
+
+    return diagnostics
+
+
+def _run_basedpyright(
+    files: Sequence[str], work_dir: Path, estimates: Mapping[str, float]
+) -> ShardResult:
+    cmd = checker_command("basedpyright", files, cache_dir=work_dir / "cache")
+    out = _run([*cmd, "--stats"], work_dir / "no-report")
+
+    # only the files that take long to check are reported individually
+    timings: _Timings = {}
+    for match in _PYRIGHT_CHECKING.finditer(out.stdout):
+        file = relative_path(unquote(urlparse(match["uri"]).path))
+        timings[file] = int(match["ms"]) * _MILLISECONDS
+
+    # the remaining check time is attributed to the other files, by their estimates
+    total = _PYRIGHT_CHECK_TOTAL.search(out.stdout)
+    remaining = float(total["seconds"]) - sum(timings.values()) if total else 0.0
+    rest = [file for file in files if file not in timings]
+    rest_estimate = sum(estimates[file] for file in rest)
+    for file in rest:
+        share = estimates[file] / rest_estimate if rest_estimate else 1 / len(rest)
+        timings[file] = max(remaining, 0.0) * share
+
+    diagnostics = _parse_pyright_diagnostics(out.stdout)
+    return _shard_result(out, diagnostics, timings)
+
+
+def run_shard(
+    checker: Checker,
+    files: Sequence[str],
+    *,
+    work_dir: Path,
+    estimates: Mapping[str, float],
+) -> ShardResult:
+    work_dir.mkdir(parents=True)
+    match checker:
+        case "mypy":
+            return _run_mypy(files, work_dir)
+        case "basedpyright":
+            return _run_basedpyright(files, work_dir, estimates)
+        case "pyrefly":
+            return _run_pyrefly(files, work_dir)
+
+
+def _load_timings(path: Path) -> dict[str, _Timings]:
+    try:
+        return cast("dict[str, _Timings]", json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return {}
+
+
+def print_diagnostics(diagnostics: Sequence[Diagnostic]) -> None:
+    for d in sorted(diagnostics):
+        code = f" [{d.checker}: {d.code}]" if d.code else f" [{d.checker}]"
+        message = d.message.replace("\n", "\n    ")
+        print(f"{d.path}:{d.line}:{d.column}: {d.severity}: {message}{code}")
+
+
+def _print_summary(
+    checker: Checker, results: Sequence[ShardResult], timings: _Timings, top: int
+) -> None:
+    walls = ", ".join(f"{r.wall:.1f}s" for r in results)
+    print(f"\n{checker}: {len(results)} shards ({walls})")
+    for file in sorted(timings, key=timings.__getitem__, reverse=True)[:top]:
+        print(f"  {timings[file]:>7.2f}s  {file}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Type-check the type-tests in parallel shards"
+    )
+    _ = parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[TESTS_DIR],
+        help="Test files or directories to check (default: tests/)",
+    )
+    _ = parser.add_argument(
+        "--checker",
+        action="append",
+        choices=CHECKERS,
+        help="Type-checker to run (default: all)",
+    )
+    _ = parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of shards that are checked concurrently (default: all cores)",
+    )
+    _ = parser.add_argument(
+        "--shards",
+        type=int,
+        help="Number of shards per checker (default: the number of jobs)",
+    )
+    _ = parser.add_argument(
+        "--timings",
+        type=Path,
+        default=_TIMINGS_PATH,
+        help="JSON file with the timings per test file, which is read and updated",
+    )
+    _ = parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of the slowest test files to report for each checker",
+    )
+    args = parser.parse_args()
+
+    checkers: list[Checker] = args.checker or list(CHECKERS)
+    files = test_files(args.paths)
+    timings = _load_timings(args.timings)
+
+    tasks: list[tuple[Checker, list[str], _Timings]] = []
+    for checker in checkers:
+        estimates = estimate(files, timings.get(checker, {}))
+        shards = make_shards(estimates, args.shards or args.jobs)
+        tasks.extend((checker, shard, estimates) for shard in shards)
+
+    with tempfile.TemporaryDirectory() as tmp, ThreadPoolExecutor(args.jobs) as pool:
+        futures = [
+            pool.submit(
+                run_shard,
+                checker,
+                shard,
+                work_dir=Path(tmp) / f"{checker}_{i}",
+                estimates=estimates,
+            )
+            for i, (checker, shard, estimates) in enumerate(tasks)
+        ]
+        results = [future.result() for future in futures]
+
+    print_diagnostics([d for result in results for d in result.diagnostics])
+    for (checker, shard, _), result in zip(tasks, results, strict=True):
+        if result.error:
+            print(f"{checker} failed on {len(shard)} files:", file=sys.stderr)
+            print(result.error, file=sys.stderr)
+
+    for checker in checkers:
+        checker_results = [
+            result
+            for (c, _, _), result in zip(tasks, results, strict=True)
+            if c == checker
+        ]
+        new_timings = {f: t for r in checker_results for f, t in r.timings.items()}
+        _print_summary(checker, checker_results, new_timings, args.top)
+        timings[checker] = dict(
+            sorted((timings.get(checker, {}) | new_timings).items())
+        )
+
+    args.timings.parent.mkdir(parents=True, exist_ok=True)
+    _ = args.timings.write_text(json.dumps(timings, indent=1), encoding="utf-8")
+
+    return 1 if any(result.returncode for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,538 @@
+"""
+Watch the stubs and the type-tests, and re-check the type-tests that are affected by
+each change with long-running type-checker processes.
+
+Instead of starting from scratch on every run, the type-checkers are kept warm between
+changes: mypy as a `dmypy` daemon, and basedpyright and pyrefly as language servers
+(`basedpyright-langserver --stdio` and `pyrefly lsp`). After a change, they only need to
+re-check what depends on it, which usually takes seconds instead of minutes.
+
+The stubs and type-tests are polled for changes every `--interval` seconds. The
+type-tests that are affected by a change are the ones that (transitively) import one of
+the changed stubs or type-tests, according to the import graph of `import_graph.py`.
+These are opened in the language servers, which then re-check them whenever one of their
+dependencies changes. The mypy daemon is given all the type-tests at once, which it
+checks when the watch starts, and it tracks their dependencies itself.
+
+The diagnostics, such as failing `assert_type` calls, are printed as soon as a checker
+reports them. Only the new ones are printed, and the ones that disappear are reported as
+fixed. Stop watching with Ctrl+C.
+"""
+
+# ruff: file-ignore[print, suspicious-subprocess-import, subprocess-without-shell-equals-true]
+
+import argparse
+import ast
+import itertools
+import json
+import subprocess
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+from typing import IO, Final, NotRequired, Protocol, TypedDict, cast
+from urllib.parse import unquote, urlparse
+
+from import_graph import (
+    Graph,
+    Module,
+    closure,
+    collect_modules,
+    existing_module,
+    imported_names,
+    load_graph,
+    read_module,
+)
+from overload_count import STUBS_PATH, stub_module_name
+from typecheck_bench import ROOT
+from typetest import (
+    CHECKERS,
+    TESTS_DIR,
+    Checker,
+    Diagnostic,
+    parse_mypy_diagnostics,
+    print_diagnostics,
+    relative_path,
+    test_files,
+    test_module_name,
+)
+
+_WORK_DIR: Final = ROOT / ".cache" / "typetest_watch"
+_TEST_PACKAGES: Final = frozenset({"scipy", "tests"})
+
+# the LSP `FileChangeType`s
+_CREATED: Final = 1
+_CHANGED: Final = 2
+_DELETED: Final = 3
+
+# the LSP `DiagnosticSeverity`s that are reported
+_SEVERITIES: Final[Mapping[int, str]] = {1: "error", 2: "warning"}
+_LSP_TIMEOUT: Final = 60.0
+
+type _Changes = dict[Path, int]
+"""The changed files, and their `FileChangeType`."""
+
+
+class _Position(TypedDict):
+    line: int
+    character: int
+
+
+class _Range(TypedDict):
+    start: _Position
+    end: _Position
+
+
+class _LspDiagnostic(TypedDict):
+    range: _Range
+    message: str
+    severity: NotRequired[int]
+    code: NotRequired[str | int]
+
+
+class _PublishDiagnosticsParams(TypedDict):
+    uri: str
+    diagnostics: list[_LspDiagnostic]
+
+
+class _ConfigurationItem(TypedDict):
+    section: NotRequired[str]
+
+
+class _ConfigurationParams(TypedDict):
+    items: list[_ConfigurationItem]
+
+
+class _Message(TypedDict):
+    jsonrpc: str
+    id: NotRequired[int | str]
+    method: NotRequired[str]
+    params: NotRequired[object]
+    result: NotRequired[object]
+
+
+class Session(Protocol):
+    """A long-running type-checker process."""
+
+    def update(
+        self, tests: Sequence[str], affected: Sequence[str], changes: _Changes
+    ) -> None:
+        """Re-check the type-tests after the files have changed."""
+        ...
+
+    def stop(self) -> None: ...
+
+
+class Reporter:
+    """Prints the diagnostics of each file that are new, or that have been fixed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lock = threading.Lock()
+        self.reported: dict[tuple[Checker, str], set[Diagnostic]] = {}
+
+    def report(
+        self, checker: Checker, path: str, diagnostics: Iterable[Diagnostic]
+    ) -> None:
+        """Report the current diagnostics of a file."""
+        current = set(diagnostics)
+        with self.lock:
+            previous = self.reported.get((checker, path), set())
+            self.reported[checker, path] = current
+            print_diagnostics(list(current - previous))
+            for d in sorted(previous - current):
+                message = d.message.partition("\n")[0]
+                print(f"{d.path}:{d.line}:{d.column}: fixed: {message} [{checker}]")
+            _ = sys.stdout.flush()
+
+
+def _mtimes(dirs: Iterable[Path]) -> dict[Path, int]:
+    mtimes: dict[Path, int] = {}
+    for path in itertools.chain.from_iterable(d.rglob("*.pyi") for d in dirs):
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+    return mtimes
+
+
+def changes(old: Mapping[Path, int], new: Mapping[Path, int]) -> _Changes:
+    """The files that were created, changed, or deleted between the two snapshots."""
+    changed: _Changes = dict.fromkeys(old.keys() - new.keys(), _DELETED)
+    changed |= dict.fromkeys(new.keys() - old.keys(), _CREATED)
+    changed |= {
+        path: _CHANGED for path in old.keys() & new.keys() if old[path] != new[path]
+    }
+    return changed
+
+
+def _test_imports(path: Path, stubs: Iterable[str], tests: Iterable[str]) -> set[str]:
+    """The stub and type-test modules that are explicitly imported by a type-test."""
+    module = test_module_name(relative_path(path))
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    is_package = path.name == "__init__.pyi"
+    names = imported_names(tree, module, is_package=is_package, packages=_TEST_PACKAGES)
+    found = (
+        existing_module(name, tests) or existing_module(name, stubs) for name in names
+    )
+    return {name for name in found if name and name != module}
+
+
+class Dependencies:
+    """The import graph of the stubs and the type-tests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stubs: dict[str, Module] = collect_modules()
+        self.paths = {self.module(ROOT / f): ROOT / f for f in test_files([TESTS_DIR])}
+        self.tests: Graph = {
+            module: _test_imports(path, self.stubs, self.paths)
+            for module, path in self.paths.items()
+        }
+
+    @staticmethod
+    def module(path: Path) -> str:
+        """The name of a stub or type-test module."""
+        if path.is_relative_to(STUBS_PATH):
+            return stub_module_name(path)
+        return test_module_name(relative_path(path))
+
+    def update(self, changed: _Changes) -> None:
+        """Update the imports of the changed modules, unless they can't be parsed."""
+        for path, change in changed.items():
+            module = self.module(path)
+            is_stub = path.is_relative_to(STUBS_PATH)
+            if change == _DELETED:
+                _ = (self.stubs if is_stub else self.tests).pop(module, None)
+                _ = self.paths.pop(module, None)
+                continue
+            try:
+                if is_stub:
+                    self.stubs[module] = read_module(path, {*self.stubs, module})
+                else:
+                    self.paths[module] = path
+                    self.tests[module] = _test_imports(path, self.stubs, self.paths)
+            except (OSError, SyntaxError, UnicodeDecodeError):
+                # e.g. while the file is being edited
+                continue
+
+    def affected(self, changed: Iterable[Path]) -> set[str]:
+        """The type-test files that (transitively) import one of the changed files."""
+        reverse: Graph = defaultdict(set)
+        for module, imports in itertools.chain(
+            load_graph(self.stubs).items(), self.tests.items()
+        ):
+            for name in imports:
+                reverse[name].add(module)
+
+        modules = {self.module(path) for path in changed}
+        dependents = set[str]().union(*(closure(reverse, m) for m in modules))
+        return {relative_path(self.paths[m]) for m in dependents if m in self.paths}
+
+
+class Dmypy:
+    """A mypy daemon, which checks all the type-tests each time."""
+
+    def __init__(self, tests: Sequence[str], reporter: Reporter) -> None:
+        super().__init__()
+        self.tests = list(tests)
+        self.reporter = reporter
+        self.status_file = _WORK_DIR / "dmypy.json"
+        self.reported: set[str] = set()
+
+        cache_dir = _WORK_DIR / "mypy"
+        _ = self._dmypy("stop")
+        proc = self._dmypy("start", "--", f"--cache-dir={cache_dir}", "--output=json")
+        if proc.returncode:
+            msg = f"dmypy failed to start: {proc.stderr.strip()}"
+            raise RuntimeError(msg)
+
+        self.pending = threading.Event()
+        self.pending.set()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _dmypy(self, *args: str) -> subprocess.CompletedProcess[str]:
+        cmd = ["dmypy", f"--status-file={self.status_file}", *args]
+        return subprocess.run(
+            cmd, cwd=ROOT, check=False, capture_output=True, text=True
+        )
+
+    def _serve(self) -> None:
+        while True:
+            _ = self.pending.wait()
+            self.pending.clear()
+
+            proc = self._dmypy("check", *self.tests)
+            if proc.returncode > 1:
+                message = proc.stderr.strip()
+                print(
+                    f"dmypy exited with {proc.returncode}: {message}", file=sys.stderr
+                )
+                continue
+
+            diagnostics: defaultdict[str, list[Diagnostic]] = defaultdict(list)
+            for diagnostic in parse_mypy_diagnostics(proc.stdout):
+                diagnostics[diagnostic.path].append(diagnostic)
+            for path in {*self.tests, *self.reported, *diagnostics}:
+                self.reporter.report("mypy", path, diagnostics.get(path, []))
+            self.reported = set(diagnostics)
+
+    def update(
+        self, tests: Sequence[str], affected: Sequence[str], changes: _Changes
+    ) -> None:
+        del affected, changes  # the daemon tracks the dependencies itself
+        self.tests = list(tests)
+        self.pending.set()
+
+    def stop(self) -> None:
+        _ = self._dmypy("stop")
+
+
+class LanguageServer:
+    """A language server, in which the affected type-tests are opened."""
+
+    def __init__(
+        self, checker: Checker, cmd: Sequence[str], reporter: Reporter
+    ) -> None:
+        super().__init__()
+        self.checker: Final = checker
+        self.reporter = reporter
+        self.proc = subprocess.Popen(
+            cmd,
+            cwd=ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.versions: dict[str, int] = {}
+        """The version of each open document, by its URI; only the affected type-tests
+        are kept open, so that the server doesn't keep checking the others."""
+
+        self.initialized = threading.Event()
+        threading.Thread(target=self._serve, daemon=True).start()
+        self._send({
+            "jsonrpc": "2.0",
+            "id": next(self.ids),
+            "method": "initialize",
+            "params": {
+                "processId": None,
+                "rootUri": ROOT.as_uri(),
+                "workspaceFolders": [{"uri": ROOT.as_uri(), "name": ROOT.name}],
+                "capabilities": {"workspace": {"configuration": True}},
+            },
+        })
+        if not self.initialized.wait(_LSP_TIMEOUT):
+            self.proc.kill()
+            msg = f"{checker} language server failed to start"
+            raise RuntimeError(msg)
+        self._notify("initialized", {})
+
+    def _send(self, message: _Message) -> None:
+        body = json.dumps(message).encode("utf-8")
+        stdin = cast("IO[bytes]", self.proc.stdin)
+        with self.lock:
+            _ = stdin.write(b"Content-Length: %d\r\n\r\n%b" % (len(body), body))
+            stdin.flush()
+
+    def _notify(self, method: str, params: object) -> None:
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def _receive(self) -> _Message | None:
+        stdout = cast("IO[bytes]", self.proc.stdout)
+        length = 0
+        while line := stdout.readline():
+            if not line.strip():
+                break
+            name, _, value = line.decode("ascii").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return cast("_Message", json.loads(stdout.read(length))) if length else None
+
+    def _serve(self) -> None:
+        while message := self._receive():
+            match message:
+                case {"id": _, "method": method}:
+                    self._respond(message, method)
+                case {"id": _}:
+                    self.initialized.set()
+                case {"method": "textDocument/publishDiagnostics"}:
+                    params = cast("_PublishDiagnosticsParams", message.get("params"))
+                    self._publish(params)
+                case _:
+                    pass
+
+    def _respond(self, request: _Message, method: str) -> None:
+        """Respond to a request of the server, e.g. for the Python interpreter."""
+        result: object = None
+        if method == "workspace/configuration":
+            params = cast("_ConfigurationParams", request.get("params"))
+            result = [
+                {"pythonPath": sys.executable}
+                if item.get("section") == "python"
+                else None
+                for item in params["items"]
+            ]
+        self._send({"jsonrpc": "2.0", "id": request.get("id", 0), "result": result})
+
+    def _publish(self, params: _PublishDiagnosticsParams) -> None:
+        if params["uri"] not in self.versions:
+            return  # closed, so its diagnostics are no longer being checked
+        path = relative_path(unquote(urlparse(params["uri"]).path))
+        diagnostics = [
+            Diagnostic(
+                path,
+                d["range"]["start"]["line"] + 1,
+                d["range"]["start"]["character"] + 1,
+                _SEVERITIES[severity],
+                d["message"],
+                str(d.get("code", "")),
+                self.checker,
+            )
+            for d in params["diagnostics"]
+            if (severity := d.get("severity", 1)) in _SEVERITIES
+        ]
+        self.reporter.report(self.checker, path, diagnostics)
+
+    def update(
+        self, tests: Sequence[str], affected: Sequence[str], changes: _Changes
+    ) -> None:
+        del tests  # only the affected ones are opened
+        opened = {(ROOT / test).as_uri() for test in affected}
+        for uri in self.versions.keys() - opened:
+            del self.versions[uri]
+            self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+
+        for path, change in changes.items():
+            uri = path.as_uri()
+            if uri not in self.versions:
+                self._notify(
+                    "workspace/didChangeWatchedFiles",
+                    {"changes": [{"uri": uri, "type": change}]},
+                )
+            elif change == _DELETED:
+                del self.versions[uri]
+                self._notify("textDocument/didClose", {"textDocument": {"uri": uri}})
+            else:
+                self.versions[uri] += 1
+                self._notify(
+                    "textDocument/didChange",
+                    {
+                        "textDocument": {"uri": uri, "version": self.versions[uri]},
+                        "contentChanges": [{"text": path.read_text(encoding="utf-8")}],
+                    },
+                )
+
+        for test in affected:
+            path = ROOT / test
+            if (uri := path.as_uri()) not in self.versions:
+                self.versions[uri] = 1
+                document = {
+                    "uri": uri,
+                    "languageId": "python",
+                    "version": 1,
+                    "text": path.read_text(encoding="utf-8"),
+                }
+                self._notify("textDocument/didOpen", {"textDocument": document})
+
+    def stop(self) -> None:
+        self._send({"jsonrpc": "2.0", "id": next(self.ids), "method": "shutdown"})
+        self._notify("exit", None)
+        try:
+            _ = self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+
+def start(checker: Checker, tests: Sequence[str], reporter: Reporter) -> Session:
+    match checker:
+        case "mypy":
+            return Dmypy(tests, reporter)
+        case "basedpyright":
+            cmd = ["basedpyright-langserver", "--stdio"]
+            return LanguageServer(checker, cmd, reporter)
+        case "pyrefly":
+            return LanguageServer(checker, ["pyrefly", "lsp"], reporter)
+
+
+def watch(
+    sessions: Sequence[Session],
+    paths: Sequence[Path],
+    dependencies: Dependencies,
+    *,
+    interval: float,
+) -> None:
+    """Poll for changes, and pass them on to the sessions, until interrupted."""
+    tests = test_files(paths)
+    watched = {*tests}
+    mtimes = _mtimes([STUBS_PATH, TESTS_DIR])
+    while True:
+        time.sleep(interval)
+        new_mtimes = _mtimes([STUBS_PATH, TESTS_DIR])
+        if not (changed := changes(mtimes, new_mtimes)):
+            continue
+        mtimes = new_mtimes
+
+        dependencies.update(changed)
+        if any(change != _CHANGED for change in changed.values()):
+            tests = test_files(paths)
+            watched = {*tests}
+        affected = sorted(dependencies.affected(changed) & watched)
+
+        names = ", ".join(sorted(relative_path(path) for path in changed))
+        print(
+            f"{names} changed, re-checking {len(affected)} type-tests", file=sys.stderr
+        )
+        for session in sessions:
+            session.update(tests, affected, changed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Re-check the type-tests that are affected by each change"
+    )
+    _ = parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[TESTS_DIR],
+        help="Test files or directories to check (default: tests/)",
+    )
+    _ = parser.add_argument(
+        "--checker",
+        action="append",
+        choices=CHECKERS,
+        help="Type-checker to run (default: all)",
+    )
+    _ = parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.5,
+        help="Number of seconds between polling for changes",
+    )
+    args = parser.parse_args()
+
+    checkers: list[Checker] = args.checker or list(CHECKERS)
+    _WORK_DIR.mkdir(parents=True, exist_ok=True)
+    dependencies = Dependencies()
+    reporter = Reporter()
+
+    tests = test_files(args.paths)
+    sessions: list[Session] = []
+    try:
+        sessions.extend(start(checker, tests, reporter) for checker in checkers)
+        print("watching for changes, press Ctrl+C to stop", file=sys.stderr)
+        watch(sessions, args.paths, dependencies, interval=args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for session in sessions:
+            session.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
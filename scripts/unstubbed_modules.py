@@ -1,8 +1,17 @@
 """
 Prints the names of all SciPy modules that are not stubbed.
+
+The modules are discovered from the RECORD of the installed scipy, without importing
+them: each Python source file or extension module (for this interpreter) in it that is
+present on disk, is a module. With `--import`, the modules are instead discovered by
+importing them in a pool of worker processes, which should result in the same report.
+Imports that take longer than `--timeout` are reported, and are assumed to work.
 """
 
 # ruff: file-ignore[print, assert]
+import argparse
+import multiprocessing
+import os
 import sys
 import warnings
 from collections.abc import Iterator, Sequence
@@ -15,7 +24,7 @@ STUBS_PATH = Path(__file__).parent.parent / "scipy-stubs"
 
 _MODULE_SUFFIXES = *SOURCE_SUFFIXES, *EXTENSION_SUFFIXES
 _INIT_LEAVES = frozenset(f"__init__{s}" for s in _MODULE_SUFFIXES)
-_TYPECHECK_ONLY_STUBS = ("._typing",)
+TYPECHECK_ONLY_STUBS = ("._typing",)
 
 IGNORED = (
     # bundled
@@ -65,22 +74,52 @@ def _path_to_module(parts: tuple[str, ...]) -> str | None:
     return ".".join(name_parts) or None
 
 
-def _candidates() -> Iterator[str]:
+def record_modules(*, installed: bool = False) -> Iterator[str]:
     files = distribution("scipy").files
     assert files is not None, "scipy was installed without a RECORD"
-    return (name for f in files if (name := _path_to_module(f.parts)) is not None)
+    return (
+        name
+        for f in files
+        if (name := _path_to_module(f.parts)) is not None
+        and (not installed or Path(f.locate()).is_file())
+    )
 
 
 def modules() -> Iterator[str]:
-    for name in dict.fromkeys(_candidates()):
-        try:
-            _ = import_module(name)
-        except ModuleNotFoundError as e:
-            if e.name == name:
-                continue
-        except ImportError:
-            pass
-        yield name
+    """The modules in the RECORD that are installed, without importing them."""
+    return iter(dict.fromkeys(record_modules(installed=True)))
+
+
+def _is_importable(name: str) -> bool:
+    try:
+        _ = import_module(name)
+    except ModuleNotFoundError as e:
+        if e.name == name:
+            return False
+    except ImportError:
+        pass
+    return True
+
+
+def _init_worker() -> None:
+    warnings.simplefilter("ignore", DeprecationWarning)
+    warnings.simplefilter("ignore", FutureWarning)
+
+
+def modules_imported(*, jobs: int, timeout: float) -> Iterator[str]:
+    """The modules in the RECORD that can be imported, using a pool of processes."""
+    names = list(dict.fromkeys(record_modules()))
+    with multiprocessing.Pool(jobs, initializer=_init_worker) as pool:
+        tasks = [(name, pool.apply_async(_is_importable, (name,))) for name in names]
+        for name, task in tasks:
+            try:
+                importable = task.get(timeout)
+            except multiprocessing.TimeoutError:
+                print(f"timed out importing {name}", file=sys.stderr)
+                importable = True
+
+            if importable:
+                yield name
 
 
 def _walk_stubs(stubs_dir: Path, pkg_name: str) -> Iterator[str]:
@@ -117,11 +156,34 @@ def module_to_path(mod: str) -> Path | None:
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Print the names of the scipy modules that are not stubbed"
+    )
+    _ = parser.add_argument(
+        "--import",
+        dest="verify_imports",
+        action="store_true",
+        help="Discover the modules by importing them, instead of from the RECORD",
+    )
+    _ = parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes that import the modules (default: all cores)",
+    )
+    _ = parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60,
+        help="Seconds to wait for each import (default: 60)",
+    )
+    args = parser.parse_args()
+
     _check_stubs_path()
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", DeprecationWarning)
-        warnings.simplefilter("ignore", FutureWarning)
+    if args.verify_imports:
+        module_list = sorted(modules_imported(jobs=args.jobs, timeout=args.timeout))
+    else:
         module_list = sorted(modules())
 
     unused_ignores = set(IGNORED)
@@ -150,7 +212,7 @@ def main() -> int:
     orphans = sorted(
         name
         for name in set(stubs()) - set(module_list)
-        if not name.endswith(_TYPECHECK_ONLY_STUBS)
+        if not name.endswith(TYPECHECK_ONLY_STUBS)
     )
     for orphan in orphans:
         print(f"orphaned stub: {orphan}", file=sys.stderr)
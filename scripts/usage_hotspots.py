@@ -0,0 +1,248 @@
+"""
+Rank the public scipy functions and classes by how often they are called in real-world
+code, times how much it costs the type-checkers to resolve a call to them.
+
+The usage is read from the JSON report of `scipy_usage.py`, whose `calls` are weighted
+by their `references` (or `projects`, with `--weight=projects`). Each call is resolved
+to the stub that defines it, by following the re-exports of the stubs, and a call to a
+class is resolved to its `__new__` and `__init__`, and that of an instance such as
+`scipy.stats.norm` or a ufunc to the methods of its class.
+
+By default, the cost of a call is estimated by the number of overloads of the callee.
+With `--profile`, it is instead the measured time per call from the JSON output of
+`overload_count.py --profile`, in which case only the profiled functions are ranked.
+The top of the ranking are the stubs whose optimization saves the most checker time
+across the ecosystem.
+"""
+
+# ruff: file-ignore[print]
+
+import argparse
+import json
+import sys
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Final, Literal, TypedDict
+
+from import_graph import existing_module
+from stub_metrics import CACHE_PATH, ModuleFacts, empty_cache, stub_facts
+from test_coverage import load_cache, save_cache
+
+type Weight = Literal["references", "projects"]
+
+WEIGHTS: Final[tuple[Weight, ...]] = "references", "projects"
+
+_CONSTRUCTORS: Final = "__new__", "__init__"
+
+
+class _Usage(TypedDict):
+    references: int
+    projects: int
+
+
+class _Profile(TypedDict):
+    overloads: int
+    calls: int
+    total: float
+
+
+class Hotspot(TypedDict):
+    name: str
+    """The public name that the call refers to."""
+    target: str
+    """The fully qualified name of the function or class in the stubs."""
+    references: int
+    projects: int
+    overloads: int
+    cost: float
+    """The (estimated or measured) cost of a single call."""
+    score: float
+
+
+class StubIndex:
+    """Looks up what the public names of `scipy` refer to in the stubs."""
+
+    def __init__(self, facts: Mapping[str, ModuleFacts]) -> None:
+        super().__init__()
+        self.facts = facts
+        self.classes = {
+            name: bases for f in facts.values() for name, bases in f["classes"].items()
+        }
+        self.functions = {
+            name: function
+            for f in facts.values()
+            for name, function in f["functions"].items()
+        }
+
+    def resolve(self, name: str) -> str | None:
+        """The function or class in the stubs that `name` refers to, if any.
+
+        A module attribute refers to the `__call__` method of its type, and a method of
+        a class to the one that it inherits, if it isn't defined by the class itself.
+        """
+        seen: set[str] = set()
+        while name not in seen:
+            seen.add(name)
+            module = existing_module(name, self.facts)
+            if module is None or module == name:
+                return None
+
+            facts = self.facts[module]
+            head, _, rest = name.removeprefix(f"{module}.").partition(".")
+            local = f"{module}.{head}"
+            if (target := facts["aliases"].get(head, local)) != local:
+                name = f"{target}.{rest}" if rest else target
+            elif head in facts["variables"]:
+                name = f"{facts['variables'][head]}.{rest or '__call__'}"
+            elif local in self.classes:
+                return self.member(local, rest) if rest else local
+            elif local in self.functions:
+                return None if rest else local
+            else:
+                return self._resolve_star(facts["star_imports"], head, rest)
+        return None
+
+    def _resolve_star(self, modules: Iterable[str], head: str, rest: str) -> str | None:
+        for module in modules:
+            name = f"{module}.{head}.{rest}" if rest else f"{module}.{head}"
+            if target := self.resolve(name):
+                return target
+        return None
+
+    def mro(self, cls: str) -> list[str]:
+        """The class and its (resolved) `scipy` base classes, depth-first."""
+        order: list[str] = []
+        stack = [cls]
+        while stack:
+            name = stack.pop()
+            if name not in order and name in self.classes:
+                order.append(name)
+                bases = (self.resolve(base) for base in self.classes[name])
+                stack.extend(reversed([base for base in bases if base]))
+        return order
+
+    def member(self, cls: str, attribute: str) -> str | None:
+        """The method that the class defines or inherits, if any."""
+        for name in self.mro(cls):
+            if (method := f"{name}.{attribute}") in self.functions:
+                return method
+        return None
+
+    def overloads(self, target: str) -> int:
+        """The overloads of a function, or of the constructors of a class."""
+        if target in self.functions:
+            return self.functions[target]["overloads"]
+
+        constructors = (self.member(target, method) for method in _CONSTRUCTORS)
+        return max(sum(self.functions[c]["overloads"] for c in constructors if c), 1)
+
+
+def _is_public(name: str) -> bool:
+    return not any(part.startswith("_") for part in name.split("."))
+
+
+def _by_score(hotspot: Hotspot, /) -> tuple[float, str]:
+    return -hotspot["score"], hotspot["name"]
+
+
+def hotspots(
+    calls: Mapping[str, _Usage],
+    index: StubIndex,
+    profile: Mapping[str, _Profile] | None = None,
+    *,
+    weight: Weight = "references",
+) -> tuple[list[Hotspot], list[str]]:
+    """The ranked hotspots, and the names of the calls that couldn't be resolved."""
+    ranked: list[Hotspot] = []
+    unresolved: list[str] = []
+    for name, usage in calls.items():
+        if not _is_public(name):
+            continue
+        if (target := index.resolve(name)) is None:
+            unresolved.append(name)
+            continue
+
+        overloads = index.overloads(target)
+        if profile is None:
+            cost = float(overloads)
+        elif timings := profile.get(target):
+            cost = timings["total"] / (timings["overloads"] * timings["calls"])
+        else:
+            continue
+
+        ranked.append({
+            "name": name,
+            "target": target,
+            "references": usage["references"],
+            "projects": usage["projects"],
+            "overloads": overloads,
+            "cost": cost,
+            "score": usage[weight] * cost,
+        })
+
+    ranked.sort(key=_by_score)
+    return ranked, unresolved
+
+
+def _print_table(ranked: list[Hotspot], *, measured: bool) -> None:
+    unit = "ms/call" if measured else "overloads"
+    print(f"{'':>4} {'name':<48} {'refs':>6} {'projects':>8} {unit:>10} {'score':>10}")
+    for i, hotspot in enumerate(ranked, 1):
+        cost = hotspot["cost"] * 1000 if measured else hotspot["cost"]
+        score = hotspot["score"] * 1000 if measured else hotspot["score"]
+        print(
+            f"{i:>3}. {hotspot['name']:<48} {hotspot['references']:>6} "
+            f"{hotspot['projects']:>8} {cost:>10.3g} {score:>10.4g}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rank the scipy stubs by their real-world type-checking cost"
+    )
+    _ = parser.add_argument(
+        "usage", type=Path, help="JSON report of scripts/scipy_usage.py"
+    )
+    _ = parser.add_argument(
+        "--profile",
+        type=Path,
+        help="JSON output of `scripts/overload_count.py --profile` with the measured "
+        "costs (default: estimate the costs by the number of overloads)",
+    )
+    _ = parser.add_argument(
+        "--weight",
+        choices=WEIGHTS,
+        default="references",
+        help="Weigh the calls by their number of references or projects",
+    )
+    _ = parser.add_argument(
+        "--top", type=int, default=25, help="Number of hotspots to print"
+    )
+    _ = parser.add_argument("--output", type=Path, help="Output JSON file path")
+    args = parser.parse_args()
+
+    usage = json.loads(args.usage.read_text(encoding="utf-8"))
+    profile: dict[str, _Profile] | None = None
+    if args.profile is not None:
+        profile = json.loads(args.profile.read_text(encoding="utf-8"))
+
+    cache = load_cache(CACHE_PATH, empty_cache())
+    facts = stub_facts(cache)
+    save_cache(CACHE_PATH, cache)
+
+    index = StubIndex(facts)
+    ranked, unresolved = hotspots(usage["calls"], index, profile, weight=args.weight)
+    _print_table(ranked[: args.top], measured=profile is not None)
+    print(
+        f"\n{len(ranked)} ranked, {len(unresolved)} calls not found in the stubs",
+        file=sys.stderr,
+    )
+
+    if args.output is not None:
+        _ = args.output.write_text(json.dumps(ranked, indent=2), encoding="utf-8")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
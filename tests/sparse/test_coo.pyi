@@ -4,7 +4,7 @@ import numpy as np
 import optype.numpy as onp
 
 from ._types import coo_arr, coo_vec
-from scipy.sparse import coo_array, coo_matrix
+from scipy.sparse import coo_array, coo_matrix, csr_array
 
 ###
 
@@ -52,6 +52,12 @@ assert_type(coo_arr.count_nonzero(axis=0), onp.Array1D[np.intp])
 # pyrefly: ignore [no-matching-overload]
 coo_vec.count_nonzero(axis=0)  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
 
+_coo_3d: coo_array[np.float64, onp.AtLeast3D]
+assert_type(coo_vec < 1, csr_array[np.bool, tuple[int]])
+assert_type(coo_arr < coo_arr, csr_array[np.bool, tuple[int, int]])
+assert_type(_coo_3d < 1, coo_array[np.bool, onp.AtLeast3D])
+assert_type(_coo_3d >= _coo_3d, coo_array[np.bool, onp.AtLeast3D])
+
 ###
 # coo_matrix
 
@@ -6,7 +6,22 @@ import numpy as np
 import optype.numpy.compat as npc
 
 import scipy.sparse as sparse
-from ._types import ScalarType, any_arr, any_mat, coo_arr, coo_mat, csc_mat, csr_arr, csr_mat, dia_mat, dok_mat, lil_mat
+from ._types import (
+    ScalarType,
+    any_arr,
+    any_mat,
+    coo_arr,
+    coo_mat,
+    coo_vec,
+    csc_arr,
+    csc_mat,
+    csr_arr,
+    csr_mat,
+    dia_mat,
+    dok_mat,
+    lil_arr,
+    lil_mat,
+)
 
 i64_1d: np.ndarray[tuple[int], np.dtype[np.int64]]
 i64_2d: np.ndarray[tuple[int, int], np.dtype[np.int64]]
@@ -155,6 +170,16 @@ assert_type(csr_arr.multiply(3), sparse.csr_array[ScalarType, tuple[int, int]])
 assert_type(csr_arr.multiply(csr_arr), sparse.csr_array[ScalarType, tuple[int, int]])
 assert_type(csr_arr.multiply(dense_2d), sparse.coo_array[ScalarType, tuple[int, int]])
 
+# comparisons
+assert_type(csr_mat < csr_mat, sparse.csr_matrix[np.bool])
+assert_type(coo_mat >= 1, sparse.csr_matrix[np.bool])
+assert_type(csc_mat <= csc_mat, sparse.csc_matrix[np.bool])
+assert_type(_csr_mat_bool > 0, sparse.csr_matrix[np.bool])
+assert_type(csr_arr < csr_arr, sparse.csr_array[np.bool, tuple[int, int]])
+assert_type(lil_arr >= 1, sparse.csr_array[np.bool, tuple[int, int]])
+assert_type(coo_vec <= 1, sparse.csr_array[np.bool, tuple[int]])
+assert_type(csc_arr > csc_arr, sparse.csc_array[np.bool])
+
 # TODO(jorenham): test other arithmetic operations for all formats
 
 ###
@@ -1,4 +1,5 @@
-from typing import Literal as L, assert_type
+from collections.abc import Callable
+from typing import Literal as L, Never, assert_type
 
 import numpy as np
 import optype.numpy as onp
@@ -43,7 +44,7 @@ _c16_nd: _Complex128ND
 
 # _UFunc
 assert_type(sp.cbrt.__name__, L["cbrt"])
-assert_type(sp.cbrt.identity, L[0])
+assert_type(sp.entr.identity, L[0])
 assert_type(sp.geterr()["singular"], _ErrOption)
 assert_type(sp.geterr()["underflow"], _ErrOption)
 assert_type(sp.seterr()["overflow"], _ErrOption)
@@ -146,7 +147,10 @@ sp.logit.at(_c16, _i)  # type:ignore[arg-type]  # pyright: ignore[reportArgument
 # _UFunc11c - TODO: wofz
 # _UFunc11fc - TODO: erf
 
-# _UFunc12 - TODO
+# _UFunc12
+assert_type(sp.sici.nout, L[2])
+assert_subtype[Callable[..., Never]](sp.sici.at)
+assert_subtype[Callable[..., Never]](sp.sici.outer)
 # _UFunc14 - TODO
 
 ###
@@ -158,6 +162,10 @@ assert_type(sp.beta(1, _f4), np.float32)
 assert_type(sp.beta(_f8, 2.0), np.float64)
 assert_type(sp.beta(2.0, _f8), np.float64)
 
+# _UFunc21ld
+assert_type(sp.eval_hermite.types, list[L["ld->d"]])
+assert_subtype[Callable[..., Never]](sp.eval_hermite.reduce)
+
 # _UFunc21fc1
 assert_type(sp.jv(2.0, _f4), np.float32)
 assert_type(sp.jv(_f4, 2.0), np.float32 | np.float64)
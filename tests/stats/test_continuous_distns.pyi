@@ -297,3 +297,36 @@ assert_type(norm.fit(_f64_nd, floc=_f32), tuple[np.float32, np.float64])
 assert_type(norm.fit(_f64_nd, fscale=1), tuple[np.float64, int])
 assert_type(norm.fit(_f64_nd, fscale=2.0), tuple[np.float64, float])
 assert_type(gamma.fit(_f64_nd, optimizer=_optimizer), tuple[float | np.float64, ...])
+
+###
+# without shape parameters
+
+# .pdf
+assert_type(norm.pdf(0.5), float | np.float64)
+assert_type(norm.pdf(0.5, 1.0, 2.0), float | np.float64)
+assert_type(norm.pdf(0.5, _f64_nd), onp.ArrayND[np.float64])
+assert_type(norm.pdf(0.5, scale=_f64_nd), onp.ArrayND[np.float64])
+assert_type(norm.pdf(0.5, 1.0, _f64_nd), onp.ArrayND[np.float64])
+assert_type(norm.pdf(_f64_nd), onp.ArrayND[np.float64])
+
+# .entropy
+assert_type(norm.entropy(), float | np.float64)
+assert_type(norm.entropy(1.0, 2.0), float | np.float64)
+assert_type(norm.entropy(_f64_nd), onp.ArrayND[np.float64])
+assert_type(norm.entropy(scale=_f64_nd), onp.ArrayND[np.float64])
+assert_type(norm.entropy(1.0, _f64_nd), onp.ArrayND[np.float64])
+
+# .stats
+assert_type(norm.stats(), tuple[float | np.float64, float | np.float64])
+assert_type(norm.stats(1.0, 2.0), tuple[float | np.float64, float | np.float64])
+assert_type(norm.stats(moments="m"), float | np.float64)
+assert_type(norm.stats(1.0, 2.0, "mvs"), tuple[float | np.float64, float | np.float64, float | np.float64])
+assert_type(norm.stats(moments="mvsk"), tuple[float | np.float64, float | np.float64, float | np.float64, float | np.float64])
+assert_type(norm.stats(_f64_nd), tuple[onp.ArrayND[np.float64], onp.ArrayND[np.float64]])
+assert_type(norm.stats(_f64_nd, moments="m"), onp.ArrayND[np.float64])
+assert_type(norm.stats(scale=_f64_nd, moments="k"), onp.ArrayND[np.float64])
+assert_type(norm.stats(1.0, _f64_nd, "mvs"), tuple[onp.ArrayND[np.float64], onp.ArrayND[np.float64], onp.ArrayND[np.float64]])
+assert_type(
+    norm.stats(_f64_nd, 2.0, "mvsk"),
+    tuple[onp.ArrayND[np.float64], onp.ArrayND[np.float64], onp.ArrayND[np.float64], onp.ArrayND[np.float64]],
+)